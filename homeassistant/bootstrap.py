@@ -15,14 +15,26 @@ from typing import TYPE_CHECKING, Any
 import voluptuous as vol
 import yarl
 
-from homeassistant import config as conf_util, config_entries, core, loader
+from homeassistant import (
+    config as conf_util,
+    config_entries,
+    core,
+    loader,
+    requirements,
+)
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers import (
+    area_registry,
+    config_per_platform,
+    device_registry,
+    entity_registry,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
+    BASE_PLATFORMS,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
@@ -438,6 +450,57 @@ async def async_setup_multi_components(
         )
 
 
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    config: dict[str, Any],
+    integrations: dict[str, loader.Integration],
+    stages: list[set[str]],
+) -> None:
+    """Import the integrations of the setup stages ahead of their setup.
+
+    The integrations and the platforms in their config are imported one
+    at a time in the executor, in the order they will be set up, so the
+    imports overlap with the setup of the integrations before them.
+    Errors are left to be reported by the setup.
+    """
+    for domains in stages:
+        stage_integrations = [
+            integrations[domain] for domain in domains if domain in integrations
+        ]
+        # An integration has more dependencies than each of its dependencies
+        stage_integrations.sort(
+            key=lambda integration: len(integration.all_dependencies)
+        )
+        for integration in stage_integrations:
+            await _async_preimport(hass, integration.domain, None)
+
+        for domain in domains & BASE_PLATFORMS:
+            for platform_name, _ in config_per_platform(config, domain):
+                if isinstance(platform_name, str):
+                    await _async_preimport(hass, platform_name, domain)
+
+
+async def _async_preimport(
+    hass: core.HomeAssistant, domain: str, platform_name: str | None
+) -> None:
+    """Import an integration or one of its platforms in the executor."""
+    try:
+        # The requirements have to be installed before the import
+        integration = await requirements.async_get_integration_with_requirements(
+            hass, domain
+        )
+        if platform_name is None:
+            await hass.async_add_executor_job(integration.get_component)
+        else:
+            await hass.async_add_executor_job(integration.get_platform, platform_name)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug(
+            "Unable to import %s ahead of its setup",
+            domain if platform_name is None else f"{domain}.{platform_name}",
+            exc_info=True,
+        )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -529,6 +592,12 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
+    preimport_task = asyncio.create_task(
+        _async_preimport_integrations(
+            hass, config, integration_cache, [stage_1_domains, stage_2_domains]
+        )
+    )
+
     # Load the registries
     await asyncio.gather(
         device_registry.async_load(hass),
@@ -561,6 +630,7 @@ async def _async_set_up_integrations(
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
     watch_task.cancel()
+    preimport_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATONS, {})
 
     _LOGGER.debug(
@@ -225,7 +225,11 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        try:
+            states_json = ", ".join(state.as_dict_json() for state in states)
+        except (ValueError, TypeError):
+            return self.json(states)
+        return self.json_text(f"[{states_json}]")
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -243,7 +247,10 @@ class APIEntityStateView(HomeAssistantView):
 
         state = request.app["hass"].states.get(entity_id)
         if state:
-            return self.json(state)
+            try:
+                return self.json_text(state.as_dict_json())
+            except (ValueError, TypeError):
+                return self.json(state)
         return self.json_message("Entity not found.", HTTP_NOT_FOUND)
 
     async def post(self, request, entity_id):
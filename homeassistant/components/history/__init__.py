@@ -15,6 +15,8 @@ from homeassistant.components import websocket_api
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder import history, models as history_models
 from homeassistant.components.recorder.statistics import (
+    PERIOD_HOUR,
+    PERIODS,
     list_statistic_ids,
     statistics_during_period,
 )
@@ -42,6 +44,8 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "history"
 CONF_ORDER = "use_include_order"
 
+HISTORY_FILTERS = "history_filters"
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -101,6 +105,7 @@ async def async_setup(hass, config):
 
     use_include_order = conf.get(CONF_ORDER)
 
+    hass.data[HISTORY_FILTERS] = filters
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:poll-box"
@@ -109,6 +114,9 @@ async def async_setup(hass, config):
         ws_get_statistics_during_period
     )
     hass.components.websocket_api.async_register_command(ws_get_list_statistic_ids)
+    hass.components.websocket_api.async_register_command(
+        ws_get_columnar_history_during_period
+    )
 
     return True
 
@@ -124,6 +132,7 @@ class LazyState(history_models.LazyState):
         vol.Required("start_time"): str,
         vol.Optional("end_time"): str,
         vol.Optional("statistic_ids"): [str],
+        vol.Optional("period", default=PERIOD_HOUR): vol.In(PERIODS),
     }
 )
 @websocket_api.async_response
@@ -157,6 +166,7 @@ async def ws_get_statistics_during_period(
         start_time,
         end_time,
         msg.get("statistic_ids"),
+        msg["period"],
     )
     connection.send_result(msg["id"], statistics)
 
@@ -180,6 +190,74 @@ async def ws_get_list_statistic_ids(
     connection.send_result(msg["id"], statistic_ids)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/columnar_history_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [cv.entity_id],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_get_columnar_history_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Handle columnar history websocket command."""
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+
+    start_time = dt_util.parse_datetime(start_time_str)
+    if start_time:
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str:
+        end_time = dt_util.parse_datetime(end_time_str)
+        if end_time:
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    result = await hass.async_add_executor_job(
+        _columnar_history_during_period,
+        hass,
+        start_time,
+        end_time,
+        msg.get("entity_ids"),
+        msg["include_start_time_state"],
+        msg["significant_changes_only"],
+    )
+    connection.send_result(msg["id"], result)
+
+
+def _columnar_history_during_period(
+    hass,
+    start_time,
+    end_time,
+    entity_ids,
+    include_start_time_state,
+    significant_changes_only,
+):
+    """Fetch the columnar history in a JSON friendly format."""
+    columns = history.get_significant_states_columnar(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None if entity_ids else hass.data[HISTORY_FILTERS],
+        include_start_time_state,
+        significant_changes_only,
+    )
+    return {entity_id: column.as_dict() for entity_id, column in columns.items()}
+
+
 class HistoryPeriodView(HomeAssistantView):
     """Handle history period requests."""
 
@@ -234,6 +312,15 @@ class HistoryPeriodView(HomeAssistantView):
 
         minimal_response = "minimal_response" in request.query
 
+        max_points = None
+        if max_points_str := request.query.get("max_points"):
+            try:
+                max_points = int(max_points_str)
+            except ValueError:
+                max_points = 0
+            if max_points < history.MIN_DOWNSAMPLE_POINTS:
+                return self.json_message("Invalid max_points", HTTP_BAD_REQUEST)
+
         hass = request.app["hass"]
 
         if (
@@ -254,6 +341,7 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                max_points,
             ),
         )
 
@@ -266,6 +354,7 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        max_points,
     ):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
@@ -282,6 +371,7 @@ class HistoryPeriodView(HomeAssistantView):
                     include_start_time_state,
                     significant_changes_only,
                     minimal_response,
+                    max_points,
                 )
             )
 
@@ -53,12 +53,21 @@ class HomeAssistantView:
     ) -> web.Response:
         """Return a JSON response."""
         try:
-            msg = json.dumps(result, cls=JSONEncoder, allow_nan=False).encode("UTF-8")
+            msg = json.dumps(result, cls=JSONEncoder, allow_nan=False)
         except (ValueError, TypeError) as err:
             _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, result)
             raise HTTPInternalServerError from err
+        return HomeAssistantView.json_text(msg, status_code, headers)
+
+    @staticmethod
+    def json_text(
+        text: str,
+        status_code: int = HTTP_OK,
+        headers: LooseHeaders | None = None,
+    ) -> web.Response:
+        """Return a JSON response from already serialized JSON."""
         response = web.Response(
-            body=msg,
+            body=text.encode("UTF-8"),
             content_type=CONTENT_TYPE_JSON,
             status=status_code,
             headers=headers,
@@ -0,0 +1,113 @@
+"""Match MQTT topics against the topic filters of subscriptions."""
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+from homeassistant.util.lru import LRU
+
+_T = TypeVar("_T")
+
+# The number of topics to cache the matching subscriptions for
+MATCH_CACHE_SIZE = 2048
+
+
+class _Node(Generic[_T]):
+    """A level of a topic filter."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _Node[_T]] = {}
+        self.items: list[_T] = []
+
+
+class TopicMatcher(Generic[_T]):
+    """Match topics against topic filters with the + and # wildcards.
+
+    The topic filters are stored in a trie with a node per level, so
+    matching a topic only visits the levels of the topic instead of
+    every topic filter. The matches of recently received topics are
+    cached until a topic filter is added or removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the matcher."""
+        self._root: _Node[_T] = _Node()
+        self._cache: LRU[str, list[_T]] = LRU(MATCH_CACHE_SIZE)
+
+    def add(self, topic_filter: str, item: _T) -> None:
+        """Add an item for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _Node()
+            node = child
+        node.items.append(item)
+        self._cache.clear()
+
+    def remove(self, topic_filter: str, item: _T) -> None:
+        """Remove an item of a topic filter.
+
+        Raises ValueError if the item was not added for the topic filter.
+        """
+        path = [self._root]
+        levels = topic_filter.split("/")
+        for level in levels:
+            if (child := path[-1].children.get(level)) is None:
+                raise ValueError(f"{item} is not added for {topic_filter}")
+            path.append(child)
+        path[-1].items.remove(item)
+        self._cache.clear()
+
+        # Prune the levels that no longer lead to any item
+        for level, node, parent in zip(
+            reversed(levels), reversed(path), reversed(path[:-1])
+        ):
+            if node.items or node.children:
+                break
+            del parent.children[level]
+
+    def has_topic_filter(self, topic_filter: str) -> bool:
+        """Return if there are items for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.items)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the items of the topic filters that match a topic."""
+        if (matches := self._cache.get(topic)) is not None:
+            return matches
+
+        matches = []
+        levels = topic.split("/")
+        # Wildcards do not match topics starting with $ on the first level
+        wildcards_at_root = not topic.startswith("$")
+        self._match(self._root, levels, 0, wildcards_at_root, matches)
+        self._cache[topic] = matches
+        return matches
+
+    def _match(
+        self,
+        node: _Node[_T],
+        levels: list[str],
+        index: int,
+        wildcards_at_root: bool,
+        matches: list[_T],
+    ) -> None:
+        """Collect the items of the topic filters below node that match."""
+        children = node.children
+        wildcards = wildcards_at_root or index > 0
+        if index == len(levels):
+            matches.extend(node.items)
+        else:
+            if (child := children.get(levels[index])) is not None:
+                self._match(child, levels, index + 1, wildcards_at_root, matches)
+            if wildcards and (child := children.get("+")) is not None:
+                self._match(child, levels, index + 1, wildcards_at_root, matches)
+        # A # also matches the parent level
+        if wildcards and (child := children.get("#")) is not None:
+            matches.extend(child.items)
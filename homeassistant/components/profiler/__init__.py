@@ -14,14 +14,16 @@ import objgraph
 from pyprof2calltree import convert
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .const import DATA_MONITOR, DOMAIN
+from .monitor import JobMonitor
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -30,7 +32,8 @@ SERVICE_STOP_LOG_OBJECTS = "stop_log_objects"
 SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
-
+SERVICE_START_LOOP_MONITOR = "start_loop_monitor"
+SERVICE_STOP_LOOP_MONITOR = "stop_loop_monitor"
 
 SERVICES = (
     SERVICE_START,
@@ -40,8 +43,12 @@ SERVICES = (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_START_LOOP_MONITOR,
+    SERVICE_STOP_LOOP_MONITOR,
 )
 
+PLATFORMS = ["sensor"]
+
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 CONF_SECONDS = "seconds"
@@ -54,7 +61,8 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Profiler from a config entry."""
     lock = asyncio.Lock()
-    domain_data = hass.data[DOMAIN] = {}
+    monitor = JobMonitor(hass)
+    domain_data = hass.data[DOMAIN] = {DATA_MONITOR: monitor}
 
     async def _async_run_profile(call: ServiceCall):
         async with lock:
@@ -128,6 +136,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             arepr.max_string = original_maxstring
             arepr.max_other = original_maxother
 
+    @callback
+    def _async_start_loop_monitor(call: ServiceCall) -> None:
+        monitor.async_start()
+
+    @callback
+    def _async_stop_loop_monitor(call: ServiceCall) -> None:
+        monitor.async_stop()
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -191,19 +207,63 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_LOOP_MONITOR,
+        _async_start_loop_monitor,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_LOOP_MONITOR,
+        _async_stop_loop_monitor,
+    )
+
+    websocket_api.async_register_command(hass, websocket_loop_monitor)
+
+    hass.config_entries.async_setup_platforms(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.data[DOMAIN][DATA_MONITOR].async_stop()
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/loop_monitor",
+        vol.Optional("limit", default=10): vol.All(int, vol.Range(min=1)),
+    }
+)
+@callback
+def websocket_loop_monitor(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Return the loop lag and the jobs that took the longest."""
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.const.ERR_NOT_FOUND, "Profiler is not set up"
+        )
+        return
+    monitor: JobMonitor = hass.data[DOMAIN][DATA_MONITOR]
+    connection.send_result(msg["id"], monitor.async_report(msg["limit"]))
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     start_time = int(time.time() * 1000000)
     hass.components.persistent_notification.async_create(
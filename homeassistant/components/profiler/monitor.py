@@ -0,0 +1,252 @@
+"""Measure the time jobs take and the lag of the event loop."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Coroutine
+from contextlib import suppress
+from dataclasses import dataclass
+import functools
+from time import monotonic
+from typing import Any, Callable
+
+from homeassistant.core import HassJobType, HomeAssistant, callback
+
+# How often the lag of the event loop is sampled in seconds
+LAG_INTERVAL = 1.0
+# The number of lag samples the percentiles are computed over
+LAG_SAMPLES = 600
+
+KIND_CALLBACK = "callback"
+KIND_COROUTINE = "coroutine"
+KIND_EXECUTOR = "executor"
+
+_JOB_KINDS = {
+    HassJobType.Callback: KIND_CALLBACK,
+    HassJobType.Coroutinefunction: KIND_COROUTINE,
+    HassJobType.Executor: KIND_EXECUTOR,
+}
+
+
+@dataclass
+class JobStats:
+    """Statistics of the jobs of an owner and kind."""
+
+    owner: str
+    kind: str
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        """Add a job that took elapsed seconds."""
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics with the times in milliseconds."""
+        return {
+            "owner": self.owner,
+            "kind": self.kind,
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class _TimedCoroutine(Coroutine):
+    """Coroutine that measures the time each of its steps takes."""
+
+    __slots__ = ("_coro", "_stats", "_started")
+
+    def __init__(self, coro: Coroutine, stats: JobStats) -> None:
+        """Initialize the timed coroutine."""
+        self._coro = coro
+        self._stats = stats
+        self._started = False
+
+    def _record(self, start: float) -> None:
+        """Record a step of the coroutine."""
+        elapsed = monotonic() - start
+        if not self._started:
+            # Count the coroutine once, but all the time of its steps
+            self._started = True
+            self._stats.add(elapsed)
+            return
+        self._stats.total += elapsed
+        self._stats.max = max(self._stats.max, elapsed)
+
+    def send(self, value: Any) -> Any:
+        """Run a step of the coroutine."""
+        start = monotonic()
+        try:
+            return self._coro.send(value)
+        finally:
+            self._record(start)
+
+    def throw(self, *args: Any) -> Any:
+        """Throw an exception into the coroutine."""
+        start = monotonic()
+        try:
+            return self._coro.throw(*args)
+        finally:
+            self._record(start)
+
+    def close(self) -> None:
+        """Close the coroutine."""
+        self._coro.close()
+
+    def __await__(self) -> Any:
+        """Return the coroutine as an iterator."""
+        return self._coro.__await__()
+
+
+@functools.lru_cache(maxsize=None)
+def _module_owner(module: str) -> str:
+    """Return the integration a module belongs to, or the module."""
+    parts = module.split(".")
+    if len(parts) > 2 and parts[:2] == ["homeassistant", "components"]:
+        return parts[2]
+    if len(parts) > 1 and parts[0] == "custom_components":
+        return parts[1]
+    return module
+
+
+def job_owner(target: Callable) -> str:
+    """Return the integration that owns the target of a job."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    module = getattr(target, "__module__", None) or type(target).__module__
+    return _module_owner(module)
+
+
+def _percentile(samples: list[float], percent: int) -> float:
+    """Return a percentile of sorted samples."""
+    return samples[min(len(samples) - 1, len(samples) * percent // 100)]
+
+
+class JobMonitor:
+    """Measure the time the jobs of each integration take and the loop lag.
+
+    Callbacks and the steps of coroutines run in the event loop, so their
+    time is time the loop was blocked. Executor jobs run in threads, their
+    time is reported for completeness. Nothing is measured until started.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the job monitor."""
+        self.hass = hass
+        self._stats: dict[tuple[str, str], JobStats] = {}
+        self._lag: deque[float] = deque(maxlen=LAG_SAMPLES)
+        self._lag_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return if the monitor is measuring."""
+        return self._lag_handle is not None
+
+    @callback
+    def async_start(self) -> None:
+        """Start measuring."""
+        if self.running:
+            return
+        self._stats.clear()
+        self._lag.clear()
+        self.hass.async_set_job_monitor(self._wrap_job)
+        self._async_schedule_lag_sample()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop measuring."""
+        if self._lag_handle is None:
+            return
+        self._lag_handle.cancel()
+        self._lag_handle = None
+        self.hass.async_set_job_monitor(None)
+
+    @callback
+    def _async_schedule_lag_sample(self) -> None:
+        """Schedule the next sample of the loop lag."""
+        when = self.hass.loop.time() + LAG_INTERVAL
+        self._lag_handle = self.hass.loop.call_at(when, self._async_sample_lag, when)
+
+    @callback
+    def _async_sample_lag(self, scheduled: float) -> None:
+        """Record how late the sample runs."""
+        self._lag.append(max(self.hass.loop.time() - scheduled, 0.0))
+        self._async_schedule_lag_sample()
+
+    def _job_stats(self, target: Callable, kind: str) -> JobStats:
+        """Return the statistics for the owner of a target."""
+        owner = job_owner(target)
+        stats = self._stats.get((owner, kind))
+        if stats is None:
+            stats = self._stats[(owner, kind)] = JobStats(owner, kind)
+        return stats
+
+    def _wrap_job(self, job_type: HassJobType, target: Callable) -> Callable:
+        """Return the target wrapped to measure it."""
+        stats = self._job_stats(target, _JOB_KINDS[job_type])
+
+        if job_type == HassJobType.Coroutinefunction:
+
+            def _timed_coroutine(*args: Any) -> Coroutine:
+                return _TimedCoroutine(target(*args), stats)
+
+            return _timed_coroutine
+
+        if job_type == HassJobType.Callback:
+
+            def _timed_callback(*args: Any) -> Any:
+                start = monotonic()
+                try:
+                    return target(*args)
+                finally:
+                    stats.add(monotonic() - start)
+
+            return _timed_callback
+
+        loop = self.hass.loop
+
+        def _timed_executor(*args: Any) -> Any:
+            start = monotonic()
+            try:
+                return target(*args)
+            finally:
+                # Record in the loop so the statistics are not shared with
+                # threads, the loop may be closed by the time a job finishes
+                with suppress(RuntimeError):
+                    loop.call_soon_threadsafe(stats.add, monotonic() - start)
+
+        return _timed_executor
+
+    @callback
+    def async_loop_lag(self) -> dict[str, float] | None:
+        """Return the percentiles of the loop lag in milliseconds."""
+        if not self._lag:
+            return None
+        samples = sorted(self._lag)
+        return {
+            "p50": round(_percentile(samples, 50) * 1000, 3),
+            "p90": round(_percentile(samples, 90) * 1000, 3),
+            "p99": round(_percentile(samples, 99) * 1000, 3),
+            "max": round(samples[-1] * 1000, 3),
+        }
+
+    @callback
+    def async_top_jobs(self, limit: int = 10) -> list[JobStats]:
+        """Return the statistics of the owners whose jobs took the longest."""
+        return sorted(
+            self._stats.values(), key=lambda stats: stats.total, reverse=True
+        )[:limit]
+
+    @callback
+    def async_report(self, limit: int = 10) -> dict[str, Any]:
+        """Return a report of the measurements."""
+        return {
+            "running": self.running,
+            "loop_lag_ms": self.async_loop_lag(),
+            "jobs": [stats.as_dict() for stats in self.async_top_jobs(limit)],
+        }
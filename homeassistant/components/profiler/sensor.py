@@ -0,0 +1,76 @@
+"""Sensors of the event loop measured by the profiler."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.components.sensor import STATE_CLASS_MEASUREMENT, SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import TIME_MILLISECONDS
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DATA_MONITOR, DOMAIN
+from .monitor import KIND_EXECUTOR, JobMonitor
+
+SCAN_INTERVAL = timedelta(seconds=10)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the profiler sensors."""
+    monitor: JobMonitor = hass.data[DOMAIN][DATA_MONITOR]
+    async_add_entities(
+        [LoopLagSensor(monitor, entry), SlowestJobsSensor(monitor, entry)]
+    )
+
+
+class LoopLagSensor(SensorEntity):
+    """The 99th percentile of how late the event loop runs scheduled calls."""
+
+    _attr_icon = "mdi:timer-sand"
+    _attr_name = "Event loop lag"
+    _attr_native_unit_of_measurement = TIME_MILLISECONDS
+    _attr_state_class = STATE_CLASS_MEASUREMENT
+
+    def __init__(self, monitor: JobMonitor, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        self._monitor = monitor
+        self._attr_unique_id = f"{entry.entry_id}_loop_lag"
+
+    async def async_update(self) -> None:
+        """Update the lag from the monitor."""
+        lag = self._monitor.async_loop_lag() if self._monitor.running else None
+        self._attr_available = lag is not None
+        if lag is None:
+            return
+        self._attr_native_value = lag["p99"]
+        self._attr_extra_state_attributes = lag
+
+
+class SlowestJobsSensor(SensorEntity):
+    """The integration whose jobs blocked the event loop the longest."""
+
+    _attr_icon = "mdi:speedometer-slow"
+    _attr_name = "Slowest integration"
+
+    def __init__(self, monitor: JobMonitor, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        self._monitor = monitor
+        self._attr_unique_id = f"{entry.entry_id}_slowest_integration"
+
+    async def async_update(self) -> None:
+        """Update the slowest jobs from the monitor."""
+        # Executor jobs run in threads, they do not block the loop
+        jobs = [
+            stats
+            for stats in self._monitor.async_top_jobs(limit=20)
+            if stats.kind != KIND_EXECUTOR
+        ][:10]
+        self._attr_available = self._monitor.running and bool(jobs)
+        if not self._attr_available:
+            return
+        self._attr_native_value = jobs[0].owner
+        self._attr_extra_state_attributes = {
+            "jobs": [stats.as_dict() for stats in jobs]
+        }
@@ -26,11 +26,11 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
 )
 from homeassistant.core import CoreState, HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER,
@@ -48,13 +48,22 @@ from homeassistant.helpers.service import async_extract_entity_ids
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
-
-from . import history, migration, purge, statistics
-from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
+from homeassistant.util.lru import LRU
+
+from . import history, migration, purge, statistics, websocket_api
+from .bulk import BULK_WRITE_DIALECTS, BulkWriter
+from .const import (
+    CONF_DB_INTEGRITY_CHECK,
+    DATA_INSTANCE,
+    DOMAIN,
+    SIGNAL_PURGE_PROGRESS,
+    SQLITE_URL_PREFIX,
+)
 from .models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -63,6 +72,7 @@ from .pool import RecorderPool
 from .util import (
     dburl_to_path,
     end_incomplete_runs,
+    find_shared_attributes_id,
     move_away_broken_database,
     perodic_db_cleanups,
     session_scope,
@@ -117,14 +127,20 @@ KEEPALIVE_TIME = 30
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The number of shared attributes ids we keep in memory
+# to avoid looking them up in the database
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 4096
+
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
+CONF_CONTINUOUS_PURGE = "continuous_purge"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_WRITES = "bulk_writes"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -145,6 +161,7 @@ CONFIG_SCHEMA = vol.Schema(
             FILTER_SCHEMA.extend(
                 {
                     vol.Optional(CONF_AUTO_PURGE, default=True): cv.boolean,
+                    vol.Optional(CONF_CONTINUOUS_PURGE, default=False): cv.boolean,
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
@@ -162,6 +179,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_BULK_WRITES, default=False): cv.boolean,
                 }
             ),
         )
@@ -251,6 +269,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     instance = hass.data[DATA_INSTANCE] = Recorder(
         hass=hass,
         auto_purge=auto_purge,
+        continuous_purge=conf[CONF_CONTINUOUS_PURGE],
         keep_days=keep_days,
         commit_interval=commit_interval,
         uri=db_url,
@@ -258,12 +277,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        bulk_writes=conf[CONF_BULK_WRITES],
     )
     instance.async_initialize()
     instance.start()
     _async_register_services(hass, instance)
     history.async_setup(hass)
     statistics.async_setup(hass)
+    websocket_api.async_setup(hass)
     await async_process_integration_platforms(hass, DOMAIN, _process_recorder_platform)
 
     return await instance.async_db_ready
@@ -350,6 +371,14 @@ class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+class CommitTask:
+    """An object to insert into the recorder queue to commit the event session."""
+
+
+class KeepAliveTask:
+    """An object to insert into the recorder queue to keep the database connection alive."""
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -357,6 +386,7 @@ class Recorder(threading.Thread):
         self,
         hass: HomeAssistant,
         auto_purge: bool,
+        continuous_purge: bool,
         keep_days: int,
         commit_interval: int,
         uri: str,
@@ -364,13 +394,16 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        bulk_writes: bool,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
 
         self.hass = hass
         self.auto_purge = auto_purge
+        self.continuous_purge = continuous_purge
         self.keep_days = keep_days
+        self.purge_progress = purge.PurgeProgress()
         self.commit_interval = commit_interval
         self.queue: Any = queue.SimpleQueue()
         self.recording_start = dt_util.utcnow()
@@ -386,11 +419,14 @@ class Recorder(threading.Thread):
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
 
-        self._timechanges_seen = 0
         self._commits_without_expire = 0
-        self._keepalive_count = 0
         self._old_states: dict[str, States] = {}
         self._pending_expunge: list[States] = []
+        self._state_attributes_ids: LRU[str, int] = LRU(STATE_ATTRIBUTES_ID_CACHE_SIZE)
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
+        self.bulk_writer: BulkWriter | None = (
+            BulkWriter(self._state_attributes_ids) if bulk_writes else None
+        )
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -398,6 +434,8 @@ class Recorder(threading.Thread):
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._queue_watcher = None
+        self._commit_timer = None
+        self._keep_alive_timer = None
 
         self.enabled = True
 
@@ -414,6 +452,27 @@ class Recorder(threading.Thread):
         self._queue_watcher = async_track_time_interval(
             self.hass, self._async_check_queue, timedelta(minutes=10)
         )
+        # Schedule the commits and keep alives instead of counting
+        # time changed events so the recorder only wakes up when due
+        if self.commit_interval:
+            self._commit_timer = async_track_time_interval(
+                self.hass,
+                self._async_commit,
+                timedelta(seconds=self.commit_interval),
+            )
+        self._keep_alive_timer = async_track_time_interval(
+            self.hass, self._async_keep_alive, timedelta(seconds=KEEPALIVE_TIME)
+        )
+
+    @callback
+    def _async_commit(self, now):
+        """Queue a commit of the event session."""
+        self.queue.put(CommitTask())
+
+    @callback
+    def _async_keep_alive(self, now):
+        """Queue a keep alive of the database connection."""
+        self.queue.put(KeepAliveTask())
 
     @callback
     def _async_check_queue(self, *_):
@@ -433,10 +492,16 @@ class Recorder(threading.Thread):
 
     @callback
     def _async_stop_queue_watcher_and_event_listener(self):
-        """Stop watching the queue and listening for events."""
+        """Stop watching the queue, listening for events and the timers."""
         if self._queue_watcher:
             self._queue_watcher()
             self._queue_watcher = None
+        if self._commit_timer:
+            self._commit_timer()
+            self._commit_timer = None
+        if self._keep_alive_timer:
+            self._keep_alive_timer()
+            self._keep_alive_timer = None
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
@@ -554,7 +619,7 @@ class Recorder(threading.Thread):
     @callback
     def async_nightly_tasks(self, now):
         """Trigger the purge."""
-        if self.auto_purge:
+        if self.auto_purge and not self.continuous_purge:
             # Purge will schedule the perodic cleanups
             # after it completes to ensure it does not happen
             # until after the database is vacuumed
@@ -564,8 +629,17 @@ class Recorder(threading.Thread):
             self.queue.put(PerodicCleanupTask())
 
     @callback
-    def async_hourly_statistics(self, now):
-        """Trigger the hourly statistics run."""
+    def async_periodic_purge(self, now):
+        """Trigger a purge of the data that expired since the last purge."""
+        if self.purge_progress.running:
+            # The last purge is still removing data in batches
+            return
+        purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
+        self.queue.put(PurgeTask(purge_before, repack=False, apply_filter=False))
+
+    @callback
+    def async_periodic_statistics(self, now):
+        """Trigger the statistics run of the last 5 minute period."""
         start = statistics.get_start_time()
         self.queue.put(StatisticsTask(start))
 
@@ -581,9 +655,18 @@ class Recorder(threading.Thread):
             self.hass, self.async_nightly_tasks, hour=4, minute=12, second=0
         )
 
-        # Compile hourly statistics every hour at *:12
+        if self.auto_purge and self.continuous_purge:
+            # Purge what expired every hour instead of everything at night
+            async_track_time_change(
+                self.hass, self.async_periodic_purge, minute=12, second=0
+            )
+
+        # Compile short term statistics every 5 minutes
         async_track_time_change(
-            self.hass, self.async_hourly_statistics, minute=12, second=0
+            self.hass,
+            self.async_periodic_statistics,
+            minute=range(0, 60, 5),
+            second=10,
         )
 
     def run(self):
@@ -725,17 +808,41 @@ class Recorder(threading.Thread):
 
     def _run_purge(self, purge_before, repack, apply_filter):
         """Purge the database."""
-        if purge.purge_old_data(self, purge_before, repack, apply_filter):
+        progress = self.purge_progress
+        if not progress.running:
+            progress.start(purge_before)
+        elif progress.purge_before != purge_before:
+            # Another purge is running, start this one after it finished
+            self.queue.put(PurgeTask(purge_before, repack, apply_filter))
+            return
+
+        finished = False
+        failed = True
+        try:
+            # Commit the pending states first so the purge
+            # does not remove shared attributes they reference
+            self._commit_event_session_or_retry()
+            finished = purge.purge_old_data(self, purge_before, repack, apply_filter)
+            failed = False
+        finally:
+            # A failed purge is not retried, end it so the next one can start
+            progress.failed = failed
+            if finished or failed:
+                progress.finished = dt_util.utcnow()
+            dispatcher_send(self.hass, SIGNAL_PURGE_PROGRESS, progress.as_dict())
+        if finished:
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
             perodic_db_cleanups(self)
             return
-        # Schedule a new purge task if this one didn't finish
+        # Schedule a new purge task if this one didn't finish, behind the
+        # events queued meanwhile so the batches interleave with the writes
         self.queue.put(PurgeTask(purge_before, repack, apply_filter))
 
     def _run_purge_entities(self, entity_filter):
         """Purge entities from the database."""
+        self._commit_event_session_or_retry()
         if purge.purge_entity_data(self, entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
@@ -748,6 +855,12 @@ class Recorder(threading.Thread):
         # Schedule a new statistics task if this one didn't finish
         self.queue.put(StatisticsTask(start))
 
+    def evict_state_attributes_ids(self, attributes_ids: set[int]) -> None:
+        """Forget shared attributes that have been purged."""
+        for shared_attrs, attributes_id in list(self._state_attributes_ids.items()):
+            if attributes_id in attributes_ids:
+                del self._state_attributes_ids[shared_attrs]
+
     def _process_one_event(self, event):
         """Process one event."""
         if isinstance(event, PurgeTask):
@@ -765,21 +878,24 @@ class Recorder(threading.Thread):
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
-        if event.event_type == EVENT_TIME_CHANGED:
-            self._keepalive_count += 1
-            if self._keepalive_count >= KEEPALIVE_TIME:
-                self._keepalive_count = 0
-                self._send_keep_alive()
-            if self.commit_interval:
-                self._timechanges_seen += 1
-                if self._timechanges_seen >= self.commit_interval:
-                    self._timechanges_seen = 0
-                    self._commit_event_session_or_retry()
+        if isinstance(event, CommitTask):
+            self._commit_event_session_or_retry()
+            return
+        if isinstance(event, KeepAliveTask):
+            self._send_keep_alive()
             return
 
         if not self.enabled:
             return
 
+        if self.bulk_writer is not None:
+            self.bulk_writer.add_event(event, self.event_session)
+            # Commit right away if there is no commit interval
+            # or too many rows are waiting for the next one
+            if not self.commit_interval or self.bulk_writer.full:
+                self._commit_event_session_or_retry()
+            return
+
         try:
             if event.event_type == EVENT_STATE_CHANGED:
                 dbevent = Events.from_event(event, event_data="{}")
@@ -793,7 +909,8 @@ class Recorder(threading.Thread):
 
         if event.event_type == EVENT_STATE_CHANGED:
             try:
-                dbstate = States.from_event(event)
+                shared_attrs = StateAttributes.shared_attrs_from_event(event)
+                dbstate = States(**States.row_from_event(event))
                 has_new_state = event.data.get("new_state")
                 if dbstate.entity_id in self._old_states:
                     old_state = self._old_states.pop(dbstate.entity_id)
@@ -805,6 +922,7 @@ class Recorder(threading.Thread):
                     dbstate.state = None
                 dbstate.event = dbevent
                 dbstate.created = event.time_fired
+                self._set_state_attributes(dbstate, shared_attrs)
                 self.event_session.add(dbstate)
                 if has_new_state:
                     self._old_states[dbstate.entity_id] = dbstate
@@ -820,6 +938,28 @@ class Recorder(threading.Thread):
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _set_state_attributes(self, dbstate: States, shared_attrs: str) -> None:
+        """Link a state to its shared attributes, adding them if they are new."""
+        if attributes_id := self._state_attributes_ids.get(shared_attrs):
+            dbstate.attributes_id = attributes_id
+            return
+        if pending_attributes := self._pending_state_attributes.get(shared_attrs):
+            dbstate.state_attributes = pending_attributes
+            return
+        # Avoid flushing the pending states when looking up the attributes
+        with self.event_session.no_autoflush:
+            attributes_id = find_shared_attributes_id(self.event_session, shared_attrs)
+        if attributes_id:
+            self._state_attributes_ids[shared_attrs] = attributes_id
+            dbstate.attributes_id = attributes_id
+            return
+        dbstate_attributes = StateAttributes(
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+            shared_attrs=shared_attrs,
+        )
+        dbstate.state_attributes = dbstate_attributes
+        self._pending_state_attributes[shared_attrs] = dbstate_attributes
+
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -832,7 +972,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self.event_session.new
+            and not self.event_session.dirty
+            and not (self.bulk_writer and self.bulk_writer.pending)
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -853,6 +997,10 @@ class Recorder(threading.Thread):
                 time.sleep(self.db_retry_wait)
 
     def _commit_event_session(self):
+        if self.bulk_writer is not None:
+            self.bulk_writer.commit(self.event_session)
+            return
+
         self._commits_without_expire += 1
 
         if self._pending_expunge:
@@ -865,6 +1013,11 @@ class Recorder(threading.Thread):
             self._pending_expunge = []
         self.event_session.commit()
 
+        # The attributes now have an id we can reference
+        for shared_attrs, dbstate_attributes in self._pending_state_attributes.items():
+            self._state_attributes_ids[shared_attrs] = dbstate_attributes.attributes_id
+        self._pending_state_attributes = {}
+
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
         # do it after EXPIRE_AFTER_COMMITS commits
@@ -883,6 +1036,10 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._state_attributes_ids.clear()
+        self._pending_state_attributes = {}
+        if self.bulk_writer is not None:
+            self.bulk_writer.reset()
 
         if not self.event_session:
             return
@@ -904,6 +1061,8 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        if self.bulk_writer is not None:
+            self.bulk_writer.load_last_ids(self.event_session)
 
     def _send_keep_alive(self):
         """Send a keep alive to keep the db connection open."""
@@ -959,6 +1118,16 @@ class Recorder(threading.Thread):
 
         self.engine = create_engine(self.db_url, **kwargs)
 
+        if (
+            self.bulk_writer is not None
+            and self.engine.dialect.name not in BULK_WRITE_DIALECTS
+        ):
+            _LOGGER.warning(
+                "Bulk writes are not supported with %s, falling back to regular writes",
+                self.engine.dialect.name,
+            )
+            self.bulk_writer = None
+
         sqlalchemy_event.listen(self.engine, "connect", setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
@@ -994,20 +1163,22 @@ class Recorder(threading.Thread):
     def _schedule_compile_missing_statistics(self, session: Session) -> None:
         """Add tasks for missing statistics runs."""
         now = dt_util.utcnow()
-        last_hour = now.replace(minute=0, second=0, microsecond=0)
+        period_size = timedelta(minutes=5)
+        last_period_minutes = now.minute - now.minute % 5
+        last_period = now.replace(minute=last_period_minutes, second=0, microsecond=0)
         start = now - timedelta(days=self.keep_days)
         start = start.replace(minute=0, second=0, microsecond=0)
 
         # Find the newest statistics run, if any
         if last_run := session.query(func.max(StatisticsRuns.start)).scalar():
-            start = max(start, process_timestamp(last_run) + timedelta(hours=1))
+            start = max(start, process_timestamp(last_run) + period_size)
 
         # Add tasks
-        while start < last_hour:
-            end = start + timedelta(hours=1)
+        while start < last_period:
+            end = start + period_size
             _LOGGER.debug("Compiling missing statistics for %s-%s", start, end)
             self.queue.put(StatisticsTask(start))
-            start = start + timedelta(hours=1)
+            start = end
 
     def _end_session(self):
         """End the recorder session."""
@@ -0,0 +1,205 @@
+"""Batched multi-row writes of events and states for the recorder thread."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterable
+
+from sqlalchemy import func, text
+from sqlalchemy.orm.session import Session
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event
+from homeassistant.util.lru import LRU
+
+from .models import (
+    TABLE_EVENTS,
+    TABLE_STATE_ATTRIBUTES,
+    TABLE_STATES,
+    Events,
+    StateAttributes,
+    States,
+)
+from .util import find_shared_attributes_id
+
+_LOGGER = logging.getLogger(__name__)
+
+# Dialects where we can safely insert explicit primary keys
+# into the events, states and state attributes tables
+BULK_WRITE_DIALECTS = ("sqlite", "mysql", "postgresql")
+
+# Commit before the commit interval once this many events are
+# waiting so the memory used between two commits stays bounded.
+MAX_PENDING_EVENTS = 5000
+
+
+class BulkWriter:
+    """Accumulate event and state rows and write them with executemany.
+
+    The recorder is the only writer of the events, states and state
+    attributes tables, so primary keys are allocated in memory, continuing
+    from the highest id in the database. This allows a state row to
+    reference its event, its attributes and its previous state without
+    a round trip to the database for every row.
+    """
+
+    def __init__(self, state_attributes_ids: LRU[str, int]) -> None:
+        """Initialize the bulk writer."""
+        self._state_attributes_ids = state_attributes_ids
+        self._events: list[dict[str, Any]] = []
+        self._states: list[dict[str, Any]] = []
+        self._state_attributes: list[dict[str, Any]] = []
+        self._pending_attributes_ids: dict[str, int] = {}
+        self._last_event_id = 0
+        self._last_state_id = 0
+        self._last_attributes_id = 0
+        self._last_state_ids: dict[str, int] = {}
+
+    @property
+    def pending(self) -> bool:
+        """Return if there are rows that have not been committed."""
+        return bool(self._events)
+
+    def load_last_ids(self, session: Session) -> None:
+        """Reset the writer and continue from the highest ids in the database."""
+        self.reset()
+        self._last_event_id = session.query(func.max(Events.event_id)).scalar() or 0
+        self._last_state_id = session.query(func.max(States.state_id)).scalar() or 0
+        self._last_attributes_id = (
+            session.query(func.max(StateAttributes.attributes_id)).scalar() or 0
+        )
+
+    def reset(self) -> None:
+        """Drop the pending rows and the last state of each entity."""
+        self._events = []
+        self._states = []
+        self._state_attributes = []
+        self._pending_attributes_ids = {}
+        self._last_state_ids = {}
+
+    def add_event(self, event: Event, session: Session) -> None:
+        """Add the rows for an event, and its state if it is a state change."""
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                event_row = Events.row_from_event(event, event_data="{}")
+            else:
+                event_row = Events.row_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+
+        self._last_event_id += 1
+        event_row["event_id"] = self._last_event_id
+        event_row["created"] = event.time_fired
+        self._events.append(event_row)
+
+        if event.event_type != EVENT_STATE_CHANGED:
+            return
+
+        try:
+            state_row = States.row_from_event(event)
+            shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s",
+                event.data.get("new_state"),
+            )
+            return
+
+        entity_id = state_row["entity_id"]
+        self._last_state_id += 1
+        state_row["state_id"] = self._last_state_id
+        state_row["event_id"] = self._last_event_id
+        state_row["created"] = event.time_fired
+        state_row["old_state_id"] = self._last_state_ids.pop(entity_id, None)
+        state_row["attributes_id"] = self._attributes_id(session, shared_attrs)
+        if event.data.get("new_state"):
+            self._last_state_ids[entity_id] = self._last_state_id
+        else:
+            state_row["state"] = None
+        self._states.append(state_row)
+
+    def _attributes_id(self, session: Session, shared_attrs: str) -> int:
+        """Return the id of the shared attributes, adding a row if they are new."""
+        if attributes_id := self._state_attributes_ids.get(shared_attrs):
+            return attributes_id
+        if attributes_id := self._pending_attributes_ids.get(shared_attrs):
+            return attributes_id
+        if attributes_id := find_shared_attributes_id(session, shared_attrs):
+            self._state_attributes_ids[shared_attrs] = attributes_id
+            return attributes_id
+
+        self._last_attributes_id += 1
+        self._state_attributes.append(
+            {
+                "attributes_id": self._last_attributes_id,
+                "hash": StateAttributes.hash_shared_attrs(shared_attrs),
+                "shared_attrs": shared_attrs,
+            }
+        )
+        self._pending_attributes_ids[shared_attrs] = self._last_attributes_id
+        return self._last_attributes_id
+
+    @property
+    def full(self) -> bool:
+        """Return if the rows should be committed before the commit interval."""
+        return len(self._events) >= MAX_PENDING_EVENTS
+
+    def commit(self, session: Session) -> None:
+        """Write the pending rows and commit the session.
+
+        If the commit fails the transaction is rolled back and the rows are
+        kept so they are written again on the next attempt.
+        """
+        try:
+            self._write(session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        self._events = []
+        self._states = []
+        self._state_attributes = []
+        for shared_attrs, attributes_id in self._pending_attributes_ids.items():
+            self._state_attributes_ids[shared_attrs] = attributes_id
+        self._pending_attributes_ids = {}
+
+    def evict_state_ids(self, state_ids: Iterable[int]) -> None:
+        """Forget states that have been purged so they are not referenced."""
+        purged = set(state_ids)
+        for entity_id, state_id in list(self._last_state_ids.items()):
+            if state_id in purged:
+                del self._last_state_ids[entity_id]
+        for state_row in self._states:
+            if state_row["old_state_id"] in purged:
+                state_row["old_state_id"] = None
+
+    def _write(self, session: Session) -> None:
+        """Insert the pending rows."""
+        if self._events:
+            session.execute(Events.__table__.insert(), self._events)
+        if self._state_attributes:
+            session.execute(StateAttributes.__table__.insert(), self._state_attributes)
+        if self._states:
+            session.execute(States.__table__.insert(), self._states)
+        if session.bind.dialect.name == "postgresql":
+            # Explicit ids do not advance the sequences on PostgreSQL
+            self._sync_sequence(session, TABLE_EVENTS, "event_id", self._last_event_id)
+            self._sync_sequence(session, TABLE_STATES, "state_id", self._last_state_id)
+            self._sync_sequence(
+                session,
+                TABLE_STATE_ATTRIBUTES,
+                "attributes_id",
+                self._last_attributes_id,
+            )
+
+    @staticmethod
+    def _sync_sequence(session: Session, table: str, column: str, value: int) -> None:
+        """Move a PostgreSQL sequence past the ids we allocated."""
+        if not value:
+            return
+        session.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), :value)"
+            ),
+            {"value": value},
+        )
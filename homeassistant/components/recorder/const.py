@@ -13,3 +13,6 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 # We can increase this back to 1000 once most
 # have upgraded their sqlite version
 MAX_ROWS_TO_PURGE = 998
+
+# Signal sent with the progress of a purge after each batch
+SIGNAL_PURGE_PROGRESS = "recorder_purge_progress"
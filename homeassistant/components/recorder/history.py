@@ -1,20 +1,27 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+from array import array
 from collections import defaultdict
+from datetime import datetime
 from itertools import groupby
 import logging
+import math
+import sys
 import time
+from typing import Any
 
 from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import execute, session_scope
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import split_entity_id
 import homeassistant.util.dt as dt_util
 
@@ -48,18 +55,43 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
 
+QUERY_STATES_COLUMNAR = [
+    States.entity_id,
+    States.state,
+    States.last_changed,
+]
+
 HISTORY_BAKERY = "recorder_history_bakery"
 
+# The smallest number of points the downsampling reduces numeric states to
+MIN_DOWNSAMPLE_POINTS = 3
+
+# States that do not prevent an entity from being returned as numeric
+NON_NUMERIC_PLACEHOLDER_STATES = {STATE_UNAVAILABLE, STATE_UNKNOWN, ""}
+
+COLUMNAR_TIMESTAMPS_KEY = "t"
+COLUMNAR_NUMERIC_KEY = "n"
+COLUMNAR_STRINGS_KEY = "s"
+COLUMNAR_INDEXES_KEY = "i"
+
 
 def async_setup(hass):
     """Set up the history hooks."""
     hass.data[HISTORY_BAKERY] = baked.bakery()
 
 
+def _query_states(session):
+    """Query the states joined with their shared attributes."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
     with session_scope(hass=hass) as session:
@@ -76,6 +108,7 @@ def _get_significant_states(
     include_start_time_state=True,
     significant_changes_only=True,
     minimal_response=False,
+    max_points=None,
 ):
     """
     Return states changes during UTC period start_time - end_time.
@@ -83,12 +116,13 @@ def _get_significant_states(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    If max_points is set at most that many states are returned for each
+    entity, including the state at the start time.
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](lambda session: _query_states(session))
 
     if significant_changes_only:
         baked_query += lambda q: q.filter(
@@ -134,15 +168,14 @@ def _get_significant_states(
         filters,
         include_start_time_state,
         minimal_response,
+        max_points,
     )
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](lambda session: _query_states(session))
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -155,7 +188,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -176,13 +211,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](lambda session: _query_states(session))
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -243,7 +278,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -291,9 +326,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](lambda session: _query_states(session))
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -317,6 +350,7 @@ def _sorted_states_to_dict(
     filters=None,
     include_start_time_state=True,
     minimal_response=False,
+    max_points=None,
 ):
     """Convert SQL results into JSON friendly data structure.
 
@@ -358,6 +392,9 @@ def _sorted_states_to_dict(
     for ent_id, group in groupby(states, lambda state: state.entity_id):
         domain = split_entity_id(ent_id)[0]
         ent_results = result[ent_id]
+        if max_points is not None:
+            # The state at the start time counts towards max_points
+            group = iter(_downsample_states(list(group), max_points - len(ent_results)))
         if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
             ent_results.extend(LazyState(db_state) for db_state in group)
 
@@ -397,6 +434,266 @@ def _sorted_states_to_dict(
     return {key: val for key, val in result.items() if val}
 
 
+def _downsample_states(db_states, max_points):
+    """Reduce the states of an entity to at most max_points states.
+
+    The numeric states are downsampled with the Largest-Triangle-Three-Buckets
+    algorithm, which keeps the points that define the visual shape of the
+    graph. States that are not numbers (for example unavailable) are kept,
+    unless there are too many of them. Then they are thinned out evenly.
+    """
+    if len(db_states) <= max_points:
+        return db_states
+
+    indexes = []
+    xs = []
+    ys = []
+    keep = []
+    for index, db_state in enumerate(db_states):
+        try:
+            value = float(db_state.state)
+        except (TypeError, ValueError):
+            keep.append(index)
+            continue
+        if not math.isfinite(value):
+            keep.append(index)
+            continue
+        indexes.append(index)
+        xs.append(_datetime_to_ms(db_state.last_changed))
+        ys.append(value)
+
+    threshold = max(max_points - len(keep), MIN_DOWNSAMPLE_POINTS)
+    if len(indexes) > threshold:
+        indexes = [indexes[point] for point in _lttb(xs, ys, threshold)]
+    if len(keep) + len(indexes) > max_points:
+        keep = _spread_evenly(keep, max_points - len(indexes))
+    keep.extend(indexes)
+    keep.sort()
+    # Only when max_points is less than the minimum to downsample
+    keep = _spread_evenly(keep, max_points)
+    return [db_states[index] for index in keep]
+
+
+def _spread_evenly(indexes, count):
+    """Return count of the indexes spread evenly, with the first and the last."""
+    if len(indexes) <= count:
+        return indexes
+    if count < 2:
+        return indexes[-1:] if count == 1 else []
+    step = (len(indexes) - 1) / (count - 1)
+    return [indexes[round(point * step)] for point in range(count)]
+
+
+def _lttb(xs, ys, threshold):
+    """Return the indexes of the points selected by Largest-Triangle-Three-Buckets.
+
+    The first and the last point are always selected, the points in between
+    are divided into threshold - 2 buckets and from each bucket the point
+    that forms the largest triangle with the previously selected point and
+    the average of the next bucket is selected.
+    """
+    length = len(xs)
+    selected = [0]
+    bucket_size = (length - 2) / (threshold - 2)
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, length)
+        next_count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / next_count
+        avg_y = sum(ys[next_start:next_end]) / next_count
+
+        prev_x = xs[previous]
+        prev_y = ys[previous]
+        max_area = -1.0
+        for point in range(start, end):
+            area = abs(
+                (prev_x - avg_x) * (ys[point] - prev_y)
+                - (prev_x - xs[point]) * (avg_y - prev_y)
+            )
+            if area > max_area:
+                max_area = area
+                previous = point
+        selected.append(previous)
+
+    selected.append(length - 1)
+    return selected
+
+
+class HistoryColumns:
+    """Columnar history of the states of a single entity.
+
+    Timestamps are stored as milliseconds since the epoch in an int64
+    array, and each state as an index into a table of the distinct
+    states. A state string is only converted to a number once,
+    however many rows share it.
+    """
+
+    __slots__ = ("timestamps", "indexes", "strings")
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.timestamps = array("q")
+        self.indexes = array("l")
+        self.strings: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.timestamps)
+
+    def append(self, timestamp: int, state: str | None) -> None:
+        """Add a row, unless it has the same state as the last row.
+
+        Without attributes, a row that only updated the attributes adds
+        nothing to the history.
+        """
+        state = state or ""
+        if (index := self.strings.get(state)) is None:
+            index = self.strings[sys.intern(state)] = len(self.strings)
+        elif self.indexes and self.indexes[-1] == index:
+            return
+        self.timestamps.append(timestamp)
+        self.indexes.append(index)
+
+    def as_dict(self) -> dict[str, list[Any]]:
+        """Return the columns in a compact JSON friendly format.
+
+        Entities where every state is a number (or unknown/unavailable)
+        are returned as a list of numbers with None for missing values,
+        all others as a table of the distinct states and an index per row.
+        """
+        numbers: list[float | None] = []
+        for state in self.strings:
+            try:
+                number: float | None = float(state)
+            except ValueError:
+                if state not in NON_NUMERIC_PLACEHOLDER_STATES:
+                    return {
+                        COLUMNAR_TIMESTAMPS_KEY: self.timestamps.tolist(),
+                        COLUMNAR_STRINGS_KEY: list(self.strings),
+                        COLUMNAR_INDEXES_KEY: self.indexes.tolist(),
+                    }
+                number = None
+            numbers.append(
+                None if number is None or not math.isfinite(number) else number
+            )
+
+        return {
+            COLUMNAR_TIMESTAMPS_KEY: self.timestamps.tolist(),
+            COLUMNAR_NUMERIC_KEY: [numbers[index] for index in self.indexes],
+        }
+
+
+def _datetime_to_ms(value: datetime) -> int:
+    """Convert a database datetime to milliseconds since the epoch."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_util.UTC)
+    return int(value.timestamp() * 1000)
+
+
+def get_significant_states_columnar(hass, *args, **kwargs):
+    """Wrap _get_significant_states_columnar with a sql session."""
+    with session_scope(hass=hass) as session:
+        return _get_significant_states_columnar(hass, session, *args, **kwargs)
+
+
+def _get_significant_states_columnar(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+) -> dict[str, HistoryColumns]:
+    """Return the state changes during a period as columns per entity.
+
+    This returns the same states as get_significant_states with
+    minimal_response, without attributes, for graphing long periods.
+    Like the minimal response, rows with the same state as the row
+    before them are skipped.
+    Rows are streamed from the database straight into the columns
+    without creating a state object for each of them.
+    """
+    timer_start = time.perf_counter()
+
+    baked_query = hass.data[HISTORY_BAKERY](
+        lambda session: session.query(*QUERY_STATES_COLUMNAR)
+    )
+
+    if significant_changes_only:
+        baked_query += lambda q: q.filter(
+            (
+                States.domain.in_(SIGNIFICANT_DOMAINS)
+                | (States.last_changed == States.last_updated)
+            )
+            & (States.last_updated > bindparam("start_time"))
+        )
+    else:
+        baked_query += lambda q: q.filter(States.last_updated > bindparam("start_time"))
+
+    if entity_ids is not None:
+        baked_query += lambda q: q.filter(
+            States.entity_id.in_(bindparam("entity_ids", expanding=True))
+        )
+    else:
+        baked_query += lambda q: q.filter(~States.domain.in_(IGNORE_DOMAINS))
+        if filters:
+            filters.bake(baked_query)
+
+    if end_time is not None:
+        baked_query += lambda q: q.filter(States.last_updated < bindparam("end_time"))
+
+    baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
+
+    result: dict[str, HistoryColumns] = {}
+    if entity_ids is not None:
+        for entity_id in entity_ids:
+            result[entity_id] = HistoryColumns()
+
+    if include_start_time_state:
+        start_time_ms = _datetime_to_ms(start_time)
+        run = recorder.run_information_from_instance(hass, start_time)
+        for state in _get_states_with_session(
+            hass, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            if (columns := result.get(state.entity_id)) is None:
+                columns = result[state.entity_id] = HistoryColumns()
+            columns.append(start_time_ms, state.state)
+
+    # Called in a tight loop so cache the function here
+    datetime_to_ms = _datetime_to_ms
+
+    query = (
+        baked_query(session)
+        .params(start_time=start_time, end_time=end_time, entity_ids=entity_ids)
+        .with_post_criteria(lambda q: q.yield_per(1000))
+    )
+    row_count = 0
+    for entity_id, rows in groupby(query, lambda row: row.entity_id):
+        if (columns := result.get(entity_id)) is None:
+            columns = result[entity_id] = HistoryColumns()
+        for row in rows:
+            columns.append(datetime_to_ms(row.last_changed), row.state)
+            row_count += 1
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug(
+            "get_significant_states_columnar took %fs for %d rows",
+            elapsed,
+            row_count,
+        )
+
+    # Filter out the entities without any states
+    return {entity_id: columns for entity_id, columns in result.items() if columns}
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
@@ -3,7 +3,7 @@ from datetime import timedelta
 import logging
 
 import sqlalchemy
-from sqlalchemy import ForeignKeyConstraint, MetaData, Table, text
+from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text
 from sqlalchemy.exc import (
     InternalError,
     OperationalError,
@@ -19,10 +19,14 @@ from .models import (
     TABLE_STATES,
     Base,
     SchemaChanges,
+    StateAttributes,
     Statistics,
     StatisticsMeta,
     StatisticsRuns,
+    StatisticsShortTerm,
+    process_timestamp,
 )
+from .statistics import get_start_time
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -351,7 +355,7 @@ def _drop_foreign_key_constraints(connection, engine, table, columns):
             )
 
 
-def _apply_update(engine, session, new_version, old_version):
+def _apply_update(engine, session, new_version, old_version):  # noqa: C901
     """Perform operations to bring schema up to date."""
     connection = session.connection()
     if new_version == 1:
@@ -486,6 +490,26 @@ def _apply_update(engine, session, new_version, old_version):
         start = now.replace(minute=0, second=0, microsecond=0)
         start = start - timedelta(hours=1)
         session.add(StatisticsRuns(start=start))
+    elif new_version == 20:
+        # Attributes are now stored once per distinct set in the state attributes
+        # table. Existing states keep their attributes in the states table.
+        if not sqlalchemy.inspect(engine).has_table(StateAttributes.__tablename__):
+            StateAttributes.__table__.create(engine)
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 21:
+        # Statistics are now compiled every 5 minutes into the short term
+        # statistics table, the hourly statistics are compiled from those.
+        if not sqlalchemy.inspect(engine).has_table(StatisticsShortTerm.__tablename__):
+            StatisticsShortTerm.__table__.create(engine)
+        # Block the 5 minute runs of the hour of the last hourly run, or the
+        # hourly statistics of that hour would be compiled again.
+        if last_run := session.query(func.max(StatisticsRuns.start)).scalar():
+            last_run_start = process_timestamp(last_run)
+            fake_start = last_run_start + StatisticsShortTerm.duration
+            while fake_start < last_run_start + Statistics.duration:
+                session.add(StatisticsRuns(start=fake_start))
+                fake_start += StatisticsShortTerm.duration
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -505,10 +529,7 @@ def _inspect_schema_version(engine, session):
     for index in indexes:
         if index["column_names"] == ["time_fired"]:
             # Schema addition from version 1 detected. New DB.
-            now = dt_util.utcnow()
-            start = now.replace(minute=0, second=0, microsecond=0)
-            start = start - timedelta(hours=1)
-            session.add(StatisticsRuns(start=start))
+            session.add(StatisticsRuns(start=get_start_time()))
             session.add(SchemaChanges(schema_version=SCHEMA_VERSION))
             return SCHEMA_VERSION
 
@@ -1,15 +1,27 @@
 """Purge old data helper."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 import logging
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
+from sqlalchemy import func
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
+import homeassistant.util.dt as dt_util
+
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States
+from .models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsRuns,
+    StatisticsShortTerm,
+    process_timestamp,
+)
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -19,6 +31,48 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class PurgeProgress:
+    """Progress of the purge of the data older than purge_before."""
+
+    purge_before: datetime | None = None
+    started: datetime | None = None
+    finished: datetime | None = None
+    failed: bool = False
+    oldest_event: datetime | None = None
+    batches: int = 0
+    events: int = 0
+    states: int = 0
+
+    @property
+    def running(self) -> bool:
+        """Return if the purge has started but not finished."""
+        return self.started is not None and self.finished is None
+
+    def start(self, purge_before: datetime) -> None:
+        """Start the progress of a new purge."""
+        self.purge_before = purge_before
+        self.started = dt_util.utcnow()
+        self.finished = None
+        self.failed = False
+        self.oldest_event = None
+        self.batches = self.events = self.states = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dictionary."""
+        return {
+            "running": self.running,
+            "purge_before": self.purge_before,
+            "started": self.started,
+            "finished": self.finished,
+            "failed": self.failed,
+            "oldest_event": self.oldest_event,
+            "batches": self.batches,
+            "events": self.events,
+            "states": self.states,
+        }
+
+
 @retryable_database_job("purge")
 def purge_old_data(
     instance: Recorder, purge_before: datetime, repack: bool, apply_filter: bool = False
@@ -32,14 +86,21 @@ def purge_old_data(
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
 
+    progress: PurgeProgress = instance.purge_progress
     with session_scope(session=instance.get_session()) as session:  # type: ignore
-        # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-        event_ids = _select_event_ids_to_purge(session, purge_before)
-        state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
+        # Purge a max of MAX_ROWS_TO_PURGE of the oldest events and their states
+        event_ids = _select_event_ids_to_purge(session, purge_before, progress)
+        state_ids, attributes_ids = _select_state_and_attributes_ids_to_purge(
+            session, purge_before, event_ids
+        )
         if state_ids:
-            _purge_state_ids(session, state_ids)
+            _purge_state_ids(instance, session, state_ids)
+            _purge_unused_attributes_ids(instance, session, attributes_ids)
+            progress.states += len(state_ids)
         if event_ids:
             _purge_event_ids(session, event_ids)
+            progress.events += len(event_ids)
+            progress.batches += 1
             # If states or events purging isn't processing the purge_before yet,
             # return false, as we are not done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
@@ -48,40 +109,58 @@ def purge_old_data(
             _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
             return False
         _purge_old_recorder_runs(instance, session, purge_before)
+        if not _purge_short_term_statistics(session, purge_before):
+            _LOGGER.debug("Purging short term statistics hasn't fully completed yet")
+            return False
     if repack:
         repack_database(instance)
     return True
 
 
-def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list[int]:
-    """Return a list of event ids to purge."""
+def _select_event_ids_to_purge(
+    session: Session, purge_before: datetime, progress: PurgeProgress
+) -> list[int]:
+    """Return a list of the oldest event ids to purge.
+
+    The events are selected in the order of the time_fired index so each
+    batch removes the oldest events, and the progress knows how far it got.
+    """
     events = (
-        session.query(Events.event_id)
+        session.query(Events.event_id, Events.time_fired)
         .filter(Events.time_fired < purge_before)
+        .order_by(Events.time_fired)
         .limit(MAX_ROWS_TO_PURGE)
         .all()
     )
     _LOGGER.debug("Selected %s event ids to remove", len(events))
+    if events:
+        progress.oldest_event = process_timestamp(events[0].time_fired)
     return [event.event_id for event in events]
 
 
-def _select_state_ids_to_purge(
+def _select_state_and_attributes_ids_to_purge(
     session: Session, purge_before: datetime, event_ids: list[int]
-) -> list[int]:
-    """Return a list of state ids to purge."""
+) -> tuple[list[int], set[int]]:
+    """Return a list of state ids and a set of attributes ids to purge."""
     if not event_ids:
-        return []
+        return [], set()
     states = (
-        session.query(States.state_id)
+        session.query(States.state_id, States.attributes_id)
         .filter(States.last_updated < purge_before)
         .filter(States.event_id.in_(event_ids))
         .all()
     )
     _LOGGER.debug("Selected %s state ids to remove", len(states))
-    return [state.state_id for state in states]
+    state_ids = [state.state_id for state in states]
+    attributes_ids = {
+        state.attributes_id for state in states if state.attributes_id is not None
+    }
+    return state_ids, attributes_ids
 
 
-def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
+def _purge_state_ids(
+    instance: Recorder, session: Session, state_ids: list[int]
+) -> None:
     """Disconnect states and delete by state id."""
 
     # Update old_state_id to NULL before deleting to ensure
@@ -102,6 +181,36 @@ def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
     )
     _LOGGER.debug("Deleted %s states", deleted_rows)
 
+    # Make sure new states do not reference the deleted states
+    if instance.bulk_writer is not None:
+        instance.bulk_writer.evict_state_ids(state_ids)
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the shared attributes that are no longer referenced by a state."""
+    if not attributes_ids:
+        return
+    still_used = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id)).filter(
+            States.attributes_id.in_(attributes_ids)
+        )
+    }
+    unused_attributes_ids = attributes_ids - still_used
+    if not unused_attributes_ids:
+        return
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_attributes_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Make sure new states do not reference the deleted attributes
+    instance.evict_state_attributes_ids(unused_attributes_ids)
+
 
 def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     """Delete by event id."""
@@ -127,6 +236,41 @@ def _purge_old_recorder_runs(
     _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
 
+def _purge_short_term_statistics(session: Session, purge_before: datetime) -> bool:
+    """Purge the short term statistics and statistics runs before purge_before.
+
+    The hourly statistics are kept. The last statistics run is kept to know
+    where to continue compiling statistics from. Returns False if there are
+    more short term statistics to purge.
+    """
+    statistic_ids = [
+        statistic.id
+        for statistic in session.query(StatisticsShortTerm.id)
+        .filter(StatisticsShortTerm.start < purge_before)
+        .limit(MAX_ROWS_TO_PURGE)
+    ]
+    if statistic_ids:
+        deleted_rows = (
+            session.query(StatisticsShortTerm)
+            .filter(StatisticsShortTerm.id.in_(statistic_ids))
+            .delete(synchronize_session=False)
+        )
+        _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
+        if len(statistic_ids) == MAX_ROWS_TO_PURGE:
+            return False
+
+    # Statistics runs is small, no need to batch run it
+    last_run = session.query(func.max(StatisticsRuns.start)).scalar()
+    deleted_rows = (
+        session.query(StatisticsRuns)
+        .filter(StatisticsRuns.start < purge_before)
+        .filter(StatisticsRuns.start != last_run)
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s statistics_runs", deleted_rows)
+    return True
+
+
 def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     """Remove filtered states and events that shouldn't be in the database."""
     _LOGGER.debug("Cleanup filtered data")
@@ -138,7 +282,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if not instance.entity_filter(entity_id)
     ]
     if len(excluded_entity_ids) > 0:
-        _purge_filtered_states(session, excluded_entity_ids)
+        _purge_filtered_states(instance, session, excluded_entity_ids)
         return False
 
     # Check if excluded event_types are in database
@@ -148,19 +292,22 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if event_type in instance.exclude_t
     ]
     if len(excluded_event_types) > 0:
-        _purge_filtered_events(session, excluded_event_types)
+        _purge_filtered_events(instance, session, excluded_event_types)
         return False
 
     return True
 
 
-def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) -> None:
+def _purge_filtered_states(
+    instance: Recorder, session: Session, excluded_entity_ids: list[str]
+) -> None:
     """Remove filtered states and linked events."""
     state_ids: list[int]
     event_ids: list[int | None]
-    state_ids, event_ids = zip(
+    attributes_ids: list[int | None]
+    state_ids, event_ids, attributes_ids = zip(
         *(
-            session.query(States.state_id, States.event_id)
+            session.query(States.state_id, States.event_id, States.attributes_id)
             .filter(States.entity_id.in_(excluded_entity_ids))
             .limit(MAX_ROWS_TO_PURGE)
             .all()
@@ -170,11 +317,16 @@ def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) ->
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
-    _purge_state_ids(session, state_ids)
+    _purge_state_ids(instance, session, state_ids)
+    _purge_unused_attributes_ids(
+        instance, session, {id_ for id_ in attributes_ids if id_ is not None}
+    )
     _purge_event_ids(session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
 
 
-def _purge_filtered_events(session: Session, excluded_event_types: list[str]) -> None:
+def _purge_filtered_events(
+    instance: Recorder, session: Session, excluded_event_types: list[str]
+) -> None:
     """Remove filtered events and linked states."""
     events: list[Events] = (
         session.query(Events.event_id)
@@ -187,10 +339,16 @@ def _purge_filtered_events(session: Session, excluded_event_types: list[str]) ->
         "Selected %s event_ids to remove that should be filtered", len(event_ids)
     )
     states: list[States] = (
-        session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
+        session.query(States.state_id, States.attributes_id)
+        .filter(States.event_id.in_(event_ids))
+        .all()
     )
     state_ids: list[int] = [state.state_id for state in states]
-    _purge_state_ids(session, state_ids)
+    attributes_ids: set[int] = {
+        state.attributes_id for state in states if state.attributes_id is not None
+    }
+    _purge_state_ids(instance, session, state_ids)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
     _purge_event_ids(session, event_ids)
 
 
@@ -206,7 +364,7 @@ def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool])
         _LOGGER.debug("Purging entity data for %s", selected_entity_ids)
         if len(selected_entity_ids) > 0:
             # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-            _purge_filtered_states(session, selected_entity_ids)
+            _purge_filtered_states(instance, session, selected_entity_ids)
             _LOGGER.debug("Purging entity data hasn't fully completed yet")
             return False
 
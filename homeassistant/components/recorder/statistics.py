@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime
 from itertools import groupby
 import logging
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
-from sqlalchemy import bindparam
+from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
 from sqlalchemy.orm.scoping import scoped_session
 
@@ -31,6 +31,8 @@ from .models import (
     Statistics,
     StatisticsMeta,
     StatisticsRuns,
+    StatisticsShortTerm,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from .util import execute, retryable_database_job, session_scope
@@ -48,6 +50,23 @@ QUERY_STATISTICS = [
     Statistics.sum,
 ]
 
+QUERY_STATISTICS_SHORT_TERM = [
+    StatisticsShortTerm.metadata_id,
+    StatisticsShortTerm.start,
+    StatisticsShortTerm.mean,
+    StatisticsShortTerm.min,
+    StatisticsShortTerm.max,
+    StatisticsShortTerm.state,
+    StatisticsShortTerm.sum,
+]
+
+# The periods statistics can be fetched for, day and month are reduced from hours
+PERIOD_5MINUTE = "5minute"
+PERIOD_HOUR = "hour"
+PERIOD_DAY = "day"
+PERIOD_MONTH = "month"
+PERIODS = (PERIOD_5MINUTE, PERIOD_HOUR, PERIOD_DAY, PERIOD_MONTH)
+
 QUERY_STATISTIC_META = [
     StatisticsMeta.id,
     StatisticsMeta.statistic_id,
@@ -55,6 +74,7 @@ QUERY_STATISTIC_META = [
 ]
 
 STATISTICS_BAKERY = "recorder_statistics_bakery"
+STATISTICS_SHORT_TERM_BAKERY = "recorder_statistics_short_term_bakery"
 STATISTICS_META_BAKERY = "recorder_statistics_bakery"
 
 # Convert pressure and temperature statistics from the native unit used for statistics
@@ -83,6 +103,7 @@ _LOGGER = logging.getLogger(__name__)
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history hooks."""
     hass.data[STATISTICS_BAKERY] = baked.bakery()
+    hass.data[STATISTICS_SHORT_TERM_BAKERY] = baked.bakery()
     hass.data[STATISTICS_META_BAKERY] = baked.bakery()
 
     def entity_id_changed(event: Event) -> None:
@@ -112,10 +133,12 @@ def async_setup(hass: HomeAssistant) -> None:
 
 
 def get_start_time() -> datetime:
-    """Return start time."""
-    last_hour = dt_util.utcnow() - timedelta(hours=1)
-    start = last_hour.replace(minute=0, second=0, microsecond=0)
-    return start
+    """Return the start time of the last completed 5 minute period."""
+    now = dt_util.utcnow()
+    current_period = now.replace(
+        minute=now.minute - now.minute % 5, second=0, microsecond=0
+    )
+    return current_period - StatisticsShortTerm.duration
 
 
 def _get_metadata_ids(
@@ -152,11 +175,66 @@ def _get_or_add_metadata_id(
     return metadata_id[0]
 
 
+def _compile_hourly_statistics(session: scoped_session, start: datetime) -> None:
+    """Compile the hourly statistics of an hour from its short term statistics."""
+    end = start + Statistics.duration
+    hourly_stats: dict[int, dict[str, float]] = defaultdict(dict)
+
+    # The mean, min and max of statistics with a mean are those of the hour
+    query = (
+        session.query(
+            StatisticsShortTerm.metadata_id,
+            func.avg(StatisticsShortTerm.mean),
+            func.min(StatisticsShortTerm.min),
+            func.max(StatisticsShortTerm.max),
+        )
+        .filter(StatisticsShortTerm.start >= start)
+        .filter(StatisticsShortTerm.start < end)
+        .filter(StatisticsShortTerm.mean.isnot(None))
+        .group_by(StatisticsShortTerm.metadata_id)
+    )
+    for metadata_id, _mean, _min, _max in query:
+        hourly_stats[metadata_id].update(mean=_mean, min=_min, max=_max)
+
+    # The state and sum of statistics with a sum are those at the end of the hour
+    most_recent = (
+        session.query(
+            StatisticsShortTerm.metadata_id,
+            func.max(StatisticsShortTerm.start).label("max_start"),
+        )
+        .filter(StatisticsShortTerm.start >= start)
+        .filter(StatisticsShortTerm.start < end)
+        .filter(StatisticsShortTerm.sum.isnot(None))
+        .group_by(StatisticsShortTerm.metadata_id)
+        .subquery()
+    )
+    query = session.query(
+        StatisticsShortTerm.metadata_id,
+        StatisticsShortTerm.state,
+        StatisticsShortTerm.sum,
+    ).join(
+        most_recent,
+        and_(
+            StatisticsShortTerm.metadata_id == most_recent.c.metadata_id,
+            StatisticsShortTerm.start == most_recent.c.max_start,
+        ),
+    )
+    for metadata_id, state, _sum in query:
+        hourly_stats[metadata_id].update(state=state, sum=_sum)
+
+    for metadata_id, stat in hourly_stats.items():
+        session.add(Statistics.from_stats(metadata_id, start, stat))
+
+
 @retryable_database_job("statistics")
 def compile_statistics(instance: Recorder, start: datetime) -> bool:
-    """Compile statistics."""
+    """Compile the short term statistics of a 5 minute period.
+
+    The hourly statistics are compiled from the short term statistics
+    when the last period of an hour has been compiled.
+    """
     start = dt_util.as_utc(start)
-    end = start + timedelta(hours=1)
+    end = start + StatisticsShortTerm.duration
 
     with session_scope(session=instance.get_session()) as session:  # type: ignore
         if session.query(StatisticsRuns).filter_by(start=start).first():
@@ -179,7 +257,14 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
                 metadata_id = _get_or_add_metadata_id(
                     instance.hass, session, entity_id, stat["meta"]
                 )
-                session.add(Statistics.from_stats(metadata_id, start, stat["stat"]))
+                session.add(
+                    StatisticsShortTerm.from_stats(metadata_id, start, stat["stat"])
+                )
+
+        if end.minute == 0:
+            # The last period of the hour, compile the hourly statistics
+            _compile_hourly_statistics(session, end - Statistics.duration)
+
         session.add(StatisticsRuns(start=start))
 
     return True
@@ -274,36 +359,102 @@ def list_statistic_ids(
     ]
 
 
+class _ReducedStatistics(NamedTuple):
+    """Statistics of a period reduced from the statistics of shorter periods."""
+
+    metadata_id: int
+    start: datetime
+    mean: float | None
+    min: float | None
+    max: float | None
+    state: float | None
+    sum: float | None
+
+
+def _day_start(start: datetime) -> datetime:
+    """Return the start of the local day of start."""
+    local = dt_util.as_local(start)
+    return dt_util.as_utc(local.replace(hour=0, minute=0, second=0, microsecond=0))
+
+
+def _month_start(start: datetime) -> datetime:
+    """Return the start of the local month of start."""
+    local = dt_util.as_local(start)
+    return dt_util.as_utc(
+        local.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    )
+
+
+def _reduce_statistics(
+    stats: list, period_start: Callable[[datetime], datetime]
+) -> list[_ReducedStatistics]:
+    """Reduce hourly statistics ordered by metadata_id and start to longer periods."""
+    result = []
+    for metadata_id, group in groupby(stats, lambda stat: stat.metadata_id):  # type: ignore
+        for start, period in groupby(
+            group, lambda stat: period_start(process_timestamp(stat.start))
+        ):
+            rows = list(period)
+            means = [row.mean for row in rows if row.mean is not None]
+            mins = [row.min for row in rows if row.min is not None]
+            maxs = [row.max for row in rows if row.max is not None]
+            result.append(
+                _ReducedStatistics(
+                    metadata_id,
+                    start,
+                    sum(means) / len(means) if means else None,
+                    min(mins) if mins else None,
+                    max(maxs) if maxs else None,
+                    rows[-1].state,
+                    rows[-1].sum,
+                )
+            )
+    return result
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
     end_time: datetime | None = None,
     statistic_ids: list[str] | None = None,
+    period: str = PERIOD_HOUR,
 ) -> dict[str, list[dict[str, str]]]:
-    """Return states changes during UTC period start_time - end_time."""
+    """Return statistics during UTC period start_time - end_time.
+
+    Statistics of 5 minute periods are read from the short term statistics,
+    all other periods from the hourly statistics so they are available for
+    as long as they are kept.
+    """
     metadata = None
     with session_scope(hass=hass) as session:
         metadata = _get_metadata(hass, session, statistic_ids, None)
         if not metadata:
             return {}
 
-        baked_query = hass.data[STATISTICS_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS)
-        )
+        if period == PERIOD_5MINUTE:
+            table: type[Statistics | StatisticsShortTerm] = StatisticsShortTerm
+            baked_query = hass.data[STATISTICS_SHORT_TERM_BAKERY](
+                lambda session: session.query(*QUERY_STATISTICS_SHORT_TERM)
+            )
+        else:
+            table = Statistics
+            baked_query = hass.data[STATISTICS_BAKERY](
+                lambda session: session.query(*QUERY_STATISTICS)
+            )
 
-        baked_query += lambda q: q.filter(Statistics.start >= bindparam("start_time"))
+        baked_query += lambda q: q.filter(table.start >= bindparam("start_time"))
 
         if end_time is not None:
-            baked_query += lambda q: q.filter(Statistics.start < bindparam("end_time"))
+            baked_query += lambda q: q.filter(table.start < bindparam("end_time"))
 
         metadata_ids = None
         if statistic_ids is not None:
             baked_query += lambda q: q.filter(
-                Statistics.metadata_id.in_(bindparam("metadata_ids"))
+                table.metadata_id.in_(bindparam("metadata_ids"))
             )
             metadata_ids = list(metadata.keys())
 
-        baked_query += lambda q: q.order_by(Statistics.metadata_id, Statistics.start)
+        baked_query += lambda q: q.order_by(table.metadata_id, table.start)
 
         stats = execute(
             baked_query(session).params(
@@ -312,29 +463,44 @@ def statistics_during_period(
         )
         if not stats:
             return {}
+        if period == PERIOD_DAY:
+            stats = _reduce_statistics(stats, _day_start)
+        elif period == PERIOD_MONTH:
+            stats = _reduce_statistics(stats, _month_start)
         return _sorted_statistics_to_dict(hass, stats, statistic_ids, metadata)
 
 
 def get_last_statistics(
-    hass: HomeAssistant, number_of_stats: int, statistic_id: str
+    hass: HomeAssistant,
+    number_of_stats: int,
+    statistic_id: str,
+    short_term: bool = False,
 ) -> dict[str, list[dict]]:
-    """Return the last number_of_stats statistics for a statistic_id."""
+    """Return the last number_of_stats statistics for a statistic_id.
+
+    If short_term is set, the short term statistics are returned.
+    """
     statistic_ids = [statistic_id]
     with session_scope(hass=hass) as session:
         metadata = _get_metadata(hass, session, statistic_ids, None)
         if not metadata:
             return {}
 
-        baked_query = hass.data[STATISTICS_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS)
-        )
+        if short_term:
+            table: type[Statistics | StatisticsShortTerm] = StatisticsShortTerm
+            baked_query = hass.data[STATISTICS_SHORT_TERM_BAKERY](
+                lambda session: session.query(*QUERY_STATISTICS_SHORT_TERM)
+            )
+        else:
+            table = Statistics
+            baked_query = hass.data[STATISTICS_BAKERY](
+                lambda session: session.query(*QUERY_STATISTICS)
+            )
 
         baked_query += lambda q: q.filter_by(metadata_id=bindparam("metadata_id"))
         metadata_id = next(iter(metadata.keys()))
 
-        baked_query += lambda q: q.order_by(
-            Statistics.metadata_id, Statistics.start.desc()
-        )
+        baked_query += lambda q: q.order_by(table.metadata_id, table.start.desc())
 
         baked_query += lambda q: q.limit(bindparam("number_of_stats"))
 
@@ -349,6 +515,55 @@ def get_last_statistics(
         return _sorted_statistics_to_dict(hass, stats, statistic_ids, metadata)
 
 
+def get_latest_statistics(
+    hass: HomeAssistant, statistic_ids: list[str], short_term: bool = False
+) -> dict[str, list[dict]]:
+    """Return the last statistics of each of statistic_ids with a single query.
+
+    The result has the same format as get_last_statistics with number_of_stats
+    set to 1. If short_term is set, the short term statistics are returned.
+    """
+    table = StatisticsShortTerm if short_term else Statistics
+    with session_scope(hass=hass) as session:
+        metadata = _get_metadata(hass, session, statistic_ids, None)
+        if not metadata:
+            return {}
+
+        most_recent = (
+            session.query(
+                table.metadata_id,
+                func.max(table.start).label("max_start"),
+            )
+            .filter(table.metadata_id.in_(list(metadata)))
+            .group_by(table.metadata_id)
+            .subquery()
+        )
+        query = (
+            session.query(
+                table.metadata_id,
+                table.start,
+                table.mean,
+                table.min,
+                table.max,
+                table.state,
+                table.sum,
+            )
+            .join(
+                most_recent,
+                and_(
+                    table.metadata_id == most_recent.c.metadata_id,
+                    table.start == most_recent.c.max_start,
+                ),
+            )
+            .order_by(table.metadata_id)
+        )
+        stats = execute(query)
+        if not stats:
+            return {}
+
+        return _sorted_statistics_to_dict(hass, stats, statistic_ids, metadata)
+
+
 def _sorted_statistics_to_dict(
     hass: HomeAssistant,
     stats: list,
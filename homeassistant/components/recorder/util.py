@@ -26,6 +26,7 @@ from .models import (
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     RecorderRuns,
+    StateAttributes,
     process_timestamp,
 )
 
@@ -282,6 +283,18 @@ def setup_connection_for_dialect(dialect_name, dbapi_connection, first_connectio
         execute_on_connection(dbapi_connection, "SET session wait_timeout=28800")
 
 
+def find_shared_attributes_id(session: Session, shared_attrs: str) -> int | None:
+    """Find the id of a row in the state attributes table with the same attributes."""
+    # The hash is only a prefilter, different attributes can have the same hash
+    attributes_id = (
+        session.query(StateAttributes.attributes_id)
+        .filter(StateAttributes.hash == StateAttributes.hash_shared_attrs(shared_attrs))
+        .filter(StateAttributes.shared_attrs == shared_attrs)
+        .first()
+    )
+    return attributes_id[0] if attributes_id else None
+
+
 def end_incomplete_runs(session, start_time):
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
@@ -0,0 +1,40 @@
+"""Websocket API for the recorder."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DATA_INSTANCE, SIGNAL_PURGE_PROGRESS
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up the recorder websocket API."""
+    websocket_api.async_register_command(hass, ws_subscribe_purge_progress)
+
+
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required("type"): "recorder/subscribe_purge_progress"}
+)
+def ws_subscribe_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Subscribe to the progress of the purges of the recorder."""
+
+    @callback
+    def forward_progress(progress: dict[str, Any]) -> None:
+        """Forward the progress to the websocket."""
+        connection.send_message(websocket_api.event_message(msg["id"], progress))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_PURGE_PROGRESS, forward_progress
+    )
+    connection.send_result(msg["id"])
+    forward_progress(hass.data[DATA_INSTANCE].purge_progress.as_dict())
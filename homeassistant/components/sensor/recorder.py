@@ -151,42 +151,43 @@ def _is_number(s: str) -> bool:  # pylint: disable=invalid-name
     return s.replace(".", "", 1).isdigit()
 
 
-def _time_weighted_average(
+def _min_max_mean(
     fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
-) -> float:
-    """Calculate a time weighted average.
+) -> tuple[float, float, float]:
+    """Calculate the min, max and time weighted average in a single pass.
 
     The average is calculated by, weighting the states by duration in seconds between
     state changes.
     Note: there's no interpolation of values between state changes.
+    Timestamps are compared as seconds since the epoch, which is considerably
+    faster than subtracting datetime objects for every state.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+    fstate, state = fstates[0]
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    # If there was no last known state, the period starts at the first state
+    old_start_ts = max(state.last_updated.timestamp(), start_ts)
+    period_start_ts = old_start_ts
+    old_fstate = _min = _max = fstate
     accumulated = 0.0
 
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
+    for fstate, state in itertools.islice(fstates, 1, None):
+        start_time_ts = max(state.last_updated.timestamp(), start_ts)
+        # Accumulate the value, weighted by duration until next state change
+        accumulated += old_fstate * (start_time_ts - old_start_ts)
+        if fstate < _min:
+            _min = fstate
+        elif fstate > _max:
+            _max = fstate
         old_fstate = fstate
-        old_start_time = start_time
+        old_start_ts = start_time_ts
 
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+    # Accumulate the value, weighted by duration until end of the period
+    accumulated += old_fstate * (end_ts - old_start_ts)
 
-    return accumulated / (end - start).total_seconds()
+    return _min, _max, accumulated / (end_ts - period_start_ts)
 
 
 def _normalize_states(
@@ -241,6 +242,24 @@ def compile_statistics(
         hass, start - datetime.timedelta.resolution, end, [i[0] for i in entities]
     )
 
+    # Get the last statistics of all sum sensors in one go
+    sum_entity_ids = [
+        entity_id
+        for entity_id, state_class, key in entities
+        if entity_id in history_list
+        and "sum" in DEVICE_CLASS_OR_UNIT_STATISTICS[state_class][key]
+    ]
+    last_stats = {}
+    if sum_entity_ids:
+        last_stats = statistics.get_latest_statistics(
+            hass, sum_entity_ids, short_term=True
+        )
+    if missing_entity_ids := [
+        entity_id for entity_id in sum_entity_ids if entity_id not in last_stats
+    ]:
+        # Continue from the hourly statistics compiled before the short term ones
+        last_stats.update(statistics.get_latest_statistics(hass, missing_entity_ids))
+
     for entity_id, state_class, key in entities:
         wanted_statistics = DEVICE_CLASS_OR_UNIT_STATISTICS[state_class][key]
 
@@ -264,18 +283,12 @@ def compile_statistics(
 
         # Make calculations
         stat: dict = {}
-        if "max" in wanted_statistics:
-            stat["max"] = max(*itertools.islice(zip(*fstates), 1))
-        if "min" in wanted_statistics:
-            stat["min"] = min(*itertools.islice(zip(*fstates), 1))
-
         if "mean" in wanted_statistics:
-            stat["mean"] = _time_weighted_average(fstates, start, end)
+            stat["min"], stat["max"], stat["mean"] = _min_max_mean(fstates, start, end)
 
         if "sum" in wanted_statistics:
             new_state = old_state = None
             _sum = 0
-            last_stats = statistics.get_last_statistics(hass, 1, entity_id)
             if entity_id in last_stats:
                 # We have compiled history for this sensor before, use that as a starting point
                 new_state = old_state = last_stats[entity_id][0]["state"]
@@ -284,9 +297,10 @@ def compile_statistics(
             for fstate, state in fstates:
 
                 # Deprecated, will be removed in Home Assistant 2021.10
+                # Check the state class first, it avoids decoding the attributes
                 if (
-                    "last_reset" not in state.attributes
-                    and state_class == STATE_CLASS_MEASUREMENT
+                    state_class == STATE_CLASS_MEASUREMENT
+                    and "last_reset" not in state.attributes
                 ):
                     continue
 
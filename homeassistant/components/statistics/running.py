@@ -0,0 +1,262 @@
+"""Statistics of a window of values that are updated as values come and go."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+import math
+import statistics
+from typing import Iterator
+
+# The number of values in a block of the sorted values
+SORTED_BLOCK_SIZE = 256
+
+
+class SortedValues:
+    """A sorted multiset of values with logarithmic inserts and removals.
+
+    The values are kept in sorted blocks, so an insert or removal only
+    shifts the values of one block instead of all the values. The sizes of
+    the blocks are summed up in a binary indexed tree to find the block of
+    an index in logarithmic time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the sorted values."""
+        self._blocks: list[list[float]] = []
+        # The largest value of each block to find the block of a value
+        self._maxes: list[float] = []
+        # The binary indexed tree of the block sizes, built on the first
+        # lookup by index after blocks were split or removed
+        self._sizes: list[int] | None = None
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return self._len
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the values in ascending order."""
+        for block in self._blocks:
+            yield from block
+
+    def add(self, value: float) -> None:
+        """Add a value."""
+        self._len += 1
+        if not self._blocks:
+            self._blocks.append([value])
+            self._maxes.append(value)
+            self._sizes = None
+            return
+
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._blocks[pos].append(value)
+            self._maxes[pos] = value
+        else:
+            insort(self._blocks[pos], value)
+
+        block = self._blocks[pos]
+        if len(block) > 2 * SORTED_BLOCK_SIZE:
+            # Split a block that got too large in two halves
+            self._blocks.insert(pos + 1, block[SORTED_BLOCK_SIZE:])
+            self._maxes.insert(pos, block[SORTED_BLOCK_SIZE - 1])
+            del block[SORTED_BLOCK_SIZE:]
+            self._sizes = None
+        else:
+            self._update_size(pos, 1)
+
+    def remove(self, value: float) -> None:
+        """Remove a value.
+
+        Raises ValueError if the value is not present.
+        """
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            raise ValueError(f"{value} is not present")
+        block = self._blocks[pos]
+        index = bisect_left(block, value)
+        if block[index] != value:
+            raise ValueError(f"{value} is not present")
+
+        self._len -= 1
+        del block[index]
+        if not block:
+            del self._blocks[pos]
+            del self._maxes[pos]
+            self._sizes = None
+            return
+        if index == len(block):
+            self._maxes[pos] = block[-1]
+        self._update_size(pos, -1)
+
+    def _update_size(self, pos: int, delta: int) -> None:
+        """Change the size of the block at pos in the tree of block sizes."""
+        if (sizes := self._sizes) is None:
+            return
+        node = pos + 1
+        while node < len(sizes):
+            sizes[node] += delta
+            node += node & -node
+
+    def _build_sizes(self) -> list[int]:
+        """Build the binary indexed tree of the block sizes."""
+        sizes = [0] + [len(block) for block in self._blocks]
+        for node in range(1, len(sizes)):
+            parent = node + (node & -node)
+            if parent < len(sizes):
+                sizes[parent] += sizes[node]
+        self._sizes = sizes
+        return sizes
+
+    def __getitem__(self, index: int) -> float:
+        """Return the value at an index of the sorted values."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("index out of range")
+        if (sizes := self._sizes) is None:
+            sizes = self._build_sizes()
+        # Descend the tree to the block that holds the index
+        pos = 0
+        step = 1 << (len(sizes) - 1).bit_length()
+        while step:
+            node = pos + step
+            if node < len(sizes) and sizes[node] <= index:
+                pos = node
+                index -= sizes[node]
+            step >>= 1
+        return self._blocks[pos][index]
+
+
+class RunningStatistics:
+    """Statistics of values that are added and removed one at a time.
+
+    The moments are kept with the Welford algorithm and the order
+    statistics with sorted values, so adding or removing a value does not
+    require going over all the values. To avoid floating point errors
+    accumulating, the moments are recomputed once as many values have
+    been removed as are present.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self._sorted = SortedValues()
+        self._mean = 0.0
+        # The sum of the squared differences from the mean
+        self._m2 = 0.0
+        self._total = 0.0
+        self._removals = 0
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return len(self._sorted)
+
+    def add(self, value: float) -> None:
+        """Add a value."""
+        self._sorted.add(value)
+        self._total += value
+        delta = value - self._mean
+        self._mean += delta / len(self._sorted)
+        self._m2 += delta * (value - self._mean)
+
+    def remove(self, value: float) -> None:
+        """Remove a value that was added before."""
+        self._sorted.remove(value)
+        count = len(self._sorted)
+        if not count:
+            self._mean = self._m2 = self._total = 0.0
+            self._removals = 0
+            return
+
+        self._total -= value
+        delta = value - self._mean
+        self._mean -= delta / count
+        self._m2 = max(self._m2 - delta * (value - self._mean), 0.0)
+
+        self._removals += 1
+        if self._removals >= count:
+            self._recompute()
+
+    def _recompute(self) -> None:
+        """Recompute the moments from the values."""
+        values = list(self._sorted)
+        self._total = math.fsum(values)
+        self._mean = self._total / len(values)
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in values)
+        self._removals = 0
+
+    @property
+    def total(self) -> float:
+        """Return the sum of the values."""
+        return self._total
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the values."""
+        if not self._sorted:
+            raise statistics.StatisticsError("mean requires at least one data point")
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance of the values."""
+        if len(self._sorted) < 2:
+            raise statistics.StatisticsError(
+                "variance requires at least two data points"
+            )
+        return self._m2 / (len(self._sorted) - 1)
+
+    @property
+    def stdev(self) -> float:
+        """Return the sample standard deviation of the values."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        """Return the smallest value."""
+        return self._sorted[0]
+
+    @property
+    def max(self) -> float:
+        """Return the largest value."""
+        return self._sorted[-1]
+
+    @property
+    def median(self) -> float:
+        """Return the median of the values."""
+        count = len(self._sorted)
+        if not count:
+            raise statistics.StatisticsError("no median for empty data")
+        if count % 2:
+            return self._sorted[count // 2]
+        return (self._sorted[count // 2 - 1] + self._sorted[count // 2]) / 2
+
+    def quantiles(self, intervals: int, method: str) -> list[float]:
+        """Return the cut points of intervals with equal probability.
+
+        This matches statistics.quantiles, but only looks up the values
+        next to the cut points.
+        """
+        data = self._sorted
+        count = len(data)
+        if count < 2:
+            raise statistics.StatisticsError("must have at least two data points")
+
+        result = []
+        if method == "inclusive":
+            scale = count - 1
+            for i in range(1, intervals):
+                j, delta = divmod(i * scale, intervals)
+                result.append(
+                    (data[j] * (intervals - delta) + data[j + 1] * delta) / intervals
+                )
+            return result
+
+        scale = count + 1
+        for i in range(1, intervals):
+            j = min(max(i * scale // intervals, 1), count - 1)
+            delta = i * scale - j * intervals
+            result.append(
+                (data[j - 1] * (intervals - delta) + data[j] * delta) / intervals
+            )
+        return result
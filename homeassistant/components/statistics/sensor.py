@@ -1,6 +1,7 @@
 """Support for statistics for sensor values."""
 from collections import deque
 import logging
+import math
 import statistics
 
 import voluptuous as vol
@@ -26,6 +27,7 @@ from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, PLATFORMS
+from .running import RunningStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -133,6 +135,7 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement = None
         self.states = deque(maxlen=self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
+        self._running = RunningStatistics()
 
         self.count = 0
         self.mean = self.median = self.quantiles = self.stdev = self.variance = None
@@ -183,19 +186,34 @@ class StatisticsSensor(SensorEntity):
         if new_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
             return
 
-        try:
-            if self.is_binary:
-                self.states.append(new_state.state)
-            else:
-                self.states.append(float(new_state.state))
+        if self.is_binary:
+            value = new_state.state
+        else:
+            try:
+                value = float(new_state.state)
+                if math.isnan(value):
+                    raise ValueError
+            except ValueError:
+                _LOGGER.error(
+                    "%s: parsing error, expected number and received %s",
+                    self.entity_id,
+                    new_state.state,
+                )
+                return
 
-            self.ages.append(new_state.last_updated)
-        except ValueError:
-            _LOGGER.error(
-                "%s: parsing error, expected number and received %s",
-                self.entity_id,
-                new_state.state,
-            )
+        if len(self.states) == self._sampling_size:
+            self._popleft()
+        self.states.append(value)
+        self.ages.append(new_state.last_updated)
+        if not self.is_binary:
+            self._running.add(value)
+
+    def _popleft(self):
+        """Remove the oldest state."""
+        self.ages.popleft()
+        value = self.states.popleft()
+        if not self.is_binary:
+            self._running.remove(value)
 
     @property
     def name(self):
@@ -262,8 +280,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._popleft()
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -283,23 +300,22 @@ class StatisticsSensor(SensorEntity):
         self.count = len(self.states)
 
         if not self.is_binary:
+            running = self._running
             try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
+                self.mean = round(running.mean, self._precision)
+                self.median = round(running.median, self._precision)
             except statistics.StatisticsError as err:
                 _LOGGER.debug("%s: %s", self.entity_id, err)
                 self.mean = self.median = STATE_UNKNOWN
 
             try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
+                self.stdev = round(running.stdev, self._precision)
+                self.variance = round(running.variance, self._precision)
                 if self._quantile_intervals < self.count:
                     self.quantiles = [
                         round(quantile, self._precision)
-                        for quantile in statistics.quantiles(
-                            self.states,
-                            n=self._quantile_intervals,
-                            method=self._quantile_method,
+                        for quantile in running.quantiles(
+                            self._quantile_intervals, self._quantile_method
                         )
                     ]
             except statistics.StatisticsError as err:
@@ -307,9 +323,9 @@ class StatisticsSensor(SensorEntity):
                 self.stdev = self.variance = self.quantiles = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(running.total, self._precision)
+                self.min = round(running.min, self._precision)
+                self.max = round(running.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -7,7 +7,7 @@ from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
     find_paths_unserializable_data,
@@ -31,6 +31,19 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
 
+COMPRESSED_STATE_STATE: Final = "s"
+COMPRESSED_STATE_ATTRIBUTES: Final = "a"
+COMPRESSED_STATE_CONTEXT: Final = "c"
+COMPRESSED_STATE_LAST_CHANGED: Final = "lc"
+COMPRESSED_STATE_LAST_UPDATED: Final = "lu"
+
+STATE_DIFF_ADDITIONS: Final = "+"
+STATE_DIFF_REMOVALS: Final = "-"
+
+ENTITY_EVENT_ADD: Final = "a"
+ENTITY_EVENT_REMOVE: Final = "r"
+ENTITY_EVENT_CHANGE: Final = "c"
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
@@ -55,23 +68,107 @@ def event_message(iden: JSON_TYPE, event: Any) -> dict[str, Any]:
 def cached_event_message(iden: int, event: Event) -> str:
     """Return an event message.
 
-    Serialize to json once per message.
+    Serialize to json once per event.
 
     Since we can have many clients connected that are
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return _cached_event_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+    try:
+        event_json = event.as_dict_json()
+    except (ValueError, TypeError):
+        return message_to_json(event_message(iden, event))
+    return f'{{"id": {iden}, "type": "event", "event": {event_json}}}'
+
+
+def states_result_message(iden: int, states: list[State]) -> str:
+    """Return a result message with a list of states.
+
+    Splices in the JSON each state caches, so states are only
+    serialized once however many connections request them.
+    """
+    try:
+        states_json = ", ".join(state.as_dict_json() for state in states)
+    except (ValueError, TypeError):
+        return message_to_json(result_message(iden, states))
+    return (
+        f'{{"id": {iden}, "type": "{const.TYPE_RESULT}", '
+        f'"success": true, "result": [{states_json}]}}'
+    )
+
+
+def cached_state_diff_message(iden: int, event: Event) -> str:
+    """Return an event message with the changes of a state changed event.
+
+    Serialize to json once per message, see cached_event_message.
+    """
+    return _cached_state_diff_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
 
 
 @lru_cache(maxsize=128)
-def _cached_event_message(event: Event) -> str:
-    """Cache and serialize the event to json.
+def _cached_state_diff_message(event: Event) -> str:
+    """Cache and serialize the state diff of the event to json.
 
     The IDEN_TEMPLATE is used which will be replaced
-    with the actual iden in cached_event_message
+    with the actual iden in cached_state_diff_message
     """
-    return message_to_json(event_message(IDEN_TEMPLATE, event))
+    return message_to_json(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
+
+
+def _state_diff_event(event: Event) -> dict[str, Any]:
+    """Convert a state changed event to the minimal version."""
+    entity_id = event.data["entity_id"]
+    if (new_state := event.data["new_state"]) is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if (old_state := event.data["old_state"]) is None:
+        return {ENTITY_EVENT_ADD: {entity_id: compressed_state_dict_add(new_state)}}
+    return {ENTITY_EVENT_CHANGE: {entity_id: _state_diff(old_state, new_state)}}
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the fields of new_state that differ from old_state."""
+    additions: dict[str, Any] = {}
+    diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    elif old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+    if old_state.context.id != new_state.context.id:
+        additions[COMPRESSED_STATE_CONTEXT] = _compressed_context(new_state)
+    old_attributes = old_state.attributes
+    for key, value in new_state.attributes.items():
+        if key not in old_attributes or old_attributes[key] != value:
+            additions.setdefault(COMPRESSED_STATE_ATTRIBUTES, {})[key] = value
+    if removed := set(old_attributes).difference(new_state.attributes):
+        diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
+    return diff
+
+
+def _compressed_context(state: State) -> str | dict[str, str | None]:
+    """Return the context id, or the full context if it has more than an id."""
+    context = state.context
+    if context.parent_id is None and context.user_id is None:
+        return context.id
+    return context.as_dict()
+
+
+def compressed_state_dict_add(state: State) -> dict[str, Any]:
+    """Build a compressed dict of a state for adds.
+
+    Omits the last_updated when it is the same
+    as last_changed to reduce the message size.
+    """
+    compressed_state: dict[str, Any] = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: dict(state.attributes),
+        COMPRESSED_STATE_CONTEXT: _compressed_context(state),
+        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
+    }
+    if state.last_changed != state.last_updated:
+        compressed_state[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
+    return compressed_state
 
 
 def message_to_json(message: dict[str, Any]) -> str:
@@ -60,6 +60,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util import location
 from homeassistant.util.async_ import (
     fire_coroutine_threadsafe,
@@ -111,6 +112,13 @@ SOURCE_YAML = "yaml"
 # How long to wait until things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
+# How often the timer wakes up to detect it got out of sync
+# while nothing listens for the time changed event
+TIMER_IDLE_INTERVAL = 60
+
+# Events that are not delivered to the listeners of all events
+MATCH_ALL_EXCLUDED_EVENTS = {EVENT_HOMEASSISTANT_CLOSE, EVENT_TIME_CHANGED}
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -233,6 +241,8 @@ class HomeAssistant:
         self._stopped: asyncio.Event | None = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Wraps the targets of jobs to measure them, None when not measuring
+        self._job_monitor: Callable[[HassJobType, Callable], Callable] | None = None
 
     @property
     def is_running(self) -> bool:
@@ -359,15 +369,17 @@ class HomeAssistant:
         hassjob: HassJob to call.
         args: parameters for method to call.
         """
+        target = hassjob.target
+        if self._job_monitor is not None:
+            target = self._job_monitor(hassjob.job_type, target)
+
         if hassjob.job_type == HassJobType.Coroutinefunction:
-            task = self.loop.create_task(hassjob.target(*args))
+            task = self.loop.create_task(target(*args))
         elif hassjob.job_type == HassJobType.Callback:
-            self.loop.call_soon(hassjob.target, *args)
+            self.loop.call_soon(target, *args)
             return None
         else:
-            task = self.loop.run_in_executor(  # type: ignore
-                None, hassjob.target, *args
-            )
+            task = self.loop.run_in_executor(None, target, *args)  # type: ignore
 
         # If a task is scheduled
         if self._track_task:
@@ -402,6 +414,8 @@ class HomeAssistant:
         self, target: Callable[..., T], *args: Any
     ) -> Awaitable[T]:
         """Add an executor job from within the event loop."""
+        if self._job_monitor is not None:
+            target = self._job_monitor(HassJobType.Executor, target)
         task = self.loop.run_in_executor(None, target, *args)
 
         # If a task is scheduled
@@ -410,6 +424,17 @@ class HomeAssistant:
 
         return task
 
+    @callback
+    def async_set_job_monitor(
+        self, job_monitor: Callable[[HassJobType, Callable], Callable] | None
+    ) -> None:
+        """Set the function that wraps the targets of jobs to measure them.
+
+        The function is called with the type and the target of every job that
+        is added and returns the target to run instead. Pass None to stop.
+        """
+        self._job_monitor = job_monitor
+
     @callback
     def async_track_tasks(self) -> None:
         """Track tasks so you can wait for all tasks to be done."""
@@ -430,7 +455,10 @@ class HomeAssistant:
         args: parameters for method to call.
         """
         if hassjob.job_type == HassJobType.Callback:
-            hassjob.target(*args)
+            if self._job_monitor is not None:
+                self._job_monitor(HassJobType.Callback, hassjob.target)(*args)
+            else:
+                hassjob.target(*args)
             return None
 
         return self.async_add_hass_job(hassjob, *args)
@@ -602,7 +630,14 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ["event_type", "data", "origin", "time_fired", "context"]
+    __slots__ = [
+        "event_type",
+        "data",
+        "origin",
+        "time_fired",
+        "context",
+        "_as_dict_json",
+    ]
 
     def __init__(
         self,
@@ -618,6 +653,7 @@ class Event:
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
         self.context: Context = context or Context()
+        self._as_dict_json: str | None = None
 
     def __hash__(self) -> int:
         """Make hashable."""
@@ -637,6 +673,18 @@ class Event:
             "context": self.context.as_dict(),
         }
 
+    def as_dict_json(self) -> str:
+        """Return the JSON representation of this Event.
+
+        The JSON is only encoded once per event so it can be shared
+        by all the places the event is sent to.
+
+        Async friendly.
+        """
+        if self._as_dict_json is None:
+            self._as_dict_json = json_dumps(self.as_dict())
+        return self._as_dict_json
+
     def __repr__(self) -> str:
         """Return the representation."""
         if self.data:
@@ -662,21 +710,70 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        self._keyed_listeners: dict[str, _KeyedListeners] = {}
+        self._first_listener_actions: dict[str, CALLBACK_TYPE] = {}
         self._hass = hass
 
     @callback
     def async_listeners(self) -> dict[str, int]:
         """Return dictionary with events and the number of listeners.
 
+        The keyed listeners of an event type are dispatched together and
+        count as one listener, see async_keyed_listeners for their number.
+
+        This method must be run in the event loop.
+        """
+        result = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type in self._keyed_listeners:
+            result[event_type] = result.get(event_type, 0) + 1
+        return result
+
+    @callback
+    def async_keyed_listeners(self, event_type: str) -> dict[str, int]:
+        """Return dictionary with keys and the number of keyed listeners.
+
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        if (keyed_listeners := self._keyed_listeners.get(event_type)) is None:
+            return {}
+        return keyed_listeners.async_counts()
 
     @property
     def listeners(self) -> dict[str, int]:
         """Return dictionary with events and the number of listeners."""
         return run_callback_threadsafe(self._hass.loop, self.async_listeners).result()
 
+    @callback
+    def async_has_listeners(self, event_type: str) -> bool:
+        """Return if there are listeners for a specific event type.
+
+        Listeners of all events are not taken into account.
+
+        This method must be run in the event loop.
+        """
+        return event_type in self._listeners or event_type in self._keyed_listeners
+
+    @callback
+    def async_on_first_listener(
+        self, event_type: str, action: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Call action when a listener is added for an event type without listeners.
+
+        There can be only one action per event type.
+
+        Returns function to remove the action.
+
+        This method must be run in the event loop.
+        """
+        self._first_listener_actions[event_type] = action
+
+        def remove_action() -> None:
+            """Remove the action."""
+            if self._first_listener_actions.get(event_type) is action:
+                del self._first_listener_actions[event_type]
+
+        return remove_action
+
     def fire(
         self,
         event_type: str,
@@ -709,19 +806,27 @@ class EventBus:
 
         listeners = self._listeners.get(event_type, [])
 
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
+        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners and
+        # EVENT_TIME_CHANGED is fired too often to be of use to them
         match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
+        if (
+            match_all_listeners is not None
+            and event_type not in MATCH_ALL_EXCLUDED_EVENTS
+        ):
             listeners = match_all_listeners + listeners
 
+        keyed_listeners = self._keyed_listeners.get(event_type)
+        run_keyed_listeners = (
+            keyed_listeners is not None
+            and event_data is not None
+            and keyed_listeners.async_has_jobs(event_data)
+        )
+
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
-
         for job, event_filter in listeners:
             if event_filter is not None:
                 try:
@@ -732,6 +837,29 @@ class EventBus:
                     continue
             self._hass.async_add_hass_job(job, event)
 
+        if run_keyed_listeners:
+            self._hass.loop.call_soon(self._async_run_keyed_listeners, event)
+
+    @callback
+    def _async_run_keyed_listeners(self, event: Event) -> None:
+        """Run the keyed listeners of an event.
+
+        The listeners are looked up when the event is handled, so listeners
+        added while handling earlier events are included.
+
+        This method must be run in the event loop.
+        """
+        keyed_listeners = self._keyed_listeners.get(event.event_type)
+        if keyed_listeners is None:
+            return
+
+        # Copy the jobs as listeners can be added or removed while they run
+        for job in list(keyed_listeners.async_jobs(event.data)):
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running keyed listener %s for %s", job, event)
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -776,14 +904,56 @@ class EventBus:
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: tuple[HassJob, Callable | None]
     ) -> CALLBACK_TYPE:
+        first_listener = not self.async_has_listeners(event_type)
         self._listeners.setdefault(event_type, []).append(filterable_job)
 
+        if first_listener and event_type in self._first_listener_actions:
+            self._first_listener_actions[event_type]()
+
         def remove_listener() -> None:
             """Remove the listener."""
             self._async_remove_listener(event_type, filterable_job)
 
         return remove_listener
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        keys: Iterable[str],
+        listener: Callable,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for specific entities.
+
+        A key is either an entity_id or a domain and is matched against
+        the entity_id in the data of the events. Firing an event only
+        looks up the listeners of its entity_id and domain instead of
+        filtering every listener.
+
+        This method must be run in the event loop.
+        """
+        keys = list(keys)
+        if not keys:
+            return _async_remove_empty_listener
+
+        job = HassJob(listener)
+        first_listener = not self.async_has_listeners(event_type)
+        keyed_listeners = self._keyed_listeners.get(event_type)
+        if keyed_listeners is None:
+            keyed_listeners = self._keyed_listeners[event_type] = _KeyedListeners()
+        for key in keys:
+            keyed_listeners.async_add(key, job)
+
+        if first_listener and event_type in self._first_listener_actions:
+            self._first_listener_actions[event_type]()
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(event_type, keys, job)
+
+        return remove_listener
+
     def listen_once(
         self, event_type: str, listener: Callable[[Event], None]
     ) -> CALLBACK_TYPE:
@@ -858,6 +1028,91 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self, event_type: str, keys: list[str], job: HassJob
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            for key in keys:
+                keyed_listeners.async_remove(key, job)
+
+            if not keyed_listeners.async_counts():
+                del self._keyed_listeners[event_type]
+        except (KeyError, ValueError):
+            # KeyError is key event_type or key listener did not exist
+            # ValueError if listener did not exist within key
+            _LOGGER.exception("Unable to remove unknown keyed job listener %s", job)
+
+
+@callback
+def _async_remove_empty_listener() -> None:
+    """Remove a listener that does nothing."""
+
+
+class _KeyedListeners:
+    """Listeners of an event type keyed by entity_id or domain."""
+
+    __slots__ = ("_entities", "_domains")
+
+    def __init__(self) -> None:
+        """Initialize the keyed listeners."""
+        self._entities: dict[str, list[HassJob]] = {}
+        self._domains: dict[str, list[HassJob]] = {}
+
+    @callback
+    def async_add(self, key: str, job: HassJob) -> None:
+        """Add a listener for an entity_id or a domain."""
+        listeners = self._entities if "." in key else self._domains
+        listeners.setdefault(key, []).append(job)
+
+    @callback
+    def async_remove(self, key: str, job: HassJob) -> None:
+        """Remove a listener for an entity_id or a domain.
+
+        Raises KeyError or ValueError if the listener was not added.
+        """
+        listeners = self._entities if "." in key else self._domains
+        listeners[key].remove(job)
+        if not listeners[key]:
+            del listeners[key]
+
+    @callback
+    def async_counts(self) -> dict[str, int]:
+        """Return the number of listeners by key."""
+        return {
+            key: len(jobs)
+            for listeners in (self._entities, self._domains)
+            for key, jobs in listeners.items()
+        }
+
+    @callback
+    def async_has_jobs(self, event_data: dict[str, Any]) -> bool:
+        """Return if there are listeners for the entity_id of the event data."""
+        entity_id = event_data.get("entity_id")
+        if not isinstance(entity_id, str):
+            return False
+        if entity_id in self._entities:
+            return True
+        return bool(self._domains) and entity_id.partition(".")[0] in self._domains
+
+    @callback
+    def async_jobs(self, event_data: dict[str, Any]) -> list[HassJob]:
+        """Return the listeners for the entity_id of the event data."""
+        entity_id = event_data.get("entity_id")
+        if not isinstance(entity_id, str):
+            return []
+        jobs = self._entities.get(entity_id, [])
+        if self._domains and (
+            domain_jobs := self._domains.get(entity_id.partition(".")[0])
+        ):
+            jobs = jobs + domain_jobs
+        return jobs
+
 
 class State:
     """Object to represent a state within the state machine.
@@ -882,6 +1137,7 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
     ]
 
     def __init__(
@@ -917,6 +1173,7 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -949,6 +1206,18 @@ class State:
             }
         return self._as_dict
 
+    def as_dict_json(self) -> str:
+        """Return the JSON representation of the State.
+
+        Async friendly.
+
+        The JSON is only encoded once per state so it can be spliced
+        into the responses of all the API calls that return it.
+        """
+        if self._as_dict_json is None:
+            self._as_dict_json = json_dumps(self.as_dict())
+        return self._as_dict_json
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
@@ -1009,6 +1278,8 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        # The states by domain, in the order the entities were added
+        self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1032,12 +1303,12 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
         return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
+            entity_id
+            for domain in dict.fromkeys(domain_filter)
+            for entity_id in self._domain_index.get(domain, ())
         ]
 
     @callback
@@ -1052,10 +1323,11 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(self._domain_index.get(domain, ()))
+            for domain in dict.fromkeys(domain_filter)
         )
 
     def all(self, domain_filter: str | Iterable | None = None) -> list[State]:
@@ -1074,10 +1346,13 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            states = self._domain_index.get(domain_filter.lower())
+            return list(states.values()) if states else []
 
         return [
-            state for state in self._states.values() if state.domain in domain_filter
+            state
+            for domain in dict.fromkeys(domain_filter)
+            for state in self._domain_index.get(domain, {}).values()
         ]
 
     def get(self, entity_id: str) -> State | None:
@@ -1121,6 +1396,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1226,6 +1506,7 @@ class StateMachine:
             old_state is None,
         )
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -1769,15 +2050,22 @@ class Config:
 
 
 def _async_create_timer(hass: HomeAssistant) -> None:
-    """Create a timer that will start on HOMEASSISTANT_START."""
+    """Create a timer that will start on HOMEASSISTANT_START.
+
+    The timer only ticks every second while there are listeners for
+    EVENT_TIME_CHANGED. Otherwise it wakes up once a minute to detect
+    that it got out of sync.
+    """
     handle = None
     timer_context = Context()
 
     def schedule_tick(now: datetime.datetime) -> None:
-        """Schedule a timer tick when the next second rolls around."""
+        """Schedule a timer tick when the next second or idle interval rolls around."""
         nonlocal handle
 
         slp_seconds = 1 - (now.microsecond / 10 ** 6)
+        if not hass.bus.async_has_listeners(EVENT_TIME_CHANGED):
+            slp_seconds += TIMER_IDLE_INTERVAL - 1 - now.second % TIMER_IDLE_INTERVAL
         target = monotonic() + slp_seconds
         handle = hass.loop.call_later(slp_seconds, fire_time_event, target)
 
@@ -1786,9 +2074,13 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
-        hass.bus.async_fire(
-            EVENT_TIME_CHANGED, {ATTR_NOW: now}, time_fired=now, context=timer_context
-        )
+        if hass.bus.async_has_listeners(EVENT_TIME_CHANGED):
+            hass.bus.async_fire(
+                EVENT_TIME_CHANGED,
+                {ATTR_NOW: now},
+                time_fired=now,
+                context=timer_context,
+            )
 
         # If we are more than a second late, a tick was missed
         late = monotonic() - target
@@ -1802,9 +2094,21 @@ def _async_create_timer(hass: HomeAssistant) -> None:
 
         schedule_tick(now)
 
+    @callback
+    def resume_ticks() -> None:
+        """Tick every second again when the time changed event gets a listener."""
+        if handle is not None:
+            handle.cancel()
+        schedule_tick(dt_util.utcnow())
+
+    remove_resume_ticks = hass.bus.async_on_first_listener(
+        EVENT_TIME_CHANGED, resume_ticks
+    )
+
     @callback
     def stop_timer(_: Event) -> None:
         """Stop the timer."""
+        remove_resume_ticks()
         if handle is not None:
             handle.cancel()
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections import OrderedDict
 import logging
+from operator import itemgetter
 import time
 from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
@@ -157,11 +158,20 @@ class DeviceRegistry:
     deleted_devices: dict[str, DeletedDeviceEntry]
     _registered_index: _DeviceIndex
     _deleted_index: _DeviceIndex
+    _area_index: dict[str, dict[str, DeviceEntry]]
+    _config_entry_index: dict[str, dict[str, DeviceEntry]]
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            journal=[
+                hass.helpers.storage.JournalList(path, itemgetter("id"))
+                for path in ("devices", "deleted_devices")
+            ],
+        )
         self._clear_index()
 
     @callback
@@ -204,6 +214,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices[device.id] = device
+            self._add_device_to_lookups(device)
 
         _add_device_to_index(devices_index, device)
 
@@ -215,6 +226,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices.pop(device.id)
+            self._remove_device_from_lookups(device)
 
         _remove_device_from_index(devices_index, device)
 
@@ -225,17 +237,36 @@ class DeviceRegistry:
         devices_index = self._registered_index
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
+        self._remove_device_from_lookups(old_device)
+        self._add_device_to_lookups(new_device)
+
+    def _add_device_to_lookups(self, device: DeviceEntry) -> None:
+        """Add a device to the lookups by area and config entry."""
+        if device.area_id is not None:
+            self._area_index.setdefault(device.area_id, {})[device.id] = device
+        for config_entry_id in device.config_entries:
+            self._config_entry_index.setdefault(config_entry_id, {})[device.id] = device
+
+    def _remove_device_from_lookups(self, device: DeviceEntry) -> None:
+        """Remove a device from the lookups by area and config entry."""
+        if device.area_id is not None:
+            _remove_from_lookup(self._area_index, device.area_id, device.id)
+        for config_entry_id in device.config_entries:
+            _remove_from_lookup(self._config_entry_index, config_entry_id, device.id)
 
     def _clear_index(self) -> None:
         """Clear the index."""
         self._registered_index = _DeviceIndex(identifiers={}, connections={})
         self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._area_index = {}
+        self._config_entry_index = {}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._registered_index, device)
+            self._add_device_to_lookups(device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._deleted_index, deleted_device)
 
@@ -574,8 +605,8 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
+        for device_id in list(self._config_entry_index.get(config_entry_id, ())):
+            self._async_update_device(device_id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
             if config_entry_id not in config_entries:
@@ -615,9 +646,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in list(self._area_index.get(area_id, ())):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @callback
@@ -645,7 +675,8 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    # pylint: disable=protected-access
+    return list(registry._area_index.get(area_id, {}).values())
 
 
 @callback
@@ -653,11 +684,8 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    # pylint: disable=protected-access
+    return list(registry._config_entry_index.get(config_entry_id, {}).values())
 
 
 @callback
@@ -816,3 +844,13 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index.connections:
             del devices_index.connections[connection]
+
+
+def _remove_from_lookup(
+    lookup: dict[str, dict[str, DeviceEntry]], key: str, device_id: str
+) -> None:
+    """Remove a device from the devices of a key of a lookup."""
+    devices = lookup[key]
+    del devices[device_id]
+    if not devices:
+        del lookup[key]
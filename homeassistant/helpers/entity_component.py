@@ -31,7 +31,7 @@ from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.loader import async_get_integration, bind_hass
 from homeassistant.setup import async_prepare_setup_platform
 
-from .entity_platform import EntityPlatform
+from .entity_platform import DATA_DOMAIN_ENTITIES, EntityPlatform
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=15)
 DATA_INSTANCES = "entity_components"
@@ -85,6 +85,10 @@ class EntityComponent:
 
         self.config: ConfigType | None = None
 
+        # The entities of all the platforms, kept up to date by the platforms
+        self._entities: dict[str, entity.Entity] = hass.data.setdefault(
+            DATA_DOMAIN_ENTITIES, {}
+        ).setdefault(domain, {})
         self._platforms: dict[
             str | tuple[str, timedelta | None, str | None], EntityPlatform
         ] = {domain: self._async_init_entity_platform(domain, None)}
@@ -96,17 +100,11 @@ class EntityComponent:
     @property
     def entities(self) -> Iterable[entity.Entity]:
         """Return an iterable that returns all entities."""
-        return chain.from_iterable(
-            platform.entities.values() for platform in self._platforms.values()
-        )
+        return self._entities.values()
 
     def get_entity(self, entity_id: str) -> entity.Entity | None:
         """Get an entity."""
-        for platform in self._platforms.values():
-            entity_obj = platform.entities.get(entity_id)
-            if entity_obj is not None:
-                return entity_obj
-        return None
+        return self._entities.get(entity_id)
 
     def setup(self, config: ConfigType) -> None:
         """Set up a full entity component.
@@ -211,7 +209,11 @@ class EntityComponent:
         async def handle_service(call: Callable) -> None:
             """Handle the service."""
             await self.hass.helpers.service.entity_service_call(
-                self._platforms.values(), func, call, required_features
+                self._platforms.values(),
+                func,
+                call,
+                required_features,
+                domain_entities=self._entities,
             )
 
         self.hass.services.async_register(self.domain, name, handle_service, schema)
@@ -12,6 +12,7 @@ from __future__ import annotations
 from collections import OrderedDict
 from collections.abc import Iterable, Mapping
 import logging
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, Callable, cast
 
 import attr
@@ -154,7 +155,16 @@ class EntityRegistry:
         self.hass = hass
         self.entities: dict[str, RegistryEntry]
         self._index: dict[tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._device_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._area_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._config_entry_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            journal=[
+                hass.helpers.storage.JournalList("entities", itemgetter("entity_id"))
+            ],
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -562,19 +572,14 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(self._config_entry_index.get(config_entry, ())):
             self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entity_id in list(self._area_index.get(area_id, ())):
+            self._async_update_entity(entity_id, area_id=None)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
@@ -582,6 +587,9 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        _add_to_index(self._device_index, entry.device_id, entry)
+        _add_to_index(self._area_index, entry.area_id, entry)
+        _add_to_index(self._config_entry_index, entry.config_entry_id, entry)
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -589,13 +597,39 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        _remove_from_index(self._device_index, entry.device_id, entry)
+        _remove_from_index(self._area_index, entry.area_id, entry)
+        _remove_from_index(self._config_entry_index, entry.config_entry_id, entry)
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._device_index = {}
+        self._area_index = {}
+        self._config_entry_index = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
 
+def _add_to_index(
+    index: dict[str, dict[str, RegistryEntry]], key: str | None, entry: RegistryEntry
+) -> None:
+    """Add an entry to the entries of a key of an index."""
+    if key is not None:
+        index.setdefault(key, {})[entry.entity_id] = entry
+
+
+def _remove_from_index(
+    index: dict[str, dict[str, RegistryEntry]], key: str | None, entry: RegistryEntry
+) -> None:
+    """Remove an entry from the entries of a key of an index."""
+    if key is None:
+        return
+    entries = index[key]
+    del entries[entry.entity_id]
+    if not entries:
+        del index[key]
+
+
 @callback
 def async_get(hass: HomeAssistant) -> EntityRegistry:
     """Get entity registry."""
@@ -623,11 +657,11 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
+    # pylint: disable=protected-access
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry._device_index.get(device_id, {}).values()
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -636,7 +670,8 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    # pylint: disable=protected-access
+    return list(registry._area_index.get(area_id, {}).values())
 
 
 @callback
@@ -644,11 +679,8 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    # pylint: disable=protected-access
+    return list(registry._config_entry_index.get(config_entry_id, {}).values())
 
 
 @callback
@@ -42,9 +42,6 @@ from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
-TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
-
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 
@@ -240,64 +237,14 @@ def async_track_state_change_event(
     Unlike async_track_state_change, async_track_state_change_event
     passes the full event to the callback.
 
-    In order to avoid having to iterate a long list
-    of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    The listeners are keyed by entity_id on the event bus, so a
+    state change only runs the listeners of its entity.
     """
     entity_ids = _async_string_to_lower_list(entity_ids)
     if not entity_ids:
         return _remove_empty_listener
 
-    entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
-
-    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("entity_id") in entity_callbacks
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
-
-        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
-
-    job = HassJob(action)
-
-    for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
-
-    @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_STATE_CHANGE_CALLBACKS,
-            TRACK_STATE_CHANGE_LISTENER,
-            entity_ids,
-            job,
-        )
-
-    return remove_listener
+    return hass.bus.async_listen_keyed(EVENT_STATE_CHANGED, entity_ids, action)
 
 
 @callback
@@ -788,6 +735,9 @@ class _TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        # The states the last render of each track template depended on, by
+        # the id of the track template as equal templates may be tracked
+        self._rendered_states: dict[int, list[State | None] | None] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable] = {}
 
@@ -799,6 +749,7 @@ class _TrackTemplateResultInfo:
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict
             )
+            self._rendered_states[id(track_template_)] = self._states_for_info(info)
 
             if info.exception:
                 if raise_on_template_error:
@@ -872,6 +823,41 @@ class _TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    def _states_for_info(self, info: RenderInfo) -> list[State | None] | None:
+        """Return the states a render depended on.
+
+        Returns None if the render depends on more than the states of its
+        entities and domains.
+        """
+        if info.all_states or info.all_states_lifecycle or info.has_time:
+            return None
+        if info.exception or info.is_static:
+            return None
+        states = self.hass.states
+        rendered_states = [states.get(entity_id) for entity_id in info.entities]
+        if info.domains or info.domains_lifecycle:
+            rendered_states.extend(
+                states.async_all(info.domains | info.domains_lifecycle)
+            )
+        return rendered_states
+
+    def _states_unchanged(self, track_template_: TrackTemplate) -> bool:
+        """Return if the states the last render depended on are unchanged.
+
+        State objects are replaced on every change, so comparing their
+        identity is enough. This skips the renders for the changes of a
+        burst that the render for the first change already saw.
+        """
+        rendered_states = self._rendered_states.get(id(track_template_))
+        if rendered_states is None:
+            return False
+        current_states = self._states_for_info(self._info[track_template_.template])
+        assert current_states is not None
+        return len(current_states) == len(rendered_states) and all(
+            current is rendered
+            for current, rendered in zip(current_states, rendered_states)
+        )
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -909,6 +895,14 @@ class _TrackTemplateResultInfo:
             ):
                 return not had_timer
 
+            if self._states_unchanged(track_template_):
+                _LOGGER.debug(
+                    "Template %s already rendered with the states of event: %s",
+                    template.template,
+                    event,
+                )
+                return False
+
             _LOGGER.debug(
                 "Template update %s triggered by event: %s",
                 template.template,
@@ -919,6 +913,7 @@ class _TrackTemplateResultInfo:
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
+        self._rendered_states[id(track_template_)] = self._states_for_info(info)
 
         try:
             result: str | TemplateError = info.result()
@@ -1,8 +1,32 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
+from __future__ import annotations
+
 from datetime import datetime, timedelta
 import json
+import math
 from typing import Any
 
+import orjson
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects.
+
+    Raise TypeError for objects that can not be converted.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    # Types that orjson only serializes natively when they are not subclassed
+    if isinstance(obj, tuple):
+        return list(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class JSONEncoder(json.JSONEncoder):
     """JSONEncoder that supports Home Assistant objects."""
@@ -36,3 +60,101 @@ class ExtendedJSONEncoder(JSONEncoder):
             return super().default(o)
         except TypeError:
             return {"__type": str(type(o)), "repr": repr(o)}
+
+
+def _json_native(obj: Any) -> Any:
+    """Convert obj to the types the json module encodes like orjson."""
+    if isinstance(obj, (str, bool, int, float)) or obj is None:
+        return obj
+    if isinstance(obj, dict):
+        return {
+            key.isoformat() if isinstance(key, datetime) else key: _json_native(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_json_native(value) for value in obj]
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return _json_native(json_encoder_default(obj))
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Return if data contains NaN or infinite floats."""
+    stack = [data]
+    pop = stack.pop
+    extend = stack.extend
+    isfinite = math.isfinite
+    while stack:
+        obj = pop()
+        obj_type = type(obj)
+        # Test the exact types first, they are the most common ones
+        if obj_type is str or obj_type is int or obj is None or obj_type is bool:
+            continue
+        if obj_type is float:
+            if not isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            extend(obj.values())
+        elif obj_type is list or obj_type is tuple or obj_type is set:
+            extend(obj)
+        elif isinstance(obj, (str, int, datetime)):
+            continue
+        elif isinstance(obj, float):
+            if not isfinite(obj):
+                return True
+        else:
+            try:
+                extend((json_encoder_default(obj),))
+            except TypeError:
+                continue
+    return False
+
+
+def _dumps(data: Any, allow_nan: bool) -> str:
+    """Serialize data to a JSON string without whitespace.
+
+    orjson encodes NaN and infinite floats as null, the json module
+    encodes data that has them instead. It also encodes the data orjson
+    can not encode, like integers that do not fit in 64 bits.
+    """
+    try:
+        result: str = orjson.dumps(
+            data, option=orjson.OPT_NON_STR_KEYS, default=json_encoder_default
+        ).decode("utf-8")
+    except TypeError:
+        pass
+    else:
+        if "null" not in result or not _has_non_finite(data):
+            return result
+    return json.dumps(
+        _json_native(data),
+        allow_nan=allow_nan,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data to a JSON string without whitespace.
+
+    Raises ValueError for NaN and infinite floats.
+    """
+    return _dumps(data, False)
+
+
+def json_dumps_compact(data: Any) -> str:
+    """Serialize data to a JSON string without whitespace.
+
+    NaN and infinite floats are encoded as NaN, Infinity and -Infinity.
+    """
+    return _dumps(data, True)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON string."""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # orjson is strict, fall back for NaN and other
+        # extensions written by the json module
+        return json.loads(data)
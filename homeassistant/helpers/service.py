@@ -5,6 +5,7 @@ import asyncio
 from collections.abc import Awaitable, Iterable
 import dataclasses
 from functools import partial, wraps
+from itertools import chain
 import logging
 from typing import TYPE_CHECKING, Any, Callable, TypedDict
 
@@ -355,26 +356,33 @@ async def async_extract_referenced_entity_ids(
 
     # Find devices for this area
     selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+    for area_id in selector.area_ids:
+        selected.referenced_devices.update(
+            device_entry.id
+            for device_entry in device_registry.async_entries_for_area(dev_reg, area_id)
+        )
 
     if not selector.area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
-        if (
-            # when area matches the target area
-            ent_entry.area_id in selector.area_ids
-            # when device matches a referenced devices with no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # when device matches target device
-            or ent_entry.device_id in selector.device_ids
+    # Entities whose area matches the target area
+    for area_id in selector.area_ids:
+        selected.indirectly_referenced.update(
+            ent_entry.entity_id
+            for ent_entry in entity_registry.async_entries_for_area(ent_reg, area_id)
+        )
+
+    for device_id in selected.referenced_devices:
+        for ent_entry in entity_registry.async_entries_for_device(
+            ent_reg, device_id, include_disabled_entities=True
         ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+            if (
+                # when device matches a referenced devices with no explicitly set area
+                not ent_entry.area_id
+                # when device matches target device
+                or device_id in selector.device_ids
+            ):
+                selected.indirectly_referenced.add(ent_entry.entity_id)
 
     return selected
 
@@ -523,10 +531,14 @@ async def entity_service_call(
     func: str | Callable[..., Any],
     call: ServiceCall,
     required_features: Iterable[int] | None = None,
+    *,
+    domain_entities: dict[str, Entity] | None = None,
 ) -> None:
     """Handle an entity service call.
 
-    Calls all platforms simultaneously.
+    Calls all platforms simultaneously. When the entities of the platforms
+    are passed as domain_entities by entity id, only the targeted entities
+    are looked up.
     """
     if call.context.user_id:
         user = await hass.auth.async_get_user(call.context.user_id)
@@ -559,57 +571,55 @@ async def entity_service_call(
     else:
         data = call
 
+    # The entities the service call targets
+    targeted: Iterable[Entity]
+    if domain_entities is not None:
+        if all_referenced is None:
+            targeted = domain_entities.values()
+        else:
+            targeted = [
+                domain_entities[entity_id]
+                for entity_id in all_referenced
+                if entity_id in domain_entities
+            ]
+    else:
+        targeted = chain.from_iterable(
+            platform.entities.values() for platform in platforms
+        )
+        if all_referenced is not None:
+            targeted = [
+                entity for entity in targeted if entity.entity_id in all_referenced
+            ]
+
     # Check the permissions
 
     # A list with entities to call the service on.
-    entity_candidates: list[Entity] = []
+    entity_candidates: list[Entity]
 
     if entity_perms is None:
-        for platform in platforms:
-            if target_all_entities:
-                entity_candidates.extend(platform.entities.values())
-            else:
-                assert all_referenced is not None
-                entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in all_referenced
-                    ]
-                )
+        entity_candidates = list(targeted)
 
     elif target_all_entities:
         # If we target all entities, we will select all entities the user
         # is allowed to control.
-        for platform in platforms:
-            entity_candidates.extend(
-                [
-                    entity
-                    for entity in platform.entities.values()
-                    if entity_perms(entity.entity_id, POLICY_CONTROL)
-                ]
-            )
+        entity_candidates = [
+            entity
+            for entity in targeted
+            if entity_perms(entity.entity_id, POLICY_CONTROL)
+        ]
 
     else:
-        assert all_referenced is not None
-
-        for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in all_referenced:
-                    continue
-
-                if not entity_perms(entity.entity_id, POLICY_CONTROL):
-                    raise Unauthorized(
-                        context=call.context,
-                        entity_id=entity.entity_id,
-                        permission=POLICY_CONTROL,
-                    )
+        entity_candidates = []
 
-                platform_entities.append(entity)
+        for entity in targeted:
+            if not entity_perms(entity.entity_id, POLICY_CONTROL):
+                raise Unauthorized(
+                    context=call.context,
+                    entity_id=entity.entity_id,
+                    permission=POLICY_CONTROL,
+                )
 
-            entity_candidates.extend(platform_entities)
+            entity_candidates.append(entity)
 
     if not target_all_entities:
         assert referenced is not None
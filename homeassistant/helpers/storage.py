@@ -3,14 +3,22 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
+from dataclasses import dataclass
+import json
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import (
+    JSONEncoder as HAJSONEncoder,
+    json_dumps_compact,
+    json_loads,
+)
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 
@@ -20,6 +28,11 @@ from homeassistant.util import json as json_util
 STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
+JOURNAL_SUFFIX = ".journal"
+# A journal is compacted once it holds more changes than there are
+# records, but never before it holds this many changes
+JOURNAL_MIN_COMPACT_ENTRIES = 1000
+
 
 @bind_hass
 async def async_migrator(
@@ -63,6 +76,238 @@ async def async_migrator(
     return config
 
 
+@dataclass(frozen=True)
+class JournalList:
+    """A list of records in the data of a store that is journaled.
+
+    The path is the key of the list in the data, or None if the data is the
+    list itself. Changes to volatile fields alone are not journaled, they
+    are written when the journal is compacted.
+    """
+
+    path: str | None
+    record_key: Callable[[dict[str, Any]], str]
+    volatile: frozenset[str] = frozenset()
+
+
+def _dumps_entry(entry: list, encoder: type[JSONEncoder] | None) -> str:
+    """Serialize a journal entry to a single line."""
+    if encoder is HAJSONEncoder:
+        return json_dumps_compact(entry)
+    return json.dumps(entry, cls=encoder, separators=(",", ":"))
+
+
+def _records_equal(
+    record: dict[str, Any], other: dict[str, Any], volatile: frozenset[str]
+) -> bool:
+    """Return if two records are equal ignoring the volatile fields."""
+    if not volatile:
+        return record == other
+    return record.keys() == other.keys() and all(
+        value == other[key] for key, value in record.items() if key not in volatile
+    )
+
+
+class StoreJournal:
+    """Journal of the changes to the lists of records of a store.
+
+    Instead of writing all the data on every save, the records that were
+    added, changed or removed since the last save are appended to a journal
+    file next to the store file, which is replayed on load. The data is
+    written in full, compacting the journal, when the journal has grown as
+    large as the data, when data outside of the journaled lists changed and
+    when Home Assistant stops.
+
+    The store file and the journal carry a generation, so a journal that was
+    compacted into the store file is never replayed again.
+    """
+
+    def __init__(self, lists: Iterable[JournalList]) -> None:
+        """Initialize the journal."""
+        self._lists = list(lists)
+        self._generation = 0
+        # The records as last written, None if the next write has to be full
+        self._records: dict[str | None, dict[str, dict[str, Any]]] | None = None
+        self._other: Any = None
+        self._version: int | None = None
+        self._entries = 0
+
+    @property
+    def next_generation(self) -> int:
+        """Return the generation of the next full write."""
+        return self._generation + 1
+
+    def _split(self, data: Any) -> dict[str | None, dict[str, dict[str, Any]]]:
+        """Return the records of the journaled lists by key."""
+        records = {}
+        for journal_list in self._lists:
+            items = data if journal_list.path is None else data.get(journal_list.path)
+            records[journal_list.path] = {
+                journal_list.record_key(item): item for item in items or ()
+            }
+        return records
+
+    def _join(
+        self, data: Any, records: dict[str | None, dict[str, dict[str, Any]]]
+    ) -> Any:
+        """Return the data with the journaled lists replaced by the records."""
+        if None in records:
+            return list(records[None].values())
+        data = dict(data)
+        for path, path_records in records.items():
+            data[path] = list(path_records.values())
+        return data
+
+    def _other_data(self, data: Any) -> Any:
+        """Return the data that is not journaled."""
+        if not isinstance(data, dict):
+            return None
+        paths = {journal_list.path for journal_list in self._lists}
+        return {key: value for key, value in data.items() if key not in paths}
+
+    def _reset(self, generation: int, version: int, data: Any) -> None:
+        """Take the data as the records last written."""
+        self._generation = generation
+        self._records = self._split(data)
+        self._other = self._other_data(data)
+        self._version = version
+        self._entries = 0
+
+    def replay(self, journal_path: str, stored: dict[str, Any]) -> None:
+        """Apply the journal to the data loaded from the store file."""
+        self._records = None
+        generation = stored.get("journal")
+        if generation is None:
+            # Written without a journal, the next write will be full
+            return
+
+        self._generation = generation
+        entries = _read_journal(journal_path, generation)
+        if entries is None:
+            # The journal is missing or stale, the next write will be full
+            return
+        records = self._split(stored["data"])
+        for path, key, record in entries:
+            if path not in records:
+                continue
+            if record is None:
+                records[path].pop(key, None)
+            else:
+                records[path][key] = record
+        if entries:
+            stored["data"] = self._join(stored["data"], records)
+
+        self._reset(generation, stored["version"], stored["data"])
+        self._entries = len(entries)
+
+    def write_changes(
+        self,
+        journal_path: str,
+        stored: dict[str, Any],
+        encoder: type[JSONEncoder] | None,
+    ) -> bool:
+        """Append the changes since the last write to the journal.
+
+        Returns False if the data has to be written in full instead.
+        """
+        if self._records is None or stored["version"] != self._version:
+            return False
+        data = stored["data"]
+        if self._other_data(data) != self._other:
+            return False
+
+        records = self._split(data)
+        entries: list[list] = []
+        for journal_list in self._lists:
+            old = self._records[journal_list.path]
+            new = records[journal_list.path]
+            for key, record in new.items():
+                old_record = old.get(key)
+                if old_record is None or not _records_equal(
+                    old_record, record, journal_list.volatile
+                ):
+                    entries.append([journal_list.path, key, record])
+            entries.extend(
+                [journal_list.path, key, None] for key in old.keys() - new.keys()
+            )
+
+        if self._entries + len(entries) > max(
+            JOURNAL_MIN_COMPACT_ENTRIES, sum(len(recs) for recs in records.values())
+        ):
+            return False
+
+        if entries:
+            try:
+                lines = "".join(
+                    f"{_dumps_entry(entry, encoder)}\n" for entry in entries
+                )
+            except TypeError as err:
+                raise json_util.SerializationError(
+                    f"Failed to serialize to JSON: {journal_path}"
+                ) from err
+            try:
+                with open(journal_path, "a", encoding="utf-8") as fdesc:
+                    fdesc.write(lines)
+            except OSError as err:
+                # The append may have left a partial line that hides the
+                # entries appended after it, write the next save in full
+                self._records = None
+                raise json_util.WriteError(err) from err
+
+        self._records = records
+        self._entries += len(entries)
+        return True
+
+    def start(self, journal_path: str, stored: dict[str, Any], private: bool) -> None:
+        """Start a new journal after the data was written in full."""
+        self._records = None
+        header = json_dumps_compact({"journal": stored["journal"]})
+        try:
+            fdesc = os.open(
+                journal_path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                0o600 if private else 0o644,
+            )
+            with open(fdesc, "w", encoding="utf-8") as fobj:
+                fobj.write(f"{header}\n")
+        except OSError as err:
+            raise json_util.WriteError(err) from err
+        self._reset(stored["journal"], stored["version"], stored["data"])
+
+
+def _read_journal(journal_path: str, generation: int) -> list[list] | None:
+    """Read the entries of a journal of a generation.
+
+    Returns None if there is no journal of the generation.
+    """
+    try:
+        with open(journal_path, encoding="utf-8") as fdesc:
+            lines = fdesc.read().splitlines()
+    except FileNotFoundError:
+        return None
+    except OSError as err:
+        _LOGGER.exception("Journal file reading failed: %s", journal_path)
+        raise HomeAssistantError(err) from err
+
+    try:
+        header = json_loads(lines[0]) if lines else None
+    except ValueError:
+        header = None
+    if header != {"journal": generation}:
+        _LOGGER.debug("Ignoring journal of another generation: %s", journal_path)
+        return None
+
+    entries = []
+    for line in lines[1:]:
+        try:
+            entries.append(json_loads(line))
+        except ValueError:
+            # An interrupted write leaves a partial last line
+            _LOGGER.warning("Ignoring invalid entry in journal %s", journal_path)
+            break
+    return entries
+
+
 @bind_hass
 class Store:
     """Class to help storing data."""
@@ -75,8 +320,13 @@ class Store:
         private: bool = False,
         *,
         encoder: type[JSONEncoder] | None = None,
+        journal: Iterable[JournalList] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Pass the lists of records in the data as journal to only write the
+        records that changed on most saves.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -87,12 +337,18 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: asyncio.Future | None = None
         self._encoder = encoder
+        self._journal = StoreJournal(journal) if journal is not None else None
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> dict | list | None:
         """Load data.
 
@@ -124,9 +380,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data)
 
             if data == {}:
                 return None
@@ -227,14 +481,39 @@ class Store:
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self) -> dict:
+        """Load the data and replay the journal."""
+        data = json_util.load_json(self.path)
+        if data and self._journal is not None:
+            self._journal.replay(self.journal_path, data)
+        return data
+
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
+        if self._journal is not None:
+            journal_path = f"{path}{JOURNAL_SUFFIX}"
+            # Compact the journal when stopping so the next start loads fast
+            if (
+                self.hass.state
+                not in (
+                    CoreState.stopping,
+                    CoreState.final_write,
+                )
+                and self._journal.write_changes(journal_path, data, self._encoder)
+            ):
+                _LOGGER.debug("Wrote changes for %s to %s", self.key, journal_path)
+                return
+            data = {**data, "journal": self._journal.next_generation}
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_util.save_json(path, data, self._private, encoder=self._encoder)
 
+        if self._journal is not None:
+            self._journal.start(journal_path, data, self._private)
+
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -246,3 +525,7 @@ class Store:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal is not None:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
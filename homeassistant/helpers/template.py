@@ -17,9 +17,9 @@ from operator import attrgetter
 import random
 import re
 import sys
+from types import CodeType
 from typing import Any, Callable, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import pass_context
@@ -52,6 +52,7 @@ from homeassistant.helpers.typing import TemplateVarsType
 from homeassistant.loader import bind_hass
 from homeassistant.util import convert, dt as dt_util, location as loc_util
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.lru import LRU
 from homeassistant.util.thread import ThreadWithException
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -61,10 +62,14 @@ _SENTINEL = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _RENDER_INFO = "template.render_info"
+_GROUP_MEMBERS = "template.group_members"
 _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 
+# The number of compiled templates shared by templates with the same source
+COMPILE_CACHE_SIZE = 1024
+
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -73,6 +78,10 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 
 _GROUP_DOMAIN_PREFIX = "group."
 
+# Compiled code by source and kind of environment, shared by the templates
+# of all environments as hass functions are only looked up when rendering
+_COMPILE_CACHE: LRU[tuple[str, bool, bool, bool], CodeType] = LRU(COMPILE_CACHE_SIZE)
+
 _COLLECTABLE_STATE_ATTRIBUTES = {
     "state",
     "attributes",
@@ -134,6 +143,16 @@ def is_complex(value: Any) -> bool:
     return False
 
 
+def compile_cache_info() -> dict[str, int]:
+    """Return the size and the hits of the cache of compiled templates."""
+    return {
+        "size": len(_COMPILE_CACHE),
+        "maxsize": _COMPILE_CACHE.maxsize,
+        "hits": _COMPILE_CACHE.hits,
+        "misses": _COMPILE_CACHE.misses,
+    }
+
+
 def is_template_string(maybe_template: str) -> bool:
     """Check if the input is a Jinja2 template."""
     return _RE_JINJA_DELIMITERS.search(maybe_template) is not None
@@ -874,6 +893,79 @@ def result_as_boolean(template_result: str | None) -> bool:
         return False
 
 
+class _GroupMembers:
+    """The flattened members of the groups for expand.
+
+    The members of a group are resolved once and kept with the states of the
+    nested groups. They are resolved again only when the members of one of
+    these groups changed, which is rare compared to how often the state of
+    a group changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the group members."""
+        self._hass = hass
+        self._members: dict[str, _ResolvedGroup] = {}
+
+    def members(self, group_id: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Return the nested groups and the sorted entities of a group."""
+        resolved = self._members.get(group_id)
+        if resolved is None or not resolved.async_is_current(self._hass):
+            resolved = self._members[group_id] = _ResolvedGroup(self._hass, group_id)
+        return resolved.groups, resolved.entities
+
+
+class _ResolvedGroup:
+    """The nested groups and the entities of a group."""
+
+    __slots__ = ("groups", "entities", "_states")
+
+    def __init__(self, hass: HomeAssistant, group_id: str) -> None:
+        """Walk the nested groups of a group."""
+        groups: dict[str, State | None] = {}
+        entities: set[str] = set()
+        search = [group_id]
+        while search:
+            entity_id = search.pop()
+            if not entity_id.startswith(_GROUP_DOMAIN_PREFIX):
+                entities.add(entity_id)
+                continue
+            if entity_id in groups:
+                continue
+            state = groups[entity_id] = hass.states.get(entity_id)
+            if state is not None:
+                search += state.attributes.get(ATTR_ENTITY_ID) or ()
+        self.groups = tuple(groups)
+        self.entities = tuple(sorted(entities))
+        self._states = list(groups.values())
+
+    def async_is_current(self, hass: HomeAssistant) -> bool:
+        """Return if the members of the nested groups are unchanged."""
+        for index, group_id in enumerate(self.groups):
+            state = hass.states.get(group_id)
+            resolved_state = self._states[index]
+            if state is resolved_state:
+                continue
+            if (
+                state is None
+                or resolved_state is None
+                or state.attributes.get(ATTR_ENTITY_ID)
+                != resolved_state.attributes.get(ATTR_ENTITY_ID)
+            ):
+                return False
+            # Only the state of the group changed
+            self._states[index] = state
+        return True
+
+
+def _get_group_members(hass: HomeAssistant) -> _GroupMembers:
+    """Return the group members of a hass instance."""
+    group_members: _GroupMembers | None = hass.data.get(_GROUP_MEMBERS)
+    if group_members is None:
+        group_members = hass.data[_GROUP_MEMBERS] = _GroupMembers(hass)
+    return group_members
+
+
 def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
     """Expand out any groups into entity states."""
     search = list(args)
@@ -882,9 +974,6 @@ def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
         entity = search.pop()
         if isinstance(entity, str):
             entity_id = entity
-            entity = _get_state(hass, entity)
-            if entity is None:
-                continue
         elif isinstance(entity, State):
             entity_id = entity.entity_id
         elif isinstance(entity, collections.abc.Iterable):
@@ -895,14 +984,31 @@ def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
             continue
 
         if entity_id.startswith(_GROUP_DOMAIN_PREFIX):
-            # Collect state will be called in here since it's wrapped
-            group_entities = entity.attributes.get(ATTR_ENTITY_ID)
-            if group_entities:
-                search += group_entities
-        else:
-            _collect_state(hass, entity_id)
-            found[entity_id] = entity
+            groups, group_entities = _get_group_members(hass).members(entity_id)
+            # Collect the group like reading its members would
+            if isinstance(entity, str):
+                _collect_state(hass, entity_id)
+            elif isinstance(entity, TemplateState):
+                entity._collect_state()  # pylint: disable=protected-access
+            for group_id in groups[1:]:
+                _collect_state(hass, group_id)
+            for member_id in group_entities:
+                if member_id in found:
+                    continue
+                member = _get_state(hass, member_id)
+                if member is not None:
+                    _collect_state(hass, member_id)
+                    found[member_id] = member
+            continue
 
+        if isinstance(entity, str):
+            entity = _get_state(hass, entity)
+            if entity is None:
+                continue
+        _collect_state(hass, entity_id)
+        found[entity_id] = entity
+
+    # The members of a group are sorted, so this is linear for a single group
     return sorted(found.values(), key=lambda a: a.entity_id)
 
 
@@ -1448,7 +1554,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        self._cache_key = (hass is None, bool(limited), bool(strict))
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1603,10 +1709,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
-
-        if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+        key = (source, *self._cache_key)
+        if (cached := _COMPILE_CACHE.get(key)) is None:
+            cached = _COMPILE_CACHE[key] = super().compile(source)
 
         return cached
 
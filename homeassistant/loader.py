@@ -13,7 +13,9 @@ import importlib
 import json
 import logging
 import pathlib
+import stat
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
 
@@ -23,6 +25,7 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 
+from homeassistant.const import __version__
 from homeassistant.generated.dhcp import DHCP
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
@@ -45,6 +48,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_CACHE = "manifest_cache"
+DATA_IMPORT_TIME = "import_time"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -58,6 +63,10 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 60
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -100,6 +109,114 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class ManifestCache:
+    """Cache of parsed manifests that is stored between runs.
+
+    A cached manifest is used as long as the modification time and size
+    of its manifest.json file are unchanged, so a start only has to stat
+    the manifest files instead of reading and parsing all of them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest cache."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.helpers.storage import Store
+
+        self._store = Store(
+            hass,
+            MANIFEST_CACHE_STORAGE_VERSION,
+            MANIFEST_CACHE_STORAGE_KEY,
+            private=True,
+        )
+        self._manifests: dict[str, dict[str, Any]] = {}
+        self._changed = False
+
+    async def async_load(self) -> None:
+        """Load the manifests stored by a previous run."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.exceptions import HomeAssistantError
+
+        try:
+            data = await self._store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to load the manifest cache: %s", err)
+            return
+
+        # The manifests of built-in integrations change with the version
+        if isinstance(data, dict) and data.get("ha_version") == __version__:
+            self._manifests = data["manifests"]
+
+    def get(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the manifest of a manifest.json file.
+
+        Returns None if the file does not exist. Raises ValueError if the
+        file does not contain valid JSON.
+
+        This method must be run in the executor.
+        """
+        key = str(manifest_path)
+        try:
+            file_stat = manifest_path.stat()
+        except OSError:
+            file_stat = None
+
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            if self._manifests.pop(key, None) is not None:
+                self._changed = True
+            return None
+
+        entry = self._manifests.get(key)
+        if (
+            entry is None
+            or entry["mtime"] != file_stat.st_mtime_ns
+            or entry["size"] != file_stat.st_size
+        ):
+            entry = self._manifests[key] = {
+                "mtime": file_stat.st_mtime_ns,
+                "size": file_stat.st_size,
+                "manifest": json.loads(manifest_path.read_text()),
+            }
+            self._changed = True
+
+        # Integrations add keys to their manifest
+        return cast(Manifest, dict(entry["manifest"]))
+
+    def async_schedule_save(self) -> None:
+        """Schedule saving the cache if manifests were parsed or removed.
+
+        This method must be run in the event loop.
+        """
+        if not self._changed:
+            return
+        self._changed = False
+        self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the manifest cache to store."""
+        return {"ha_version": __version__, "manifests": dict(self._manifests)}
+
+
+async def async_get_manifest_cache(hass: HomeAssistant) -> ManifestCache:
+    """Return the manifest cache, loading it on first use."""
+    cache_or_evt = hass.data.get(DATA_MANIFEST_CACHE)
+
+    if cache_or_evt is None:
+        evt = hass.data[DATA_MANIFEST_CACHE] = asyncio.Event()
+
+        cache = ManifestCache(hass)
+        await cache.async_load()
+
+        hass.data[DATA_MANIFEST_CACHE] = cache
+        evt.set()
+        return cache
+
+    if isinstance(cache_or_evt, asyncio.Event):
+        await cache_or_evt.wait()
+        return cast(ManifestCache, hass.data[DATA_MANIFEST_CACHE])
+
+    return cast(ManifestCache, cache_or_evt)
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -125,6 +242,7 @@ async def _async_get_custom_components(
         get_sub_directories, custom_components.__path__
     )
 
+    manifest_cache = await async_get_manifest_cache(hass)
     integrations = await gather_with_concurrency(
         MAX_LOAD_CONCURRENTLY,
         *(
@@ -134,6 +252,7 @@ async def _async_get_custom_components(
             for comp in dirs
         ),
     )
+    manifest_cache.async_schedule_save()
 
     return {
         integration.domain: integration
@@ -297,20 +416,29 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
+        if not isinstance(manifest_cache, ManifestCache):
+            manifest_cache = None
+
         for base in root_module.__path__:  # type: ignore
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = json.loads(manifest_path.read_text())
+                if manifest_cache is not None:
+                    manifest = manifest_cache.get(manifest_path)
+                elif manifest_path.is_file():
+                    manifest = json.loads(manifest_path.read_text())
+                else:
+                    manifest = None
             except ValueError as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
 
+            if manifest is None:
+                continue
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
@@ -513,7 +641,7 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = self._import(self.domain, self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -526,7 +654,20 @@ class Integration:
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._import(
+            f"{self.domain}.{platform_name}", f"{self.pkg_path}.{platform_name}"
+        )
+
+    def _import(self, name: str, path: str) -> ModuleType:
+        """Import a module of the integration and record the time it took."""
+        start = timer()
+        module = importlib.import_module(path)
+        # When the module is imported by several threads at once, the first
+        # import to finish is the one that did the work
+        self.hass.data.setdefault(DATA_IMPORT_TIME, {}).setdefault(
+            name, timer() - start
+        )
+        return module
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -579,9 +720,12 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    if integration := await hass.async_add_executor_job(
+    manifest_cache = await async_get_manifest_cache(hass)
+    integration = await hass.async_add_executor_job(
         Integration.resolve_from_root, hass, components, domain
-    ):
+    )
+    manifest_cache.async_schedule_save()
+    if integration:
         return integration
 
     raise IntegrationNotFound(domain)
@@ -5,17 +5,17 @@ import argparse
 import asyncio
 import collections
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import logging
 from timeit import default_timer as timer
 from typing import Callable, TypeVar
 
-from homeassistant import core
+from homeassistant import config_entries, core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_dumps, json_loads
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -252,6 +252,68 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_filtered_listeners(hass):
+    """Fire 10k state changed events with 10k listeners that filter by entity_id."""
+
+    def listen(entity_id, listener):
+        @core.callback
+        def event_filter(event):
+            """Filter event."""
+            return event.data["entity_id"] == entity_id
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener, event_filter)
+
+    return await _state_changed_entity_listeners(hass, listen)
+
+
+@benchmark
+async def state_changed_keyed_listeners(hass):
+    """Fire 10k state changed events with 10k listeners keyed by entity_id."""
+
+    def listen(entity_id, listener):
+        hass.bus.async_listen_keyed(EVENT_STATE_CHANGED, [entity_id], listener)
+
+    return await _state_changed_entity_listeners(hass, listen)
+
+
+async def _state_changed_entity_listeners(hass, listen):
+    """Fire state changed events with a listener per entity."""
+    count = 0
+    entity_count = 10 ** 4
+    events_to_fire = 10 ** 4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    entity_ids = [f"light.kitchen_{idx}" for idx in range(entity_count)]
+    for entity_id in entity_ids:
+        listen(entity_id, listener)
+
+    events_data = [
+        {
+            "entity_id": entity_id,
+            "old_state": core.State(entity_id, "off"),
+            "new_state": core.State(entity_id, "on"),
+        }
+        for entity_id in entity_ids[:100]
+    ]
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, events_data[idx % 100])
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def logbook_filtering_state(hass):
     """Filter state changes."""
@@ -390,6 +452,217 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+def _realistic_states(count):
+    """Return states with attributes like those of a real installation."""
+    now = dt_util.utcnow()
+    return [
+        core.State(
+            f"sensor.power_{i}",
+            str(i * 1.5),
+            {
+                "friendly_name": f"Power {i}",
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+                "last_reset": now,
+                "supported_features": {1, 2, 4},
+                "hs_color": (30.0, 55.5),
+            },
+            last_changed=now,
+            last_updated=now,
+        )
+        for i in range(count)
+    ]
+
+
+@benchmark
+async def json_encode_states(hass):
+    """Encode 100k realistic states with json_dumps."""
+    states = [state.as_dict() for state in _realistic_states(10 ** 5)]
+
+    start = timer()
+    for state in states:
+        json_dumps(state)
+    return timer() - start
+
+
+@benchmark
+async def json_decode_states(hass):
+    """Decode 100k realistic states with json_loads."""
+    states = [json_dumps(state) for state in _realistic_states(10 ** 5)]
+
+    start = timer()
+    for state in states:
+        json_loads(state)
+    return timer() - start
+
+
+@benchmark
+async def statistics_sensor_large_window(hass):
+    """Update a statistics sensor with a 10k window 100k times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.statistics.sensor import StatisticsSensor
+
+    sensor = StatisticsSensor("sensor.test", "test", 10 ** 4, None, 2, 4, "exclusive")
+    now = dt_util.utcnow()
+    states = [
+        core.State("sensor.test", str(value % 997 / 10), last_updated=now)
+        for value in range(10 ** 5)
+    ]
+
+    start = timer()
+    for state in states:
+        # pylint: disable=protected-access
+        sensor._add_state_to_queue(state)
+        await sensor.async_update()
+    return timer() - start
+
+
+@benchmark
+async def compile_statistics_many_sensors(hass):
+    """Compile an hour of statistics of 4k sensors with 60 states each."""
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    from homeassistant.components.recorder import models, statistics
+    from homeassistant.components.recorder.const import DATA_INSTANCE
+    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.components.sensor import recorder as sensor_recorder
+    from homeassistant.setup import async_setup_component
+
+    hass.config.config_dir = tempfile.mkdtemp()
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await async_setup_component(hass, "recorder", {"recorder": {"db_url": "sqlite://"}})
+    await async_setup_component(hass, "sensor", {})
+    await hass.async_block_till_done()
+
+    end = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    start = end - timedelta(hours=1)
+    sensors = {}
+    for i in range(2000):
+        sensors[f"sensor.power_{i}"] = {
+            "device_class": "power",
+            "state_class": "measurement",
+            "unit_of_measurement": "kW",
+        }
+        sensors[f"sensor.energy_{i}"] = {
+            "device_class": "energy",
+            "state_class": "total_increasing",
+            "unit_of_measurement": "Wh",
+        }
+    for entity_id, attributes in sensors.items():
+        hass.states.async_set(entity_id, "0", attributes)
+
+    def record_states():
+        with session_scope(hass=hass) as session:
+            for minute in range(-60, 60):
+                when = start + timedelta(minutes=minute)
+                session.bulk_save_objects(
+                    models.States(
+                        entity_id=entity_id,
+                        domain="sensor",
+                        state=str((minute + 60) * 1.5),
+                        attributes=json.dumps(attributes),
+                        last_changed=when,
+                        last_updated=when,
+                    )
+                    for entity_id, attributes in sensors.items()
+                )
+
+    await hass.async_add_executor_job(record_states)
+    # Compile the previous hour so the sums continue from earlier statistics
+    await hass.async_add_executor_job(
+        statistics.compile_statistics,
+        hass.data[DATA_INSTANCE],
+        start - timedelta(hours=1),
+    )
+
+    timer_start = timer()
+    result = await hass.async_add_executor_job(
+        sensor_recorder.compile_statistics, hass, start, end
+    )
+    elapsed = timer() - timer_start
+    assert len(result) == len(sensors)
+    return elapsed
+
+
+@benchmark
+async def entity_service_call_single(hass):
+    """Call an entity service on a single light of 1500 lights 10k times."""
+    return await _entity_service_calls(hass, {"entity_id": "light.bench_0"}, 10 ** 4, 1)
+
+
+@benchmark
+async def entity_service_call_area(hass):
+    """Call an entity service on an area with 10 of 1500 lights 10k times."""
+    return await _entity_service_calls(hass, {"area_id": "kitchen"}, 10 ** 4, 10)
+
+
+@benchmark
+async def entity_service_call_all(hass):
+    """Call an entity service on all of 1500 lights 100 times."""
+    return await _entity_service_calls(hass, {"entity_id": "all"}, 100, 1500)
+
+
+async def _entity_service_calls(hass, service_data, calls, targeted):
+    """Call an entity service on 1500 lights, 10 of them in the kitchen."""
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    from homeassistant.helpers import (
+        area_registry,
+        config_validation as cv,
+        device_registry,
+        entity,
+        entity_registry,
+    )
+    from homeassistant.helpers.entity_component import EntityComponent
+
+    count = 0
+
+    class BenchLight(entity.Entity):
+        """A light that counts the service calls."""
+
+        @core.callback
+        def async_bench(self):
+            """Count the service call."""
+            nonlocal count
+            count += 1
+
+    hass.config.config_dir = tempfile.mkdtemp()
+    await asyncio.gather(
+        area_registry.async_load(hass),
+        device_registry.async_load(hass),
+        entity_registry.async_load(hass),
+    )
+    area_registry.async_get(hass).async_create("Kitchen")
+
+    component = EntityComponent(logging.getLogger(__name__), "light", hass)
+    lights = []
+    for idx in range(1500):
+        light = BenchLight()
+        light.entity_id = f"light.bench_{idx}"
+        light._attr_unique_id = str(idx)  # pylint: disable=protected-access
+        lights.append(light)
+    await component.async_add_entities(lights)
+
+    ent_reg = entity_registry.async_get(hass)
+    for idx in range(10):
+        ent_reg.async_update_entity(f"light.bench_{idx}", area_id="kitchen")
+    component.async_register_entity_service(
+        "bench", cv.make_entity_service_schema({}), "async_bench"
+    )
+
+    start = timer()
+
+    for _ in range(calls):
+        await hass.services.async_call("light", "bench", service_data, blocking=True)
+
+    elapsed = timer() - start
+    assert count == calls * targeted
+    return elapsed
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -0,0 +1,82 @@
+"""Size bounded least recently used mapping."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import ItemsView, Iterator, MutableMapping
+from typing import Generic, TypeVar, overload
+
+_KT = TypeVar("_KT")
+_VT = TypeVar("_VT")
+_T = TypeVar("_T")
+
+
+class LRU(MutableMapping[_KT, _VT], Generic[_KT, _VT]):
+    """A mapping that evicts the least recently used key when it is full.
+
+    Reading a key with get or [] marks it as recently used and is
+    counted as a hit or a miss.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the mapping."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[_KT, _VT] = OrderedDict()
+
+    def __getitem__(self, key: _KT) -> _VT:
+        """Return the value for a key and mark it as recently used."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    @overload
+    def get(self, key: _KT) -> _VT | None:
+        ...
+
+    @overload
+    def get(self, key: _KT, default: _VT | _T) -> _VT | _T:
+        ...
+
+    def get(self, key: _KT, default: _VT | _T | None = None) -> _VT | _T | None:
+        """Return the value for a key if it is present."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        """Set a value and evict the least recently used key if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __delitem__(self, key: _KT) -> None:
+        """Remove a key."""
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Return if a key is present without marking it as used."""
+        return key in self._data
+
+    def __iter__(self) -> Iterator[_KT]:
+        """Iterate over the keys from least to most recently used."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self._data)
+
+    def items(self) -> ItemsView[_KT, _VT]:
+        """Return the items without marking them as used."""
+        return self._data.items()
+
+    def clear(self) -> None:
+        """Remove all keys."""
+        self._data.clear()
@@ -613,6 +613,52 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == 200
 
 
+async def test_fetch_period_api_with_max_points(hass, hass_client):
+    """Test the fetch period view for history with max_points."""
+    start = dt_util.utcnow()
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    # The points are selected by their time, so record them at fixed times
+    for value in range(20):
+        with patch(
+            "homeassistant.core.dt_util.utcnow",
+            return_value=start + timedelta(seconds=value + 1),
+        ):
+            hass.states.async_set("sensor.power", value % 7)
+        await hass.async_block_till_done()
+    with patch(
+        "homeassistant.core.dt_util.utcnow", return_value=start + timedelta(seconds=21)
+    ):
+        hass.states.async_set("sensor.power", "unavailable")
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?minimal_response&max_points=6"
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert len(response_json) == 1
+    states = [state["state"] for state in response_json[0]]
+    assert len(states) == 6
+    assert states == ["0", "6", "0", "6", "5", "unavailable"]
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?minimal_response&max_points=2"
+    )
+    assert response.status == 400
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?max_points=cats"
+    )
+    assert response.status == 400
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -830,6 +876,54 @@ async def test_entity_ids_limit_via_api_with_skip_initial_state(hass, hass_clien
     assert response_json[1][0]["entity_id"] == "light.cow"
 
 
+async def test_columnar_history_during_period(hass, hass_ws_client):
+    """Test columnar_history_during_period."""
+    now = dt_util.utcnow()
+
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    hass.states.async_set("sensor.test", "1.5")
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.test", "unknown")
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/columnar_history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test", "light.kitchen"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result.keys() == {"sensor.test", "light.kitchen"}
+    assert result["sensor.test"]["n"] == [1.5, None]
+    assert len(result["sensor.test"]["t"]) == 2
+    assert result["light.kitchen"]["s"] == ["on"]
+    assert result["light.kitchen"]["i"] == [0]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/columnar_history_during_period",
+            "start_time": now.isoformat(),
+            "end_time": "dogs",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_end_time"
+
+
 POWER_SENSOR_ATTRIBUTES = {
     "device_class": "power",
     "state_class": "measurement",
@@ -875,7 +969,7 @@ async def test_statistics_during_period(
     await hass.async_add_executor_job(trigger_db_commit, hass)
     await hass.async_block_till_done()
 
-    hass.data[recorder.DATA_INSTANCE].do_adhoc_statistics(period="hourly", start=now)
+    hass.data[recorder.DATA_INSTANCE].do_adhoc_statistics(start=now)
     await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
 
     client = await hass_ws_client()
@@ -884,6 +978,7 @@ async def test_statistics_during_period(
             "id": 1,
             "type": "history/statistics_during_period",
             "start_time": now.isoformat(),
+            "period": "5minute",
             "end_time": now.isoformat(),
             "statistic_ids": ["sensor.test"],
         }
@@ -898,6 +993,7 @@ async def test_statistics_during_period(
             "id": 1,
             "type": "history/statistics_during_period",
             "start_time": now.isoformat(),
+            "period": "5minute",
             "statistic_ids": ["sensor.test"],
         }
     )
@@ -959,6 +1055,7 @@ async def test_statistics_during_period_bad_end_time(hass, hass_ws_client):
             "id": 1,
             "type": "history/statistics_during_period",
             "start_time": now.isoformat(),
+            "period": "5minute",
             "end_time": "dogs",
         }
     )
@@ -1007,7 +1104,7 @@ async def test_list_statistic_ids(hass, hass_ws_client, units, attributes, unit)
         {"statistic_id": "sensor.test", "unit_of_measurement": unit}
     ]
 
-    hass.data[recorder.DATA_INSTANCE].do_adhoc_statistics(period="hourly", start=now)
+    hass.data[recorder.DATA_INSTANCE].do_adhoc_statistics(start=now)
     await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
     # Remove the state, statistics will now be fetched from the database
     hass.states.async_remove("sensor.test")
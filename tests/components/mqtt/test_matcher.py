@@ -0,0 +1,74 @@
+"""The tests for the MQTT topic matcher."""
+import pytest
+
+from homeassistant.components.mqtt.matcher import TopicMatcher
+
+
+@pytest.mark.parametrize(
+    "topic_filter, topic, match",
+    [
+        ("a/b/c", "a/b/c", True),
+        ("a/b/c", "a/b", False),
+        ("a/b", "a/b/c", False),
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a//c", True),
+        ("a/+/c", "a/b/d", False),
+        ("a/+", "a/b/c", False),
+        ("+/+", "/b", True),
+        ("a/#", "a/b/c", True),
+        ("a/#", "a", True),
+        ("a/#", "b/c", False),
+        ("#", "a/b/c", True),
+        ("+/b/#", "a/b", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_match(topic_filter, topic, match):
+    """Test matching the wildcards of topic filters."""
+    matcher = TopicMatcher()
+    matcher.add(topic_filter, "item")
+
+    assert matcher.match(topic) == (["item"] if match else [])
+
+
+def test_add_remove():
+    """Test adding and removing items."""
+    matcher = TopicMatcher()
+    matcher.add("home/+/temperature", 1)
+    matcher.add("home/#", 2)
+    matcher.add("home/+/temperature", 3)
+
+    assert sorted(matcher.match("home/kitchen/temperature")) == [1, 2, 3]
+    assert matcher.has_topic_filter("home/+/temperature")
+
+    matcher.remove("home/+/temperature", 1)
+    assert sorted(matcher.match("home/kitchen/temperature")) == [2, 3]
+
+    matcher.remove("home/+/temperature", 3)
+    assert matcher.match("home/kitchen/temperature") == [2]
+    assert not matcher.has_topic_filter("home/+/temperature")
+    assert not matcher.has_topic_filter("home/+")
+
+    matcher.remove("home/#", 2)
+    assert matcher.match("home/kitchen/temperature") == []
+    assert not matcher.has_topic_filter("home/#")
+
+    with pytest.raises(ValueError):
+        matcher.remove("home/#", 2)
+    with pytest.raises(ValueError):
+        matcher.remove("other/topic", 2)
+
+
+def test_match_is_cached():
+    """Test the matches are cached until the topic filters change."""
+    matcher = TopicMatcher()
+    matcher.add("home/+/temperature", 1)
+
+    matches = matcher.match("home/kitchen/temperature")
+    assert matcher.match("home/kitchen/temperature") is matches
+
+    matcher.add("home/kitchen/temperature", 2)
+    assert sorted(matcher.match("home/kitchen/temperature")) == [1, 2]
@@ -12,7 +12,9 @@ from homeassistant.components.profiler import (
     SERVICE_MEMORY,
     SERVICE_START,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_LOOP_MONITOR,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_LOOP_MONITOR,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
@@ -192,3 +194,46 @@ async def test_log_scheduled(hass, caplog):
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_loop_monitor(hass, hass_ws_client):
+    """Test the loop monitor is opt-in and reports the jobs and the lag."""
+
+    await setup.async_setup_component(hass, "persistent_notification", {})
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/loop_monitor"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"running": False, "loop_lag_ms": None, "jobs": []}
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_LOOP_MONITOR, {}, True)
+    hass.bus.async_listen("test_event", lambda event: None)
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 2, "type": "profiler/loop_monitor", "limit": 50})
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["running"]
+    assert any(
+        job["owner"] == "tests.components.profiler.test_init"
+        for job in msg["result"]["jobs"]
+    )
+
+    assert hass.states.get("sensor.slowest_integration") is not None
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_LOOP_MONITOR, {}, True)
+    await client.send_json({"id": 3, "type": "profiler/loop_monitor"})
+    msg = await client.receive_json()
+    assert not msg["result"]["running"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,79 @@
+"""Test the job monitor of the profiler."""
+import asyncio
+from functools import partial
+import time
+from unittest.mock import patch
+
+from homeassistant.components.profiler import monitor
+from homeassistant.components.profiler.monitor import JobMonitor, job_owner
+from homeassistant.core import HassJob, callback
+
+
+def test_job_owner():
+    """Test the owner of a job is the integration of its module."""
+
+    def target():
+        """Target of a job."""
+
+    assert job_owner(target) == "tests.components.profiler.test_monitor"
+    target.__module__ = "homeassistant.components.light.group"
+    assert job_owner(partial(partial(target), 1)) == "light"
+    target.__module__ = "custom_components.my_light.light"
+    assert job_owner(target) == "my_light"
+
+
+async def test_job_monitor(hass):
+    """Test the jobs are measured while the monitor runs."""
+    job_monitor = JobMonitor(hass)
+
+    @callback
+    def slow_callback():
+        time.sleep(0.01)
+
+    async def slow_coroutine():
+        time.sleep(0.01)
+        await asyncio.sleep(0)
+        time.sleep(0.01)
+
+    def executor_job():
+        time.sleep(0.01)
+
+    hass.async_add_hass_job(HassJob(slow_callback))
+    await hass.async_block_till_done()
+    assert job_monitor.async_report() == {
+        "running": False,
+        "loop_lag_ms": None,
+        "jobs": [],
+    }
+
+    with patch.object(monitor, "LAG_INTERVAL", 0.001):
+        job_monitor.async_start()
+        hass.async_add_hass_job(HassJob(slow_callback))
+        hass.async_run_hass_job(HassJob(slow_callback))
+        hass.async_add_hass_job(HassJob(slow_coroutine))
+        await hass.async_add_executor_job(executor_job)
+        await hass.async_block_till_done()
+        await asyncio.sleep(0.01)
+        job_monitor.async_stop()
+
+    jobs = {
+        stats.kind: stats
+        for stats in job_monitor.async_top_jobs()
+        if stats.owner == "tests.components.profiler.test_monitor"
+    }
+    assert jobs["callback"].count == 2
+    assert jobs["callback"].total >= 0.02
+    assert jobs["coroutine"].count == 1
+    assert jobs["coroutine"].total >= 0.02
+    assert 0.01 <= jobs["coroutine"].max < jobs["coroutine"].total
+    assert jobs["executor"].count == 1
+
+    lag = job_monitor.async_loop_lag()
+    assert lag is not None
+    assert lag["p50"] <= lag["p90"] <= lag["p99"] <= lag["max"]
+
+    # Stopped monitors do not measure
+    hass.async_add_hass_job(HassJob(slow_callback))
+    await hass.async_block_till_done()
+    assert jobs["callback"].count == 2
+    assert not job_monitor.async_report()["running"]
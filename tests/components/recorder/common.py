@@ -1,12 +1,9 @@
 """Common test utils for working with recorder."""
-from datetime import timedelta
-
 from homeassistant import core as ha
 from homeassistant.components import recorder
 from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
 
-from tests.common import async_fire_time_changed, fire_time_changed
+from tests.common import threadsafe_callback_factory
 
 DEFAULT_PURGE_TASKS = 3
 
@@ -25,13 +22,6 @@ async def async_wait_recording_done_without_instance(hass: HomeAssistant) -> Non
     await hass.loop.run_in_executor(None, wait_recording_done, hass)
 
 
-def trigger_db_commit(hass: HomeAssistant) -> None:
-    """Force the recorder to commit."""
-    for _ in range(recorder.DEFAULT_COMMIT_INTERVAL):
-        # We only commit on time change
-        fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
-
-
 async def async_wait_recording_done(
     hass: HomeAssistant,
     instance: recorder.Recorder,
@@ -63,8 +53,11 @@ async def async_wait_purge_done(
 @ha.callback
 def async_trigger_db_commit(hass: HomeAssistant) -> None:
     """Fore the recorder to commit. Async friendly."""
-    for _ in range(recorder.DEFAULT_COMMIT_INTERVAL):
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    hass.data[recorder.DATA_INSTANCE].queue.put(recorder.CommitTask())
+
+
+# Go through the event loop so the commit is queued after the events
+trigger_db_commit = threadsafe_callback_factory(async_trigger_db_commit)
 
 
 async def async_recorder_block_till_done(
@@ -358,6 +358,135 @@ def test_get_significant_states_only(hass_recorder):
     assert states == hist[entity_id]
 
 
+def test_get_significant_states_max_points(hass_recorder):
+    """Test numeric states are downsampled when max_points is set."""
+    hass = hass_recorder()
+    zero = dt_util.utcnow()
+
+    values = [0, 1, 0, 1, 9, 1, 0, 1, 0, 1, 0, 1]
+    for value in values:
+        hass.states.set("sensor.power", value)
+        hass.states.set("sensor.mode", f"mode {value}")
+    wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass, zero, include_start_time_state=False, max_points=5
+    )
+    states = [state.state for state in hist["sensor.power"]]
+    assert len(states) == 5
+    # The first and last states and the peak are always kept
+    assert states[0] == "0"
+    assert "9" in states
+    assert states[-1] == "1"
+    # The states of entities without numeric states are spread evenly
+    assert [state.state for state in hist["sensor.mode"]] == [
+        "mode 0",
+        "mode 1",
+        "mode 0",
+        "mode 0",
+        "mode 1",
+    ]
+
+    hist = history.get_significant_states(
+        hass, zero, include_start_time_state=False, max_points=len(values)
+    )
+    assert [state.state for state in hist["sensor.power"]] == [
+        str(value) for value in values
+    ]
+
+
+def test_get_significant_states_max_points_limit(hass_recorder):
+    """Test max_points limits all the states, not only the numeric ones."""
+    hass = hass_recorder()
+
+    hass.states.set("sensor.power", "5")
+    wait_recording_done(hass)
+    start = dt_util.utcnow()
+    for value in range(30):
+        hass.states.set("sensor.power", "unavailable" if value % 2 else value)
+    wait_recording_done(hass)
+
+    hist = history.get_significant_states(hass, start, max_points=6)
+    states = [state.state for state in hist["sensor.power"]]
+    assert len(states) == 6
+    # The state at the start time counts towards max_points
+    assert states[0] == "5"
+    # The numeric states keep the shape, the others are spread evenly
+    assert states[1:3] == ["0", "unavailable"]
+    assert states[-2:] == ["28", "unavailable"]
+
+    hist = history.get_significant_states(hass, start, max_points=3)
+    assert [state.state for state in hist["sensor.power"]] == ["5", "0", "28"]
+
+
+def test_get_significant_states_columnar(hass_recorder):
+    """Test the columnar history matches the significant states."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    hist = history.get_significant_states_columnar(hass, zero, four)
+
+    assert hist.keys() == states.keys()
+    for entity_id, entity_states in states.items():
+        # The attribute only change of the thermostat is skipped
+        changes = [
+            state
+            for idx, state in enumerate(entity_states)
+            if idx == 0 or state.state != entity_states[idx - 1].state
+        ]
+        columns = hist[entity_id]
+        assert len(columns) == len(changes)
+        assert columns.as_dict()["t"] == [
+            int(state.last_changed.timestamp() * 1000) for state in changes
+        ]
+    assert len(hist["thermostat.test"]) == len(states["thermostat.test"]) - 1
+
+
+def test_get_significant_states_columnar_repeated_states(hass_recorder):
+    """Test the columnar history skips rows that repeat the state."""
+    hass = hass_recorder()
+    zero = dt_util.utcnow()
+
+    for idx, state in enumerate(("home", "home", "not_home", "not_home", "home")):
+        hass.states.set("device_tracker.phone", state, {"battery": idx})
+        wait_recording_done(hass)
+
+    hist = history.get_significant_states_columnar(hass, zero)
+    minimal = history.get_significant_states(hass, zero, minimal_response=True)
+
+    phone = hist["device_tracker.phone"].as_dict()
+    assert phone["s"] == ["home", "not_home"]
+    assert phone["i"] == [0, 1, 0]
+    assert len(phone["t"]) == len(minimal["device_tracker.phone"]) == 3
+
+
+def test_get_significant_states_columnar_entity_ids(hass_recorder):
+    """Test the columnar history of numeric and non numeric entities."""
+    hass = hass_recorder()
+    zero = dt_util.utcnow()
+
+    for state in ("10", "unavailable", "10", "12.5"):
+        hass.states.set("sensor.power", state)
+        hass.states.set("sensor.mode", "on" if state == "10" else "off")
+        wait_recording_done(hass)
+
+    hist = history.get_significant_states_columnar(
+        hass,
+        zero,
+        entity_ids=["sensor.power", "sensor.mode", "sensor.missing"],
+        include_start_time_state=False,
+    )
+
+    assert list(hist) == ["sensor.power", "sensor.mode"]
+    power = hist["sensor.power"].as_dict()
+    assert power["n"] == [10.0, None, 10.0, 12.5]
+    assert "s" not in power
+    mode = hist["sensor.mode"].as_dict()
+    assert mode["s"] == ["on", "off"]
+    assert mode["i"] == [0, 1, 0, 1]
+    assert len(mode["t"]) == 4
+    assert "n" not in mode
+
+
 def record_states(hass):
     """Record some test states.
 
@@ -10,6 +10,7 @@ from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
+    CONF_CONTINUOUS_PURGE,
     CONF_DB_URL,
     CONFIG_SCHEMA,
     DOMAIN,
@@ -28,6 +29,7 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -37,6 +39,8 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
@@ -46,6 +50,7 @@ from homeassistant.setup import async_setup_component, setup_component
 from homeassistant.util import dt as dt_util
 
 from .common import (
+    async_recorder_block_till_done,
     async_wait_recording_done,
     async_wait_recording_done_without_instance,
     corrupt_db_file,
@@ -66,6 +71,7 @@ def _default_recorder(hass):
     return Recorder(
         hass,
         auto_purge=True,
+        continuous_purge=False,
         keep_days=7,
         commit_interval=1,
         uri="sqlite://",
@@ -73,6 +79,7 @@ def _default_recorder(hass):
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_t=[],
+        bulk_writes=False,
     )
 
 
@@ -199,6 +206,28 @@ async def test_saving_state_with_intermixed_time_changes(
         assert db_states[0].event_id > 0
 
 
+async def test_commit_and_keep_alive_are_scheduled(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the recorder commits and keeps the connection alive on its own timers."""
+    instance = await async_setup_recorder_instance(hass)
+    assert not hass.bus.async_has_listeners(EVENT_TIME_CHANGED)
+
+    hass.states.async_set("test.recorder", "on")
+    await hass.async_block_till_done()
+
+    with patch.object(instance, "_send_keep_alive") as send_keep_alive:
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=KEEPALIVE_TIME + 1)
+        )
+        await hass.async_block_till_done()
+        await async_recorder_block_till_done(hass, instance)
+
+    assert send_keep_alive.called
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 1
+
+
 def test_saving_state_with_exception(hass, hass_recorder, caplog):
     """Test saving and restoring a state."""
     hass = hass_recorder()
@@ -690,6 +719,60 @@ def test_auto_purge_disabled(hass_recorder):
     dt_util.set_default_time_zone(original_tz)
 
 
+def test_continuous_purge(hass_recorder):
+    """Test the purge is scheduled every hour instead of nightly when continuous."""
+    hass = hass_recorder({CONF_CONTINUOUS_PURGE: True})
+
+    original_tz = dt_util.DEFAULT_TIME_ZONE
+
+    tz = dt_util.get_time_zone("Europe/Copenhagen")
+    dt_util.set_default_time_zone(tz)
+
+    # The purge is scheduled to happen at 12 minutes past every hour
+    #
+    # The clock is started at 4:15am then advanced forward below
+    now = dt_util.utcnow()
+    test_time = datetime(now.year + 2, 1, 1, 4, 15, 0, tzinfo=tz)
+    run_tasks_at_time(hass, test_time)
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+    ) as purge_old_data, patch(
+        "homeassistant.components.recorder.perodic_db_cleanups"
+    ) as perodic_db_cleanups:
+        # Advance one hour, and the purge task should run
+        test_time = test_time + timedelta(hours=1)
+        run_tasks_at_time(hass, test_time)
+        assert len(purge_old_data.mock_calls) == 1
+        assert len(perodic_db_cleanups.mock_calls) == 1
+
+        purge_old_data.reset_mock()
+        perodic_db_cleanups.reset_mock()
+
+        # Advance less than one hour. The alarm should not yet fire.
+        test_time = test_time + timedelta(minutes=50)
+        run_tasks_at_time(hass, test_time)
+        assert len(purge_old_data.mock_calls) == 0
+        assert len(perodic_db_cleanups.mock_calls) == 0
+
+        # Advance past the next hour and fire the alarm again
+        test_time = test_time + timedelta(minutes=10)
+        run_tasks_at_time(hass, test_time)
+        assert len(purge_old_data.mock_calls) == 1
+        assert len(perodic_db_cleanups.mock_calls) == 1
+
+        purge_old_data.reset_mock()
+        perodic_db_cleanups.reset_mock()
+
+        # The nightly tasks only run the cleanups
+        test_time = datetime(now.year + 2, 1, 2, 4, 13, 0, tzinfo=tz)
+        run_tasks_at_time(hass, test_time)
+        assert len(purge_old_data.mock_calls) == 1
+        assert len(perodic_db_cleanups.mock_calls) == 2
+
+    dt_util.set_default_time_zone(original_tz)
+
+
 @pytest.mark.parametrize("enable_statistics", [True])
 def test_auto_statistics(hass_recorder):
     """Test periodic statistics scheduling."""
@@ -700,41 +783,41 @@ def test_auto_statistics(hass_recorder):
     tz = dt_util.get_time_zone("Europe/Copenhagen")
     dt_util.set_default_time_zone(tz)
 
-    # Statistics is scheduled to happen at *:12am every hour. Exercise this behavior by
+    # Statistics is scheduled to happen every 5 minutes. Exercise this behavior by
     # firing time changed events and advancing the clock around this time. Pick an
     # arbitrary year in the future to avoid boundary conditions relative to the current
     # date.
     #
-    # The clock is started at 4:15am then advanced forward below
+    # The clock is started at 4:16am then advanced forward below
     now = dt_util.utcnow()
-    test_time = datetime(now.year + 2, 1, 1, 4, 15, 0, tzinfo=tz)
+    test_time = datetime(now.year + 2, 1, 1, 4, 16, 0, tzinfo=tz)
     run_tasks_at_time(hass, test_time)
 
     with patch(
         "homeassistant.components.recorder.statistics.compile_statistics",
         return_value=True,
     ) as compile_statistics:
-        # Advance one hour, and the statistics task should run
-        test_time = test_time + timedelta(hours=1)
+        # Advance 5 minutes, and the statistics task should run
+        test_time = test_time + timedelta(minutes=5)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 1
 
         compile_statistics.reset_mock()
 
-        # Advance one hour, and the statistics task should run again
-        test_time = test_time + timedelta(hours=1)
+        # Advance 5 minutes, and the statistics task should run again
+        test_time = test_time + timedelta(minutes=5)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 1
 
         compile_statistics.reset_mock()
 
-        # Advance less than one full hour. The task should not run.
-        test_time = test_time + timedelta(minutes=50)
+        # Advance less than 5 minutes. The task should not run.
+        test_time = test_time + timedelta(minutes=3)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 0
 
-        # Advance to the next hour, and the statistics task should run again
-        test_time = test_time + timedelta(hours=1)
+        # Advance 5 minutes, and the statistics task should run again
+        test_time = test_time + timedelta(minutes=5)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 1
 
@@ -754,8 +837,8 @@ def test_statistics_runs_initiated(hass_recorder):
             assert len(statistics_runs) == 1
             last_run = process_timestamp(statistics_runs[0].start)
             assert process_timestamp(last_run) == now.replace(
-                minute=0, second=0, microsecond=0
-            ) - timedelta(hours=1)
+                minute=now.minute - now.minute % 5, second=0, microsecond=0
+            ) - timedelta(minutes=5)
 
 
 def test_compile_missing_statistics(tmpdir):
@@ -776,7 +859,7 @@ def test_compile_missing_statistics(tmpdir):
             statistics_runs = list(session.query(StatisticsRuns))
             assert len(statistics_runs) == 1
             last_run = process_timestamp(statistics_runs[0].start)
-            assert last_run == now - timedelta(hours=1)
+            assert last_run == now - timedelta(minutes=5)
 
         wait_recording_done(hass)
         wait_recording_done(hass)
@@ -795,9 +878,11 @@ def test_compile_missing_statistics(tmpdir):
 
         with session_scope(hass=hass) as session:
             statistics_runs = list(session.query(StatisticsRuns))
-            assert len(statistics_runs) == 2
+            assert len(statistics_runs) == 13  # 12 5-minute runs
             last_run = process_timestamp(statistics_runs[1].start)
             assert last_run == now
+            last_run = process_timestamp(statistics_runs[12].start)
+            assert last_run == now + timedelta(minutes=55)
 
         wait_recording_done(hass)
         wait_recording_done(hass)
@@ -854,6 +939,115 @@ def test_saving_state_with_serializable_data(hass_recorder, caplog):
     assert "State is not JSON serializable" in caplog.text
 
 
+def test_saving_with_bulk_writes(hass_recorder):
+    """Test saving events and linking old states with bulk writes."""
+    hass = hass_recorder({"bulk_writes": True})
+    assert hass.data[DATA_INSTANCE].bulk_writer is not None
+
+    hass.bus.fire("EVENT_TEST", {"test_attr": 5})
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.two", "on", {})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", {"brightness": 10})
+    hass.states.set("test.two", "off", {})
+    hass.states.remove("test.two")
+    wait_recording_done(hass)
+    hass.states.set("test.two", "on", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        db_events = list(session.query(Events).filter_by(event_type="EVENT_TEST"))
+        assert len(db_events) == 1
+        assert db_events[0].to_native().data == {"test_attr": 5}
+
+        states = list(session.query(States))
+        assert len(states) == 6
+
+        assert [state.entity_id for state in states] == [
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.two",
+            "test.two",
+            "test.two",
+        ]
+        assert [state.state for state in states] == [
+            "on",
+            "on",
+            "off",
+            "off",
+            None,
+            "on",
+        ]
+        assert states[2].to_native().attributes == {"brightness": 10}
+
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        assert states[2].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[1].state_id
+        assert states[4].old_state_id == states[3].state_id
+        assert states[5].old_state_id is None
+
+        for state in states:
+            event = session.query(Events).get(state.event_id)
+            assert event.event_type == EVENT_STATE_CHANGED
+            assert event.time_fired == state.created
+
+
+def test_saving_with_bulk_writes_continues_ids(hass_recorder):
+    """Test bulk writes continue from the ids already in the database."""
+    hass = hass_recorder({"bulk_writes": True, "commit_interval": 0})
+    instance = hass.data[DATA_INSTANCE]
+
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    # Simulate a reconnect which reloads the ids from the database
+    instance._reopen_event_session()
+
+    hass.states.set("test.one", "off", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 2
+        assert states[1].state_id == states[0].state_id + 1
+        assert states[1].event_id > states[0].event_id
+        # The last state of each entity is forgotten when the session is reopened
+        assert states[1].old_state_id is None
+
+
+@pytest.mark.parametrize("bulk_writes", [False, True])
+def test_saving_state_deduplicates_attributes(hass_recorder, bulk_writes):
+    """Test states with the same attributes share one attributes row."""
+    hass = hass_recorder({"bulk_writes": bulk_writes})
+
+    hass.states.set("test.one", "on", {"color": "red"})
+    hass.states.set("test.two", "on", {"color": "red"})
+    hass.states.set("test.one", "off", {"color": "blue"})
+    wait_recording_done(hass)
+    hass.states.set("test.two", "off", {"color": "blue"})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        attributes = list(session.query(StateAttributes))
+        assert [attrs.shared_attrs for attrs in attributes] == [
+            '{"color":"red"}',
+            '{"color":"blue"}',
+        ]
+
+        states = list(session.query(States))
+        assert len(states) == 4
+        assert all(state.attributes is None for state in states)
+        assert [state.attributes_id for state in states] == [
+            attributes[0].attributes_id,
+            attributes[0].attributes_id,
+            attributes[1].attributes_id,
+            attributes[1].attributes_id,
+        ]
+        assert states[3].to_native().attributes == {"color": "blue"}
+
+
 def test_run_information(hass_recorder):
     """Ensure run_information returns expected data."""
     before_start_recording = dt_util.utcnow()
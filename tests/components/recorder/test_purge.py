@@ -4,13 +4,22 @@ import json
 import sqlite3
 from unittest.mock import MagicMock, patch
 
-from sqlalchemy.exc import DatabaseError, OperationalError
+from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    Statistics,
+    StatisticsMeta,
+    StatisticsRuns,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -61,6 +70,78 @@ async def test_purge_old_states(
         assert states.count() == 2
 
 
+async def test_purge_old_states_with_bulk_writes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test purged states are no longer referenced by bulk written states."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_writes": True})
+    eleven_days_ago = dt_util.utcnow() - timedelta(days=11)
+
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=eleven_days_ago,
+    ), patch("homeassistant.core.dt_util.utcnow", return_value=eleven_days_ago):
+        hass.states.async_set("test.recorder", "on")
+        await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 1
+
+    await hass.services.async_call(
+        recorder.DOMAIN, recorder.SERVICE_PURGE, {"keep_days": 10}
+    )
+    await async_wait_purge_done(hass, instance)
+
+    hass.states.async_set("test.recorder", "off")
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 1
+        assert states[0].state == "off"
+        assert states[0].old_state_id is None
+
+
+async def test_purge_old_states_removes_unused_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test purging removes shared attributes that are no longer used."""
+    instance = await async_setup_recorder_instance(hass)
+    eleven_days_ago = dt_util.utcnow() - timedelta(days=11)
+
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=eleven_days_ago,
+    ), patch("homeassistant.core.dt_util.utcnow", return_value=eleven_days_ago):
+        hass.states.async_set("test.one", "on", {"old": True})
+        hass.states.async_set("test.two", "on", {"kept": True})
+        await async_wait_recording_done(hass, instance)
+
+    hass.states.async_set("test.three", "on", {"kept": True})
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 2
+
+    await hass.services.async_call(
+        recorder.DOMAIN, recorder.SERVICE_PURGE, {"keep_days": 10}
+    )
+    await async_wait_purge_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        attributes = list(session.query(StateAttributes))
+        assert len(attributes) == 1
+        assert attributes[0].shared_attrs == '{"kept":true}'
+
+    # The purged attributes are added again when they are used
+    hass.states.async_set("test.one", "off", {"old": True})
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        state = session.query(States).filter_by(entity_id="test.one").one()
+        assert state.to_native().attributes == {"old": True}
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -154,6 +235,77 @@ async def test_purge_old_states_encounters_operational_error(
     assert "Error executing purge" in caplog.text
 
 
+async def test_purge_fails_with_sqlalchemy_error(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test a purge that raises an error ends so the next one can run."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass, instance)
+    await async_wait_recording_done_without_instance(hass)
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data",
+        side_effect=SQLAlchemyError("fail"),
+    ):
+        await hass.services.async_call(
+            recorder.DOMAIN, recorder.SERVICE_PURGE, {"keep_days": 0}
+        )
+        await hass.async_block_till_done()
+        await async_wait_purge_done(hass, instance)
+
+    progress = instance.purge_progress
+    assert not progress.running
+    assert progress.failed
+    assert progress.finished is not None
+
+    await hass.services.async_call(
+        recorder.DOMAIN, recorder.SERVICE_PURGE, {"keep_days": 0}
+    )
+    await hass.async_block_till_done()
+    await async_wait_purge_done(hass, instance)
+
+    assert not progress.running
+    assert not progress.failed
+    assert progress.states == 6
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 0
+
+
+async def test_purge_queued_while_running(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test a purge of other data starts after the running purge finished."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+
+    purge_before = dt_util.utcnow() - timedelta(days=10)
+    instance.purge_progress.start(purge_before)
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+    ) as purge_old_data:
+        await hass.services.async_call(
+            recorder.DOMAIN,
+            recorder.SERVICE_PURGE,
+            {"keep_days": 0, "repack": True, "apply_filter": True},
+        )
+        await hass.async_block_till_done()
+        await async_wait_recording_done(hass, instance)
+        assert len(purge_old_data.mock_calls) == 0
+
+        instance.queue.put(PurgeTask(purge_before, False, False))
+        await async_wait_purge_done(hass, instance)
+        assert len(purge_old_data.mock_calls) == 2
+
+    assert purge_old_data.mock_calls[0][1][1:] == (purge_before, False, False)
+    queued_purge_before = purge_old_data.mock_calls[1][1][1]
+    assert queued_purge_before > purge_before
+    assert purge_old_data.mock_calls[1][1][2:] == (True, True)
+    assert not instance.purge_progress.running
+    assert instance.purge_progress.purge_before == queued_purge_before
+
+
 async def test_purge_old_events(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -203,6 +355,49 @@ async def test_purge_old_recorder_runs(
         assert recorder_runs.count() == 1
 
 
+async def test_purge_old_short_term_statistics(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old short term statistics keeps the hourly statistics."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    with recorder.session_scope(hass=hass) as session:
+        session.add(
+            StatisticsMeta.from_meta("recorder", "sensor.test", "W", True, False)
+        )
+        session.flush()
+        for timestamp in (eleven_days_ago, utcnow):
+            session.add(StatisticsShortTerm.from_stats(1, timestamp, {"mean": 1.0}))
+            session.add(Statistics.from_stats(1, timestamp, {"mean": 1.0}))
+            session.add(StatisticsRuns(start=timestamp))
+        session.add(StatisticsRuns(start=eleven_days_ago + timedelta(minutes=5)))
+
+    with session_scope(hass=hass) as session:
+        short_term = session.query(StatisticsShortTerm)
+        assert short_term.count() == 2
+        statistics_runs = session.query(StatisticsRuns)
+        # One run is added when the database is created
+        assert statistics_runs.count() == 4
+
+        purge_before = utcnow - timedelta(days=4)
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert short_term.count() == 1
+        assert session.query(Statistics).count() == 2
+        assert statistics_runs.count() == 2
+
+        # The last run is kept, even if it is older than purge_before
+        session.query(StatisticsRuns).filter(StatisticsRuns.start == utcnow).delete()
+        while not purge_old_data(instance, utcnow + timedelta(days=1), repack=False):
+            pass
+        assert short_term.count() == 0
+        assert statistics_runs.count() == 1
+
+
 async def test_purge_method(
     hass: HomeAssistant,
     async_setup_recorder_instance: SetupRecorderInstanceT,
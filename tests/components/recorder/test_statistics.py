@@ -1,18 +1,24 @@
 """The tests for sensor recorder platform."""
 # pylint: disable=protected-access,invalid-name
-from datetime import timedelta
+from datetime import datetime, timedelta
 from unittest.mock import patch, sentinel
 
 from pytest import approx
 
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+from homeassistant.components.recorder.models import (
+    StatisticsMeta,
+    StatisticsShortTerm,
+    process_timestamp_to_utc_isoformat,
+)
 from homeassistant.components.recorder.statistics import (
     get_last_statistics,
+    get_latest_statistics,
     statistics_during_period,
 )
-from homeassistant.const import TEMP_CELSIUS
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import ENERGY_KILO_WATT_HOUR, TEMP_CELSIUS
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
 
@@ -30,13 +36,13 @@ def test_compile_hourly_statistics(hass_recorder):
     assert dict(states) == dict(hist)
 
     for kwargs in ({}, {"statistic_ids": ["sensor.test1"]}):
-        stats = statistics_during_period(hass, zero, **kwargs)
+        stats = statistics_during_period(hass, zero, period="5minute", **kwargs)
         assert stats == {}
-    stats = get_last_statistics(hass, 0, "sensor.test1")
+    stats = get_last_statistics(hass, 0, "sensor.test1", True)
     assert stats == {}
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
-    recorder.do_adhoc_statistics(period="hourly", start=four)
+    recorder.do_adhoc_statistics(start=zero)
+    recorder.do_adhoc_statistics(start=four)
     wait_recording_done(hass)
     expected_1 = {
         "statistic_id": "sensor.test1",
@@ -66,32 +72,131 @@ def test_compile_hourly_statistics(hass_recorder):
     ]
 
     # Test statistics_during_period
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {"sensor.test1": expected_stats1, "sensor.test2": expected_stats2}
 
-    stats = statistics_during_period(hass, zero, statistic_ids=["sensor.test2"])
+    stats = statistics_during_period(
+        hass, zero, statistic_ids=["sensor.test2"], period="5minute"
+    )
     assert stats == {"sensor.test2": expected_stats2}
 
-    stats = statistics_during_period(hass, zero, statistic_ids=["sensor.test3"])
+    stats = statistics_during_period(
+        hass, zero, statistic_ids=["sensor.test3"], period="5minute"
+    )
     assert stats == {}
 
     # Test get_last_statistics
-    stats = get_last_statistics(hass, 0, "sensor.test1")
+    stats = get_last_statistics(hass, 0, "sensor.test1", True)
     assert stats == {}
 
-    stats = get_last_statistics(hass, 1, "sensor.test1")
+    stats = get_last_statistics(hass, 1, "sensor.test1", True)
     assert stats == {"sensor.test1": [{**expected_2, "statistic_id": "sensor.test1"}]}
 
-    stats = get_last_statistics(hass, 2, "sensor.test1")
+    stats = get_last_statistics(hass, 2, "sensor.test1", True)
     assert stats == {"sensor.test1": expected_stats1[::-1]}
 
-    stats = get_last_statistics(hass, 3, "sensor.test1")
+    stats = get_last_statistics(hass, 3, "sensor.test1", True)
     assert stats == {"sensor.test1": expected_stats1[::-1]}
 
-    stats = get_last_statistics(hass, 1, "sensor.test3")
+    stats = get_last_statistics(hass, 1, "sensor.test3", True)
+    assert stats == {}
+
+    # Test get_latest_statistics
+    stats = get_latest_statistics(
+        hass, ["sensor.test1", "sensor.test2"], short_term=True
+    )
+    assert stats == {
+        "sensor.test1": [{**expected_2, "statistic_id": "sensor.test1"}],
+        "sensor.test2": [{**expected_2, "statistic_id": "sensor.test2"}],
+    }
+
+    stats = get_latest_statistics(hass, ["sensor.test3"], short_term=True)
     assert stats == {}
 
 
+def test_compile_hourly_statistics_from_short_term(hass_recorder):
+    """Test the hourly statistics are compiled from the short term statistics."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    zero = datetime(2021, 9, 1, 12, tzinfo=dt_util.UTC)
+
+    with session_scope(hass=hass) as session:
+        session.add(StatisticsMeta.from_meta("test", "sensor.mean", "W", True, False))
+        session.add(
+            StatisticsMeta.from_meta(
+                "test", "sensor.sum", ENERGY_KILO_WATT_HOUR, False, True
+            )
+        )
+        session.flush()
+        for i in range(24):
+            start = zero + timedelta(minutes=5 * i)
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    1, start, {"mean": float(i), "min": i - 1.0, "max": i + 1.0}
+                )
+            )
+            session.add(
+                StatisticsShortTerm.from_stats(2, start, {"state": i, "sum": 2.0 * i})
+            )
+
+    for hour in (zero, zero + timedelta(hours=1)):
+        recorder.do_adhoc_statistics(start=hour + timedelta(minutes=55))
+    wait_recording_done(hass)
+
+    def expected(start, **stats):
+        return {
+            "start": process_timestamp_to_utc_isoformat(start),
+            "mean": None,
+            "min": None,
+            "max": None,
+            "state": None,
+            "sum": None,
+            **stats,
+        }
+
+    stats = statistics_during_period(hass, zero)
+    assert stats == {
+        "sensor.mean": [
+            {
+                **expected(zero, mean=approx(5.5), min=-1.0, max=12.0),
+                "statistic_id": "sensor.mean",
+            },
+            {
+                **expected(
+                    zero + timedelta(hours=1), mean=approx(17.5), min=11.0, max=24.0
+                ),
+                "statistic_id": "sensor.mean",
+            },
+        ],
+        "sensor.sum": [
+            {**expected(zero, state=11.0, sum=22.0), "statistic_id": "sensor.sum"},
+            {
+                **expected(zero + timedelta(hours=1), state=23.0, sum=46.0),
+                "statistic_id": "sensor.sum",
+            },
+        ],
+    }
+
+    day = dt_util.as_utc(dt_util.start_of_local_day(dt_util.as_local(zero)))
+    month = dt_util.as_utc(
+        dt_util.start_of_local_day(dt_util.as_local(zero).replace(day=1))
+    )
+    for period, start in (("day", day), ("month", month)):
+        stats = statistics_during_period(hass, zero, period=period)
+        assert stats == {
+            "sensor.mean": [
+                {
+                    **expected(start, mean=approx(11.5), min=-1.0, max=24.0),
+                    "statistic_id": "sensor.mean",
+                }
+            ],
+            "sensor.sum": [
+                {**expected(start, state=23.0, sum=46.0), "statistic_id": "sensor.sum"}
+            ],
+        }
+
+
 def test_rename_entity(hass_recorder):
     """Test statistics is migrated when entity_id is changed."""
     hass = hass_recorder()
@@ -112,12 +217,12 @@ def test_rename_entity(hass_recorder):
     assert dict(states) == dict(hist)
 
     for kwargs in ({}, {"statistic_ids": ["sensor.test1"]}):
-        stats = statistics_during_period(hass, zero, **kwargs)
+        stats = statistics_during_period(hass, zero, period="5minute", **kwargs)
         assert stats == {}
-    stats = get_last_statistics(hass, 0, "sensor.test1")
+    stats = get_last_statistics(hass, 0, "sensor.test1", True)
     assert stats == {}
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
     expected_1 = {
         "statistic_id": "sensor.test1",
@@ -138,13 +243,13 @@ def test_rename_entity(hass_recorder):
         {**expected_1, "statistic_id": "sensor.test99"},
     ]
 
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {"sensor.test1": expected_stats1, "sensor.test2": expected_stats2}
 
     entity_reg.async_update_entity(reg_entry.entity_id, new_entity_id="sensor.test99")
     hass.block_till_done()
 
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {"sensor.test99": expected_stats99, "sensor.test2": expected_stats2}
 
 
@@ -164,7 +269,7 @@ def test_statistics_duplicated(hass_recorder, caplog):
     with patch(
         "homeassistant.components.sensor.recorder.compile_statistics"
     ) as compile_statistics:
-        recorder.do_adhoc_statistics(period="hourly", start=zero)
+        recorder.do_adhoc_statistics(start=zero)
         wait_recording_done(hass)
         assert compile_statistics.called
         compile_statistics.reset_mock()
@@ -172,7 +277,7 @@ def test_statistics_duplicated(hass_recorder, caplog):
         assert "Statistics already compiled" not in caplog.text
         caplog.clear()
 
-        recorder.do_adhoc_statistics(period="hourly", start=zero)
+        recorder.do_adhoc_statistics(start=zero)
         wait_recording_done(hass)
         assert not compile_statistics.called
         compile_statistics.reset_mock()
@@ -211,10 +316,10 @@ def record_states(hass):
         return hass.states.get(entity_id)
 
     zero = dt_util.utcnow()
-    one = zero + timedelta(minutes=1)
-    two = one + timedelta(minutes=15)
-    three = two + timedelta(minutes=30)
-    four = three + timedelta(minutes=15)
+    one = zero + timedelta(seconds=1 * 5)
+    two = one + timedelta(seconds=15 * 5)
+    three = two + timedelta(seconds=30 * 5)
+    four = three + timedelta(seconds=15 * 5)
 
     states = {mp: [], sns1: [], sns2: [], sns3: [], sns4: []}
     with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=one):
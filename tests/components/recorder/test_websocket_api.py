@@ -0,0 +1,73 @@
+"""The tests for the recorder websocket API."""
+from datetime import timedelta
+import json
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.models import Events
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_purge_done, async_wait_recording_done
+from .conftest import SetupRecorderInstanceT
+
+
+async def test_subscribe_purge_progress(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    hass_ws_client,
+):
+    """Test subscribing to the progress of a purge."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+    eleven_days_ago = dt_util.utcnow() - timedelta(days=11)
+    with recorder.session_scope(hass=hass) as session:
+        for _ in range(5):
+            session.add(
+                Events(
+                    event_type="EVENT_TEST_PURGE",
+                    event_data=json.dumps({}),
+                    origin="LOCAL",
+                    created=eleven_days_ago,
+                    time_fired=eleven_days_ago,
+                )
+            )
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "recorder/subscribe_purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"] == {
+        "running": False,
+        "purge_before": None,
+        "started": None,
+        "finished": None,
+        "failed": False,
+        "oldest_event": None,
+        "batches": 0,
+        "events": 0,
+        "states": 0,
+    }
+
+    await hass.services.async_call(
+        recorder.DOMAIN, recorder.SERVICE_PURGE, {"keep_days": 10}
+    )
+    await hass.async_block_till_done()
+    await async_wait_purge_done(hass, instance)
+
+    # A batch removes the events, the next one finds nothing left to purge
+    response = await client.receive_json()
+    progress = response["event"]
+    assert progress["running"]
+    assert progress["batches"] == 1
+    assert progress["events"] == 5
+    assert dt_util.parse_datetime(progress["oldest_event"]) == eleven_days_ago
+
+    response = await client.receive_json()
+    progress = response["event"]
+    assert not progress["running"]
+    assert progress["finished"] is not None
+    assert not progress["failed"]
+    assert progress["batches"] == 1
+    assert progress["events"] == 5
+    assert progress["states"] == 0
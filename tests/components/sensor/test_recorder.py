@@ -80,13 +80,13 @@ def test_compile_hourly_statistics(
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -129,13 +129,13 @@ def test_compile_hourly_statistics_unsupported(hass_recorder, caplog, attributes
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": "°C"}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -187,17 +187,17 @@ def test_compile_hourly_sum_statistics_amount(
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -211,7 +211,9 @@ def test_compile_hourly_sum_statistics_amount(
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -220,7 +222,9 @@ def test_compile_hourly_sum_statistics_amount(
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -264,17 +268,17 @@ def test_compile_hourly_sum_statistics_total_increasing(
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -288,7 +292,9 @@ def test_compile_hourly_sum_statistics_total_increasing(
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -297,7 +303,9 @@ def test_compile_hourly_sum_statistics_total_increasing(
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -348,17 +356,17 @@ def test_compile_hourly_energy_statistics_unsupported(hass_recorder, caplog):
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": "kWh"}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -372,7 +380,9 @@ def test_compile_hourly_energy_statistics_unsupported(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -381,7 +391,9 @@ def test_compile_hourly_energy_statistics_unsupported(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -426,11 +438,11 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
@@ -438,7 +450,7 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
         {"statistic_id": "sensor.test2", "unit_of_measurement": "kWh"},
         {"statistic_id": "sensor.test3", "unit_of_measurement": "kWh"},
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -452,7 +464,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -461,7 +475,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -481,7 +497,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test2",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -490,7 +508,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test2",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -510,7 +530,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test3",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -519,7 +541,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test3",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -564,9 +588,9 @@ def test_compile_hourly_statistics_unchanged(
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=four)
+    recorder.do_adhoc_statistics(start=four)
     wait_recording_done(hass)
-    stats = statistics_during_period(hass, four)
+    stats = statistics_during_period(hass, four, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -595,9 +619,9 @@ def test_compile_hourly_statistics_partially_unavailable(hass_recorder, caplog):
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -651,9 +675,9 @@ def test_compile_hourly_statistics_unavailable(
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=four)
+    recorder.do_adhoc_statistics(start=four)
     wait_recording_done(hass)
-    stats = statistics_during_period(hass, four)
+    stats = statistics_during_period(hass, four, period="5minute")
     assert stats == {
         "sensor.test2": [
             {
@@ -680,7 +704,7 @@ def test_compile_hourly_statistics_fails(hass_recorder, caplog):
         "homeassistant.components.sensor.recorder.compile_statistics",
         side_effect=Exception,
     ):
-        recorder.do_adhoc_statistics(period="hourly", start=zero)
+        recorder.do_adhoc_statistics(start=zero)
         wait_recording_done(hass)
     assert "Error while processing event StatisticsTask" in caplog.text
 
@@ -773,10 +797,10 @@ def record_states(hass, zero, entity_id, attributes):
         wait_recording_done(hass)
         return hass.states.get(entity_id)
 
-    one = zero + timedelta(minutes=1)
-    two = one + timedelta(minutes=10)
-    three = two + timedelta(minutes=40)
-    four = three + timedelta(minutes=10)
+    one = zero + timedelta(seconds=1 * 5)
+    two = one + timedelta(seconds=10 * 5)
+    three = two + timedelta(seconds=40 * 5)
+    four = three + timedelta(seconds=10 * 5)
 
     states = {entity_id: []}
     with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=one):
@@ -803,14 +827,14 @@ def record_meter_states(hass, zero, entity_id, _attributes, seq):
         wait_recording_done(hass)
         return hass.states.get(entity_id)
 
-    one = zero + timedelta(minutes=15)
-    two = one + timedelta(minutes=30)
-    three = two + timedelta(minutes=15)
-    four = three + timedelta(minutes=15)
-    five = four + timedelta(minutes=30)
-    six = five + timedelta(minutes=15)
-    seven = six + timedelta(minutes=15)
-    eight = seven + timedelta(minutes=30)
+    one = zero + timedelta(seconds=15 * 5)
+    two = one + timedelta(seconds=30 * 5)
+    three = two + timedelta(seconds=15 * 5)
+    four = three + timedelta(seconds=15 * 5)
+    five = four + timedelta(seconds=30 * 5)
+    six = five + timedelta(seconds=15 * 5)
+    seven = six + timedelta(seconds=15 * 5)
+    eight = seven + timedelta(seconds=30 * 5)
 
     attributes = dict(_attributes)
     if "last_reset" in _attributes:
@@ -863,10 +887,10 @@ def record_states_partially_unavailable(hass, zero, entity_id, attributes):
         wait_recording_done(hass)
         return hass.states.get(entity_id)
 
-    one = zero + timedelta(minutes=1)
-    two = one + timedelta(minutes=15)
-    three = two + timedelta(minutes=30)
-    four = three + timedelta(minutes=15)
+    one = zero + timedelta(seconds=1 * 5)
+    two = one + timedelta(seconds=15 * 5)
+    three = two + timedelta(seconds=30 * 5)
+    four = three + timedelta(seconds=15 * 5)
 
     states = {entity_id: []}
     with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=one):
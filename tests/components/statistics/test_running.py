@@ -0,0 +1,86 @@
+"""The tests for the running statistics of the statistics sensor."""
+from collections import deque
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics import running
+from homeassistant.components.statistics.running import RunningStatistics, SortedValues
+
+
+def test_sorted_values(monkeypatch):
+    """Test the sorted values stay sorted across blocks."""
+    monkeypatch.setattr(running, "SORTED_BLOCK_SIZE", 4)
+    rand = random.Random(42)
+    values = SortedValues()
+    expected = []
+
+    for _ in range(500):
+        if expected and rand.random() < 0.4:
+            value = rand.choice(expected)
+            expected.remove(value)
+            values.remove(value)
+        else:
+            value = rand.randint(0, 50)
+            expected.append(value)
+            values.add(value)
+
+        expected.sort()
+        assert len(values) == len(expected)
+        assert list(values) == expected
+        assert [values[index] for index in range(len(expected))] == expected
+        if expected:
+            assert values[-1] == expected[-1]
+
+    with pytest.raises(ValueError):
+        values.remove(51)
+    with pytest.raises(IndexError):
+        values[len(expected)]
+
+
+@pytest.mark.parametrize("method", ["exclusive", "inclusive"])
+def test_running_statistics_match_statistics(method):
+    """Test the running statistics match the statistics module over a window."""
+    rand = random.Random(1)
+    stats = RunningStatistics()
+    window = deque()
+
+    for _ in range(2000):
+        if len(window) == 100:
+            stats.remove(window.popleft())
+        value = round(rand.uniform(-1000, 1000), rand.randint(0, 3))
+        window.append(value)
+        stats.add(value)
+
+        assert stats.mean == pytest.approx(statistics.mean(window))
+        assert stats.median == statistics.median(window)
+        assert stats.total == pytest.approx(sum(window))
+        assert stats.min == min(window)
+        assert stats.max == max(window)
+        if len(window) > 4:
+            assert stats.variance == pytest.approx(statistics.variance(window))
+            assert stats.stdev == pytest.approx(statistics.stdev(window))
+            assert stats.quantiles(4, method) == pytest.approx(
+                statistics.quantiles(window, n=4, method=method)
+            )
+
+
+def test_running_statistics_not_enough_values():
+    """Test the errors for too few values."""
+    stats = RunningStatistics()
+    with pytest.raises(statistics.StatisticsError):
+        stats.mean
+    with pytest.raises(statistics.StatisticsError):
+        stats.median
+
+    stats.add(1.5)
+    assert stats.mean == 1.5
+    with pytest.raises(statistics.StatisticsError):
+        stats.variance
+    with pytest.raises(statistics.StatisticsError):
+        stats.quantiles(4, "exclusive")
+
+    stats.remove(1.5)
+    assert len(stats) == 0
+    assert stats.total == 0
@@ -1,12 +1,16 @@
 """Test Websocket API messages module."""
+import json
+from unittest.mock import patch
 
 from homeassistant.components.websocket_api.messages import (
-    _cached_event_message as lru_event_cache,
     cached_event_message,
     message_to_json,
+    result_message,
+    states_result_message,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import callback
+from homeassistant.helpers.json import json_dumps
 
 
 async def test_cached_event_message(hass):
@@ -25,26 +29,25 @@ async def test_cached_event_message(hass):
     await hass.async_block_till_done()
 
     assert len(events) == 2
-    lru_event_cache.cache_clear()
 
-    msg0 = cached_event_message(2, events[0])
-    assert msg0 == cached_event_message(2, events[0])
+    with patch("homeassistant.core.json_dumps", wraps=json_dumps) as mock_dump:
+        msg0 = cached_event_message(2, events[0])
+        assert msg0 == cached_event_message(2, events[0])
 
-    msg1 = cached_event_message(2, events[1])
-    assert msg1 == cached_event_message(2, events[1])
+        msg1 = cached_event_message(2, events[1])
+        assert msg1 == cached_event_message(2, events[1])
 
-    assert msg0 != msg1
+        assert msg0 != msg1
+        assert mock_dump.call_count == 2
 
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 2
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
+        cached_event_message(2, events[1])
+        assert mock_dump.call_count == 2
 
-    cached_event_message(2, events[1])
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 3
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
+    assert json.loads(msg0) == {
+        "id": 2,
+        "type": "event",
+        "event": json.loads(json_dumps(events[0])),
+    }
 
 
 async def test_cached_event_message_with_different_idens(hass):
@@ -63,19 +66,36 @@ async def test_cached_event_message_with_different_idens(hass):
 
     assert len(events) == 1
 
-    lru_event_cache.cache_clear()
-
-    msg0 = cached_event_message(2, events[0])
-    msg1 = cached_event_message(3, events[0])
-    msg2 = cached_event_message(4, events[0])
+    with patch("homeassistant.core.json_dumps", wraps=json_dumps) as mock_dump:
+        msg0 = cached_event_message(2, events[0])
+        msg1 = cached_event_message(3, events[0])
+        msg2 = cached_event_message(4, events[0])
 
     assert msg0 != msg1
     assert msg0 != msg2
+    assert json.loads(msg1)["id"] == 3
+    assert mock_dump.call_count == 1
+
+
+async def test_states_result_message(hass):
+    """Test the states are spliced into the result message."""
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    hass.states.async_set("light.door", "off")
+    states = hass.states.async_all()
+
+    msg = states_result_message(5, states)
+
+    assert json.loads(msg) == json.loads(message_to_json(result_message(5, states)))
+
+
+async def test_states_result_message_not_serializable(hass, caplog):
+    """Test a state that cannot be serialized results in an error."""
+    hass.states.async_set("light.window", "on", {"brightness": float("NaN")})
+
+    msg = json.loads(states_result_message(5, hass.states.async_all()))
 
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 2
-    assert cache_info.misses == 1
-    assert cache_info.currsize == 1
+    assert not msg["success"]
+    assert msg["error"]["code"] == "unknown_error"
 
 
 async def test_message_to_json(caplog):
@@ -83,14 +103,16 @@ async def test_message_to_json(caplog):
 
     json_str = message_to_json({"id": 1, "message": "xyz"})
 
-    assert json_str == '{"id": 1, "message": "xyz"}'
+    assert json.loads(json_str) == {"id": 1, "message": "xyz"}
 
     json_str2 = message_to_json({"id": 1, "message": _Unserializeable()})
 
-    assert (
-        json_str2
-        == '{"id": 1, "type": "result", "success": false, "error": {"code": "unknown_error", "message": "Invalid JSON in response"}}'
-    )
+    assert json.loads(json_str2) == {
+        "id": 1,
+        "type": "result",
+        "success": False,
+        "error": {"code": "unknown_error", "message": "Invalid JSON in response"},
+    }
     assert "Unable to serialize to JSON" in caplog.text
 
 
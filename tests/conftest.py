@@ -115,6 +115,18 @@ def bcrypt_cost():
     bcrypt.gensalt = gensalt_orig
 
 
+@pytest.fixture(autouse=True)
+def disable_manifest_cache_save(request):
+    """Do not store the manifest cache in the testing config directory."""
+    if "hass_storage" in request.fixturenames:
+        # The stored manifest cache is mocked with the other stores
+        yield
+        return
+
+    with patch("homeassistant.loader.ManifestCache.async_schedule_save"):
+        yield
+
+
 @pytest.fixture
 def hass_storage():
     """Fixture to mock storage."""
@@ -460,9 +472,7 @@ async def mqtt_mock(hass, mqtt_client_mock, mqtt_config):
     assert result
     await hass.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
     spec = dir(hass.data["mqtt"])
-    spec.remove("_matching_subscriptions")
 
     mqtt_component_mock = MagicMock(
         return_value=hass.data["mqtt"],
@@ -613,9 +623,9 @@ def enable_statistics():
 def hass_recorder(enable_statistics, hass_storage):
     """Home Assistant fixture with in-memory recorder."""
     hass = get_test_home_assistant()
-    stats = recorder.Recorder.async_hourly_statistics if enable_statistics else None
+    stats = recorder.Recorder.async_periodic_statistics if enable_statistics else None
     with patch(
-        "homeassistant.components.recorder.Recorder.async_hourly_statistics",
+        "homeassistant.components.recorder.Recorder.async_periodic_statistics",
         side_effect=stats,
         autospec=True,
     ):
@@ -419,6 +419,38 @@ async def test_deleted_device_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_for_lookups_follow_updates(registry):
+    """Test the entries by area and config entry follow updates."""
+    entry = registry.async_get_or_create(
+        config_entry_id="123",
+        identifiers={("bridgeid", "0123")},
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="456",
+        identifiers={("bridgeid", "4567")},
+    )
+
+    entry = registry.async_update_device(entry.id, area_id="area-1")
+    assert device_registry.async_entries_for_area(registry, "area-1") == [entry]
+
+    entry = registry.async_get_or_create(
+        config_entry_id="456",
+        identifiers={("bridgeid", "0123")},
+    )
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [entry]
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [
+        entry2,
+        entry,
+    ]
+
+    registry.async_clear_config_entry("123")
+    assert device_registry.async_entries_for_config_entry(registry, "123") == []
+
+    registry.async_remove_device(entry.id)
+    assert device_registry.async_entries_for_area(registry, "area-1") == []
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [entry2]
+
+
 async def test_specifying_via_device_create(registry):
     """Test specifying a via_device and updating."""
     via = registry.async_get_or_create(
@@ -493,6 +493,66 @@ async def test_register_entity_service(hass):
     assert len(calls) == 2
 
 
+async def test_entity_service_call_uses_domain_entities(hass):
+    """Test entity services look up the targeted entities of all platforms."""
+    calls = []
+
+    def _make_entity(name):
+        entity = MockEntity(entity_id=f"{DOMAIN}.{name}")
+
+        @ha.callback
+        def appender(**kwargs):
+            calls.append(entity.entity_id)
+
+        entity.async_called_by_service = appender
+        return entity
+
+    platform_entity = _make_entity("platform")
+
+    async def async_setup_platform(hass, config, async_add_entities, discovery_info):
+        async_add_entities([platform_entity])
+
+    mock_entity_platform(
+        hass,
+        "test_domain.platform",
+        MockPlatform(async_setup_platform=async_setup_platform),
+    )
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+    component_entities = [_make_entity("one"), _make_entity("two")]
+    await component.async_add_entities(component_entities)
+
+    assert component.get_entity(f"{DOMAIN}.platform") is platform_entity
+    assert component.get_entity(f"{DOMAIN}.one") is component_entities[0]
+    assert len(list(component.entities)) == 3
+
+    component.async_register_entity_service("hello", {}, "async_called_by_service")
+
+    await hass.services.async_call(
+        DOMAIN,
+        "hello",
+        {"entity_id": [f"{DOMAIN}.platform", f"{DOMAIN}.two"]},
+        blocking=True,
+    )
+    assert sorted(calls) == [f"{DOMAIN}.platform", f"{DOMAIN}.two"]
+
+    calls.clear()
+    await hass.services.async_call(
+        DOMAIN, "hello", {"entity_id": ENTITY_MATCH_ALL}, blocking=True
+    )
+    assert sorted(calls) == [f"{DOMAIN}.one", f"{DOMAIN}.platform", f"{DOMAIN}.two"]
+
+    await component.async_remove_entity(f"{DOMAIN}.platform")
+    assert component.get_entity(f"{DOMAIN}.platform") is None
+
+    calls.clear()
+    await hass.services.async_call(
+        DOMAIN, "hello", {"entity_id": f"{DOMAIN}.platform"}, blocking=True
+    )
+    assert calls == []
+
+
 async def test_platforms_shutdown_on_stop(hass):
     """Test that we shutdown platforms on stop."""
     platform1_setup = Mock(side_effect=[PlatformNotReady, PlatformNotReady, None])
@@ -352,6 +352,39 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_for_lookups_follow_updates(registry):
+    """Test the entries by device, area and config entry follow updates."""
+    mock_config = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=mock_config, device_id="device-1"
+    )
+    entry2 = registry.async_get_or_create("light", "hue", "5678", area_id="area-1")
+
+    assert er.async_entries_for_device(registry, "device-1") == [entry]
+    assert er.async_entries_for_area(registry, "area-1") == [entry2]
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == [entry]
+
+    entry = registry.async_update_entity(
+        entry.entity_id, area_id="area-1", new_entity_id="light.renamed"
+    )
+    assert er.async_entries_for_device(registry, "device-1") == [entry]
+    assert sorted(
+        entry.entity_id for entry in er.async_entries_for_area(registry, "area-1")
+    ) == ["light.hue_5678", "light.renamed"]
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == [entry]
+
+    registry.async_clear_area_id("area-1")
+    assert er.async_entries_for_area(registry, "area-1") == []
+
+    registry.async_remove(entry.entity_id)
+    assert er.async_entries_for_device(registry, "device-1") == []
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == []
+
+    registry = mock_registry(registry.hass, registry.entities)
+    assert er.async_entries_for_area(registry, "area-1") == []
+    assert er.async_entries_for_device(registry, "device-2") == []
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_migration(hass):
     """Test migration from old data to new."""
@@ -1968,6 +1968,50 @@ async def test_track_template_result_refresh_cancel(hass):
     assert refresh_runs == ["duck"]
 
 
+async def test_async_track_template_result_burst_renders_once(hass):
+    """Test a burst of state changes renders a template once."""
+    template_sum = Template(
+        "{{ (states('sensor.one') | int) + (states('sensor.two') | int) }}", hass
+    )
+    template_domain = Template(
+        "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}", hass
+    )
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(event, updates):
+        refresh_runs.append([update.result for update in updates])
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_sum, None),
+            TrackTemplate(template_domain, None, timedelta(seconds=0)),
+        ],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as mock_render:
+        hass.states.async_set("sensor.one", "1")
+        hass.states.async_set("sensor.two", "2")
+        hass.states.async_set("light.one", "on")
+        hass.states.async_set("light.two", "on")
+        await hass.async_block_till_done()
+
+    assert mock_render.call_count == 2
+    assert refresh_runs == [[3], [2]]
+
+    info.async_refresh()
+    await hass.async_block_till_done()
+    assert refresh_runs == [[3], [2]]
+
+
 async def test_async_track_template_result_multiple_templates(hass):
     """Test tracking multiple templates."""
 
@@ -1,10 +1,19 @@
 """Test Home Assistant remote methods and classes."""
+from collections import namedtuple
 from datetime import timedelta
+import json
+import math
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers.json import (
+    ExtendedJSONEncoder,
+    JSONEncoder,
+    json_dumps,
+    json_dumps_compact,
+    json_loads,
+)
 from homeassistant.util import dt as dt_util
 
 
@@ -63,3 +72,69 @@ def test_trace_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+def test_json_dumps(hass):
+    """Test json_dumps encodes Home Assistant objects."""
+    now = dt_util.utcnow()
+    state = core.State("test.test", "hello", {"set": {1}, "now": now})
+    point = namedtuple("Point", ["x", "y"])(1, 2)
+
+    assert json.loads(json_dumps({"state": state, "point": point, 1: now})) == {
+        "state": json.loads(json.dumps(state, cls=JSONEncoder)),
+        "point": [1, 2],
+        "1": now.isoformat(),
+    }
+
+    with pytest.raises(TypeError):
+        json_dumps({"object": object()})
+
+
+def test_json_dumps_big_int(hass):
+    """Test json_dumps falls back to the json module for big integers."""
+    now = dt_util.utcnow()
+    state = core.State("test.test", "hello")
+    data = {"big": 2 ** 70, "state": state, "set": {1}, now: (1.5, None)}
+
+    assert json_dumps(data) == json.dumps(
+        {
+            "big": 2 ** 70,
+            "state": json.loads(json_dumps(state)),
+            "set": [1],
+            now.isoformat(): [1.5, None],
+        },
+        separators=(",", ":"),
+    )
+
+    with pytest.raises(TypeError):
+        json_dumps({"big": 2 ** 70, "object": object()})
+
+
+@pytest.mark.parametrize("big", [1, 2 ** 70])
+def test_json_dumps_nan(hass, big):
+    """Test NaN and infinite floats are not encoded as null."""
+    assert json_dumps({"big": big, "none": None}) == f'{{"big":{big},"none":null}}'
+
+    for value in (math.nan, math.inf, -math.inf):
+        with pytest.raises(ValueError):
+            json_dumps({"big": big, "value": value})
+
+    state = core.State("test.test", "hello", {"values": {"nan": math.nan}})
+    with pytest.raises(ValueError):
+        json_dumps([{"big": big}, state])
+
+    assert (
+        json_dumps_compact(
+            {"big": big, "values": [math.nan, math.inf, -math.inf, None]}
+        )
+        == f'{{"big":{big},"values":[NaN,Infinity,-Infinity,null]}}'
+    )
+
+
+def test_json_loads(hass):
+    """Test json_loads also decodes what the json module encodes."""
+    assert json_loads('{"a": [1, 2.5, "b", null]}') == {"a": [1, 2.5, "b", None]}
+    assert math.isnan(json_loads('{"a": NaN}')["a"])
+
+    with pytest.raises(ValueError):
+        json_loads("{")
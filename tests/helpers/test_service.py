@@ -699,6 +699,39 @@ async def test_call_with_match_all(
     )
 
 
+async def test_call_with_domain_entities(hass, mock_handle_entity_call, mock_entities):
+    """Check the targeted entities are looked up in the domain entities."""
+    platform = Mock(entities=mock_entities)
+    await service.entity_service_call(
+        hass,
+        [platform],
+        Mock(),
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.bedroom", "light.kitchen", "light.unknown"]},
+        ),
+        domain_entities=mock_entities,
+    )
+
+    assert sorted(
+        call[1][1].entity_id for call in mock_handle_entity_call.mock_calls
+    ) == ["light.bedroom", "light.kitchen"]
+
+    mock_handle_entity_call.reset_mock()
+    await service.entity_service_call(
+        hass,
+        [platform],
+        Mock(),
+        ha.ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
+        domain_entities=mock_entities,
+    )
+
+    assert [call[1][1] for call in mock_handle_entity_call.mock_calls] == list(
+        mock_entities.values()
+    )
+
+
 async def test_call_with_omit_entity_id(hass, mock_handle_entity_call, mock_entities):
     """Check service call if we do not pass an entity ID."""
     await service.entity_service_call(
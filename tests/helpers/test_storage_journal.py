@@ -0,0 +1,194 @@
+"""Tests for the journal of the storage helper with minimal mocking."""
+from operator import itemgetter
+import os
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import CoreState
+from homeassistant.helpers import storage
+from homeassistant.util import json as json_util
+
+from tests.common import async_test_home_assistant
+
+JOURNAL = [
+    storage.JournalList("items", itemgetter("id"), volatile=frozenset({"seen"})),
+]
+
+
+@pytest.fixture
+async def journal_hass(loop, tmpdir):
+    """Home Assistant with the storage in a temporary directory."""
+    hass = await async_test_home_assistant(loop)
+    test_dir = await hass.async_add_executor_job(tmpdir.mkdir, "storage")
+    with patch.object(storage, "STORAGE_DIR", test_dir):
+        yield hass
+    await hass.async_stop(force=True)
+
+
+def _read_lines(path):
+    """Read the lines of a file."""
+    with open(path, encoding="utf-8") as fdesc:
+        return fdesc.read().splitlines()
+
+
+async def test_journal_changes(journal_hass):
+    """Test only the changed records are written to the journal."""
+    hass = journal_hass
+    store = storage.Store(hass, 1, "journaled", journal=JOURNAL)
+    items = [{"id": str(idx), "value": idx, "seen": 0} for idx in range(3)]
+
+    await store.async_save({"items": items, "other": 1})
+    stored = await hass.async_add_executor_job(json_util.load_json, store.path)
+    assert stored["journal"] == 1
+    assert stored["data"]["items"] == items
+    assert await hass.async_add_executor_job(_read_lines, store.journal_path) == [
+        '{"journal":1}'
+    ]
+
+    items = [
+        {"id": "0", "value": 0, "seen": 1},
+        {"id": "1", "value": 10, "seen": 1},
+        {"id": "3", "value": 3, "seen": 1},
+    ]
+    await store.async_save({"items": items, "other": 1})
+    stored = await hass.async_add_executor_job(json_util.load_json, store.path)
+    assert stored["journal"] == 1
+    assert stored["data"]["items"][1]["value"] == 1
+    lines = await hass.async_add_executor_job(_read_lines, store.journal_path)
+    assert sorted(lines[1:]) == [
+        '["items","1",{"id":"1","value":10,"seen":1}]',
+        '["items","2",null]',
+        '["items","3",{"id":"3","value":3,"seen":1}]',
+    ]
+
+    # The journal is replayed on load
+    store = storage.Store(hass, 1, "journaled", journal=JOURNAL)
+    data = await store.async_load()
+    assert data["other"] == 1
+    assert sorted(data["items"], key=itemgetter("id")) == [
+        {"id": "0", "value": 0, "seen": 0},
+        {"id": "1", "value": 10, "seen": 1},
+        {"id": "3", "value": 3, "seen": 1},
+    ]
+
+    # Changing data outside of the journaled lists writes in full
+    await store.async_save({"items": items, "other": 2})
+    stored = await hass.async_add_executor_job(json_util.load_json, store.path)
+    assert stored["journal"] == 2
+    assert stored["data"] == {"items": items, "other": 2}
+    assert await hass.async_add_executor_job(_read_lines, store.journal_path) == [
+        '{"journal":2}'
+    ]
+
+    await store.async_remove()
+    assert not await hass.async_add_executor_job(os.path.exists, store.path)
+    assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+
+async def test_journal_compacts(journal_hass):
+    """Test the journal is compacted when it grows and when stopping."""
+    hass = journal_hass
+    store = storage.Store(hass, 1, "journaled", journal=JOURNAL)
+
+    with patch.object(storage, "JOURNAL_MIN_COMPACT_ENTRIES", 2):
+        await store.async_save({"items": [{"id": "a", "value": 0}]})
+        await store.async_save({"items": [{"id": "a", "value": 1}]})
+        await store.async_save({"items": [{"id": "a", "value": 2}]})
+        lines = await hass.async_add_executor_job(_read_lines, store.journal_path)
+        assert len(lines) == 3
+
+        await store.async_save({"items": [{"id": "a", "value": 3}]})
+        stored = await hass.async_add_executor_job(json_util.load_json, store.path)
+        assert stored["journal"] == 2
+        assert stored["data"]["items"] == [{"id": "a", "value": 3}]
+
+    await store.async_save({"items": [{"id": "a", "value": 4}]})
+    hass.state = CoreState.stopping
+    await store.async_save({"items": [{"id": "a", "value": 5}]})
+    await hass.async_block_till_done()
+    hass.state = CoreState.final_write
+    hass.bus.async_fire("homeassistant_final_write")
+    await hass.async_block_till_done()
+    stored = await hass.async_add_executor_job(json_util.load_json, store.path)
+    assert stored["journal"] == 3
+    assert stored["data"]["items"] == [{"id": "a", "value": 5}]
+    hass.state = CoreState.running
+
+
+async def test_journal_stale_and_partial(journal_hass):
+    """Test stale journals and interrupted writes are not replayed."""
+    hass = journal_hass
+    store = storage.Store(hass, 1, "journaled", journal=JOURNAL)
+    await store.async_save({"items": [{"id": "a", "value": 0}]})
+    await store.async_save({"items": [{"id": "a", "value": 1}]})
+
+    def append(line):
+        with open(store.journal_path, "a", encoding="utf-8") as fdesc:
+            fdesc.write(line)
+
+    await hass.async_add_executor_job(append, '["items","b",{"id":"b","val')
+    store = storage.Store(hass, 1, "journaled", journal=JOURNAL)
+    assert await store.async_load() == {"items": [{"id": "a", "value": 1}]}
+
+    # A journal of an earlier generation is ignored
+    def write_stale():
+        with open(store.journal_path, "w", encoding="utf-8") as fdesc:
+            fdesc.write('{"journal":0}\n["items","a",null]\n')
+
+    await hass.async_add_executor_job(write_stale)
+    store = storage.Store(hass, 1, "journaled", journal=JOURNAL)
+    assert await store.async_load() == {"items": [{"id": "a", "value": 0}]}
+
+    # The next save can not rely on the journal and writes in full
+    await store.async_save({"items": [{"id": "a", "value": 2}]})
+    stored = await hass.async_add_executor_job(json_util.load_json, store.path)
+    assert stored["journal"] == 2
+    assert stored["data"]["items"] == [{"id": "a", "value": 2}]
+
+
+async def test_journal_failed_append(journal_hass, caplog):
+    """Test the save after a failed append does not append to the journal."""
+    hass = journal_hass
+    store = storage.Store(hass, 1, "journaled", journal=JOURNAL)
+    await store.async_save({"items": [{"id": "a", "value": 0}]})
+
+    def partial_open(path, mode="r", **kwargs):
+        fdesc = open(path, mode, **kwargs)
+        if mode != "a":
+            return fdesc
+        with fdesc:
+            fdesc.write('["items","a",{"id":"a","val')
+        raise OSError("No space left on device")
+
+    with patch.object(storage, "open", partial_open, create=True):
+        await store.async_save({"items": [{"id": "a", "value": 1}]})
+    assert "Error writing config for journaled" in caplog.text
+
+    await store.async_save({"items": [{"id": "a", "value": 2}, {"id": "b"}]})
+    stored = await hass.async_add_executor_job(json_util.load_json, store.path)
+    assert stored["journal"] == 2
+    assert await hass.async_add_executor_job(_read_lines, store.journal_path) == [
+        '{"journal":2}'
+    ]
+
+    await store.async_save({"items": [{"id": "a", "value": 3}, {"id": "b"}]})
+    store = storage.Store(hass, 1, "journaled", journal=JOURNAL)
+    assert await store.async_load() == {"items": [{"id": "a", "value": 3}, {"id": "b"}]}
+
+
+async def test_journal_data_list(journal_hass):
+    """Test journaling data that is a list of records."""
+    hass = journal_hass
+    store = storage.Store(
+        hass, 1, "journaled", journal=[storage.JournalList(None, itemgetter("id"))]
+    )
+    await store.async_save([{"id": "a"}, {"id": "b"}])
+    await store.async_save([{"id": "b"}, {"id": "c"}])
+    lines = await hass.async_add_executor_job(_read_lines, store.journal_path)
+    assert sorted(lines[1:]) == ['[null,"a",null]', '[null,"c",{"id":"c"}]']
+
+    store = storage.Store(
+        hass, 1, "journaled", journal=[storage.JournalList(None, itemgetter("id"))]
+    )
+    assert await store.async_load() == [{"id": "b"}, {"id": "c"}]
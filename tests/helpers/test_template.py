@@ -4,6 +4,7 @@ import math
 import random
 from unittest.mock import patch
 
+from jinja2.sandbox import ImmutableSandboxedEnvironment
 import pytest
 import voluptuous as vol
 
@@ -21,6 +22,7 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import device_registry as dr, template
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.lru import LRU
 from homeassistant.util.unit_system import UnitSystem
 
 from tests.common import MockConfigEntry, mock_device_registry, mock_registry
@@ -1512,6 +1514,52 @@ async def test_expand(hass):
     assert info.rate_limit is None
 
 
+async def test_expand_nested_groups_cached(hass):
+    """Test the members of nested groups are resolved once until they change."""
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "off")
+    hass.states.async_set("light.three", "on")
+    hass.states.async_set(
+        "group.upstairs", "on", {"entity_id": ["light.two", "light.one"]}
+    )
+    hass.states.async_set(
+        "group.all", "on", {"entity_id": ["group.upstairs", "light.one", "group.all"]}
+    )
+    template_str = "{{ expand('group.all') | map(attribute='entity_id') | join(', ') }}"
+
+    with patch.object(
+        template._ResolvedGroup,  # pylint: disable=protected-access
+        "__init__",
+        autospec=True,
+        side_effect=template._ResolvedGroup.__init__,  # pylint: disable=protected-access
+    ) as mock_resolve:
+        info = render_to_info(hass, template_str)
+        assert_result_info(
+            info,
+            "light.one, light.two",
+            {"group.all", "group.upstairs", "light.one", "light.two"},
+        )
+        assert mock_resolve.call_count == 1
+
+        hass.states.async_set(
+            "group.upstairs", "off", {"entity_id": ["light.two", "light.one"]}
+        )
+        info = render_to_info(hass, template_str)
+        assert info.result() == "light.one, light.two"
+        assert mock_resolve.call_count == 1
+
+        hass.states.async_set(
+            "group.upstairs", "on", {"entity_id": ["light.three", "light.two"]}
+        )
+        info = render_to_info(hass, template_str)
+        assert_result_info(
+            info,
+            "light.one, light.three, light.two",
+            {"group.all", "group.upstairs", "light.one", "light.two", "light.three"},
+        )
+        assert mock_resolve.call_count == 2
+
+
 async def test_device_entities(hass):
     """Test expand function."""
     config_entry = MockConfigEntry(domain="light")
@@ -2315,8 +2363,8 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_cache_keeps_compiled_code():
+    """Test the compiled code is kept after the templates are gone."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
@@ -2324,26 +2372,16 @@ async def test_cache_garbage_collection():
         (template_string),
     )
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-
-    tpl2 = template.Template(
-        (template_string),
-    )
-    tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    key = (template_string, True, False, False)
+    assert template._COMPILE_CACHE.get(key)  # pylint: disable=protected-access
 
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template._COMPILE_CACHE.get(key)  # pylint: disable=protected-access
+
+    with patch.object(template, "_COMPILE_CACHE", LRU(1)):
+        template.Template("{{ 1 }}").ensure_valid()
+        template.Template("{{ 2 }}").ensure_valid()
+        assert list(template._COMPILE_CACHE) == [("{{ 2 }}", True, False, False)]
 
 
 def test_is_template_string():
@@ -2708,3 +2746,37 @@ async def test_undefined_variable(hass, caplog):
         "Template variable warning: 'no_such_variable' is undefined when rendering '{{ no_such_variable }}'"
         in caplog.text
     )
+
+
+async def test_compiled_code_is_shared(hass):
+    """Test templates with the same source share the compiled code."""
+    source = "{{ value | multiply(2) }}"
+
+    with patch.object(
+        ImmutableSandboxedEnvironment,
+        "compile",
+        autospec=True,
+        side_effect=ImmutableSandboxedEnvironment.compile,
+    ) as mock_compile:
+        info = template.compile_cache_info()
+        assert template.Template(source, hass).async_render({"value": 21}) == 42
+        assert template.Template(source, hass).async_render({"value": 21}) == 42
+        assert mock_compile.call_count == 1
+
+        assert (
+            template.Template(source, hass).async_render({"value": 21}, limited=True)
+            == 42
+        )
+        assert mock_compile.call_count == 1
+
+        template.Template(source).ensure_valid()
+        assert mock_compile.call_count == 2
+
+    new_info = template.compile_cache_info()
+    assert new_info["hits"] == info["hits"] + 2
+    assert new_info["misses"] == info["misses"] + 2
+
+    with pytest.raises(TemplateError):
+        template.Template("{{ invalid_syntax", hass).ensure_valid()
+    with pytest.raises(TemplateError):
+        template.Template("{{ invalid_syntax", hass).ensure_valid()
@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
@@ -676,3 +676,44 @@ async def test_empty_integrations_list_is_only_sent_at_the_end_of_bootstrap(hass
 
     assert "normal_integration" in hass.config.components
     assert order == ["an_after_dep", "normal_integration"]
+
+
+async def test_preimport_integrations(hass):
+    """Test integrations and their platforms are imported in setup order."""
+    mock_integration(hass, MockModule("light"))
+    mock_integration(hass, MockModule("root"))
+    mock_integration(hass, MockModule("first_dep", dependencies=["root"]))
+    mock_integration(hass, MockModule("second_dep", dependencies=["first_dep"]))
+    mock_integration(hass, MockModule("stage_2"))
+    mock_integration(hass, MockModule("broken"))
+    mock_integration(hass, MockModule("hue"))
+
+    integrations = {}
+    for domain in ("light", "root", "first_dep", "second_dep", "stage_2", "broken"):
+        integration = await loader.async_get_integration(hass, domain)
+        await integration.resolve_dependencies()
+        integrations[domain] = integration
+
+    imported = []
+
+    def mock_get_component(integration):
+        if integration.domain == "broken":
+            raise ImportError("No module named 'broken'")
+        imported.append(integration.domain)
+
+    def mock_get_platform(integration, platform_name):
+        imported.append(f"{integration.domain}.{platform_name}")
+
+    with patch.object(
+        loader.Integration, "get_component", mock_get_component
+    ), patch.object(loader.Integration, "get_platform", mock_get_platform):
+        await bootstrap._async_preimport_integrations(
+            hass,
+            {"light": [{"platform": "hue"}, {"platform": "missing"}, {}]},
+            integrations,
+            [{"second_dep", "first_dep", "root"}, {"stage_2", "broken", "light"}],
+        )
+
+    assert imported[:3] == ["root", "first_dep", "second_dep"]
+    assert sorted(imported[3:5]) == ["light", "stage_2"]
+    assert imported[5:] == ["hue.light"]
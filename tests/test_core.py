@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -38,6 +39,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -76,7 +78,7 @@ def test_async_add_hass_job_schedule_partial_callback():
 
 def test_async_add_hass_job_schedule_coroutinefunction(loop):
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=loop))
+    hass = MagicMock(loop=MagicMock(wraps=loop), _job_monitor=None)
 
     async def job():
         pass
@@ -89,7 +91,7 @@ def test_async_add_hass_job_schedule_coroutinefunction(loop):
 
 def test_async_add_hass_job_schedule_partial_coroutinefunction(loop):
     """Test that we schedule partial coros and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=loop))
+    hass = MagicMock(loop=MagicMock(wraps=loop), _job_monitor=None)
 
     async def job():
         pass
@@ -130,7 +132,7 @@ def test_async_create_task_schedule_coroutine(loop):
 
 def test_async_run_hass_job_calls_callback():
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(_job_monitor=None)
     calls = []
 
     def job():
@@ -383,6 +385,26 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_dict_json():
+    """Test a State as JSON."""
+    state = ha.State("happy.happy", "on", {"pig": "dog"})
+    assert json.loads(state.as_dict_json()) == json.loads(
+        json.dumps(state.as_dict(), cls=JSONEncoder)
+    )
+    # 2nd time to verify cache
+    assert state.as_dict_json() is state.as_dict_json()
+
+
+def test_event_as_dict_json():
+    """Test an Event as JSON."""
+    event = ha.Event("some_type", {"some": "attr"})
+    assert json.loads(event.as_dict_json()) == json.loads(
+        json.dumps(event.as_dict(), cls=JSONEncoder)
+    )
+    # 2nd time to verify cache
+    assert event.as_dict_json() is event.as_dict_json()
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -402,6 +424,126 @@ async def test_eventbus_add_remove_listener(hass):
     unsub()
 
 
+async def test_eventbus_time_changed_not_sent_to_match_all(hass):
+    """Test the time changed event only goes to its own listeners."""
+    match_all_events = async_capture_events(hass, MATCH_ALL)
+    time_changed_events = async_capture_events(hass, EVENT_TIME_CHANGED)
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [event.event_type for event in match_all_events] == ["test"]
+    assert len(time_changed_events) == 1
+
+
+async def test_eventbus_on_first_listener(hass):
+    """Test an action is called when an event type gets its first listener."""
+    calls = []
+    remove_action = hass.bus.async_on_first_listener("test", lambda: calls.append(None))
+    assert not hass.bus.async_has_listeners("test")
+
+    unsub = hass.bus.async_listen("test", lambda _: None)
+    assert hass.bus.async_has_listeners("test")
+    assert len(calls) == 1
+
+    unsub2 = hass.bus.async_listen("test", lambda _: None)
+    assert len(calls) == 1
+
+    unsub()
+    unsub2()
+    assert not hass.bus.async_has_listeners("test")
+
+    unsub = hass.bus.async_listen("test", lambda _: None)
+    assert len(calls) == 2
+    unsub()
+
+    remove_action()
+    unsub = hass.bus.async_listen("test", lambda _: None)
+    assert len(calls) == 2
+    unsub()
+
+
+async def test_eventbus_keyed_listener(hass):
+    """Test listening for events of specific entity ids and domains."""
+    entity_calls = []
+    domain_calls = []
+
+    @ha.callback
+    def entity_listener(event):
+        """Mock entity listener."""
+        entity_calls.append(event)
+
+    @ha.callback
+    def domain_listener(event):
+        """Mock domain listener."""
+        domain_calls.append(event)
+
+    unsub_entity = hass.bus.async_listen_keyed(
+        "test", ["light.kitchen", "switch.tv"], entity_listener
+    )
+    unsub_domain = hass.bus.async_listen_keyed("test", ["light"], domain_listener)
+    assert hass.bus.async_listeners()["test"] == 1
+    assert hass.bus.async_keyed_listeners("test") == {
+        "light.kitchen": 1,
+        "switch.tv": 1,
+        "light": 1,
+    }
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test", {"entity_id": "switch.tv"})
+    hass.bus.async_fire("test", {"entity_id": "switch.radio"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in entity_calls] == [
+        "light.kitchen",
+        "switch.tv",
+    ]
+    assert [event.data["entity_id"] for event in domain_calls] == [
+        "light.kitchen",
+        "light.bedroom",
+    ]
+
+    unsub_entity()
+    assert hass.bus.async_keyed_listeners("test") == {"light": 1}
+    unsub_domain()
+    assert hass.bus.async_keyed_listeners("test") == {}
+    assert not hass.bus.async_has_listeners("test")
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(entity_calls) == 2
+    assert len(domain_calls) == 2
+
+
+async def test_eventbus_keyed_listener_no_keys(hass):
+    """Test listening without keys does not add a listener."""
+    unsub = hass.bus.async_listen_keyed("test", [], lambda _: None)
+    assert not hass.bus.async_has_listeners("test")
+    unsub()
+
+
+async def test_eventbus_keyed_listener_on_first_listener(hass):
+    """Test a keyed listener calls the action for the first listener."""
+    calls = []
+    hass.bus.async_on_first_listener("test", lambda: calls.append(None))
+
+    unsub = hass.bus.async_listen_keyed("test", ["light.kitchen"], lambda _: None)
+    assert hass.bus.async_has_listeners("test")
+    assert len(calls) == 1
+
+    unsub2 = hass.bus.async_listen("test", lambda _: None)
+    assert len(calls) == 1
+
+    unsub()
+    unsub2()
+    assert not hass.bus.async_has_listeners("test")
+
+
 async def test_eventbus_filtered_listener(hass):
     """Test we can prefilter events."""
     calls = []
@@ -665,6 +807,33 @@ async def test_statemachine_entity_ids(hass):
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_domain_filter(hass):
+    """Test filtering on domains after adding, updating and removing states."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.ac", "off")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("light.bowl", "off")
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.frog"]
+    assert hass.states.async_entity_ids(["switch", "light", "switch"]) == [
+        "switch.ac",
+        "light.bowl",
+        "light.frog",
+    ]
+    assert hass.states.async_entity_ids_count({"light", "switch"}) == 3
+    assert hass.states.async_all("light")[0].state == "off"
+    assert hass.states.async_all("vacuum") == []
+
+    hass.states.async_remove("switch.ac")
+    assert hass.states.async_entity_ids("switch") == []
+    assert hass.states.async_entity_ids_count(["switch"]) == 0
+
+    hass.states.async_remove("light.bowl")
+    assert [state.entity_id for state in hass.states.async_all(["light"])] == [
+        "light.frog"
+    ]
+
+
 async def test_statemachine_remove(hass):
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -1065,8 +1234,8 @@ def test_create_timer(mock_monotonic, loop):
     ):
         ha._async_create_timer(hass)
 
-    assert len(funcs) == 2
-    fire_time_event, stop_timer = funcs
+    assert len(funcs) == 3
+    fire_time_event, _, stop_timer = funcs
 
     assert len(hass.loop.call_later.mock_calls) == 1
     delay, callback, target = hass.loop.call_later.mock_calls[0][1]
@@ -1140,8 +1309,8 @@ def test_timer_out_of_sync(mock_monotonic, loop):
 
         assert event_context_0 == event_context_1
 
-        assert len(funcs) == 2
-        fire_time_event, _ = funcs
+        assert len(funcs) == 3
+        fire_time_event, _, _ = funcs
 
     assert len(hass.loop.call_later.mock_calls) == 2
 
@@ -1151,6 +1320,68 @@ def test_timer_out_of_sync(mock_monotonic, loop):
     assert abs(target - 14.2) < 0.001
 
 
+@patch("homeassistant.core.monotonic")
+def test_timer_idle_without_time_changed_listeners(mock_monotonic, loop):
+    """Test the timer only ticks every second when there are listeners."""
+    hass = MagicMock()
+    hass.bus.async_has_listeners.return_value = False
+
+    mock_monotonic.side_effect = 10.2, 65.0, 65.1, 65.2
+
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 5, 333333),
+    ):
+        ha._async_create_timer(hass)
+
+    delay, callback, target = hass.loop.call_later.mock_calls[0][1]
+    assert abs(delay - 54.666667) < 0.001
+    assert abs(target - 64.866667) < 0.001
+
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 5, 0, 100000),
+    ):
+        callback(target)
+
+    # Nothing to fire the time changed event for
+    assert len(hass.bus.async_fire.mock_calls) == 0
+    delay, callback, target = hass.loop.call_later.mock_calls[1][1]
+    assert abs(delay - 59.9) < 0.001
+
+    event_type, resume_ticks = hass.bus.async_on_first_listener.mock_calls[0][1]
+    assert event_type == EVENT_TIME_CHANGED
+
+    hass.bus.async_has_listeners.return_value = True
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 5, 1, 600000),
+    ):
+        resume_ticks()
+
+    assert len(hass.loop.call_later.return_value.cancel.mock_calls) == 1
+    delay, callback, target = hass.loop.call_later.mock_calls[-1][1]
+    assert abs(delay - 0.4) < 0.001
+    assert abs(target - 65.6) < 0.001
+
+
+async def test_timer_resumes_ticks_for_time_changed_listeners(hass):
+    """Test the timer of a running instance ticks for a new listener."""
+    with patch.object(hass.loop, "call_later") as mock_call_later:
+        ha._async_create_timer(hass)
+        assert mock_call_later.call_args[0][0] > 1
+
+        unsub = hass.bus.async_listen(EVENT_TIME_CHANGED, lambda _: None)
+        assert mock_call_later.call_count == 2
+        assert mock_call_later.call_args[0][0] <= 1
+
+        unsub()
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+        hass.bus.async_listen(EVENT_TIME_CHANGED, lambda _: None)
+        assert mock_call_later.call_count == 2
+
+
 async def test_hass_start_starts_the_timer(loop):
     """Test when hass starts, it starts the timer."""
     hass = ha.HomeAssistant()
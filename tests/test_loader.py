@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import json
+import pathlib
 from unittest.mock import patch
 
 import pytest
@@ -6,8 +9,15 @@ import pytest
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
+import homeassistant.util.dt as dt_util
 
-from tests.common import MockModule, async_mock_service, mock_integration
+from tests.common import (
+    MockModule,
+    async_fire_time_changed,
+    async_mock_service,
+    mock_integration,
+)
 
 
 async def test_component_dependencies(hass):
@@ -160,6 +170,17 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_records_import_time(hass):
+    """Test the time to import the modules of an integration is recorded."""
+    integration = await loader.async_get_integration(hass, "hue")
+    with patch("homeassistant.loader.timer", side_effect=[1.0, 3.5, 4.0, 4.25]):
+        integration.get_component()
+        integration.get_platform("light")
+        integration.get_component()
+
+    assert hass.data[loader.DATA_IMPORT_TIME] == {"hue": 2.5, "hue.light": 0.25}
+
+
 async def test_get_integration_legacy(hass, enable_custom_integrations):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -543,3 +564,88 @@ async def test_custom_integration_missing(hass, caplog):
 
         with pytest.raises(loader.IntegrationNotFound):
             await loader.async_get_integration(hass, "test1")
+
+
+async def test_manifest_cache(hass, hass_storage, tmp_path):
+    """Test manifests are cached until their file changes."""
+    manifest = {"domain": "test", "name": "Test"}
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest))
+
+    cache = loader.ManifestCache(hass)
+    await cache.async_load()
+    assert await hass.async_add_executor_job(cache.get, manifest_path) == manifest
+    assert await hass.async_add_executor_job(cache.get, tmp_path) is None
+    assert (
+        await hass.async_add_executor_job(cache.get, tmp_path / "missing.json") is None
+    )
+
+    cache.async_schedule_save()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    stored = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert stored["ha_version"] == __version__
+    assert stored["manifests"][str(manifest_path)]["manifest"] == manifest
+
+    cache = loader.ManifestCache(hass)
+    await cache.async_load()
+    with patch.object(pathlib.Path, "read_text") as mock_read_text:
+        assert await hass.async_add_executor_job(cache.get, manifest_path) == manifest
+    assert not mock_read_text.called
+
+    manifest["name"] = "Changed name"
+    manifest_path.write_text(json.dumps(manifest))
+    assert await hass.async_add_executor_job(cache.get, manifest_path) == manifest
+
+
+async def test_manifest_cache_other_version(hass, hass_storage, tmp_path):
+    """Test manifests cached by another version are not used."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps({"domain": "test", "name": "Test"}))
+    file_stat = manifest_path.stat()
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": "0.1.0",
+            "manifests": {
+                str(manifest_path): {
+                    "mtime": file_stat.st_mtime_ns,
+                    "size": file_stat.st_size,
+                    "manifest": {"domain": "test", "name": "Old name"},
+                }
+            },
+        },
+    }
+
+    cache = loader.ManifestCache(hass)
+    await cache.async_load()
+    manifest = await hass.async_add_executor_job(cache.get, manifest_path)
+    assert manifest["name"] == "Test"
+
+
+async def test_get_integration_uses_manifest_cache(hass, hass_storage):
+    """Test resolving an integration uses the cached manifest."""
+    manifest_path = pathlib.Path(hue.__file__).parent / "manifest.json"
+    file_stat = manifest_path.stat()
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": __version__,
+            "manifests": {
+                str(manifest_path): {
+                    "mtime": file_stat.st_mtime_ns,
+                    "size": file_stat.st_size,
+                    "manifest": {"domain": "hue", "name": "Cached Hue"},
+                }
+            },
+        },
+    }
+
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Cached Hue"
+    assert integration.is_built_in
@@ -0,0 +1,49 @@
+"""Test the least recently used mapping."""
+import pytest
+
+from homeassistant.util.lru import LRU
+
+
+def test_lru_evicts_least_recently_used():
+    """Test the least recently used key is evicted when full."""
+    cache = LRU(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert list(cache) == ["a", "c"]
+    assert len(cache) == 2
+
+
+def test_lru_hits_and_misses():
+    """Test hits and misses are counted."""
+    cache = LRU(10)
+    cache["a"] = 1
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("b", 5) == 5
+    with pytest.raises(KeyError):
+        cache["c"]  # pylint: disable=pointless-statement
+
+    assert cache.hits == 1
+    assert cache.misses == 3
+
+    assert list(cache.items()) == [("a", 1)]
+    assert cache.hits == 1
+
+
+def test_lru_delete_and_clear():
+    """Test removing keys."""
+    cache = LRU(10)
+    cache["a"] = 1
+    cache["b"] = 2
+    del cache["a"]
+    assert list(cache) == ["b"]
+    cache.pop("b")
+    assert not cache
+    cache["c"] = 3
+    cache.clear()
+    assert len(cache) == 0